@@ -130,8 +130,8 @@ def analyze_network_bias(
         station_results.append({
             "id": station_id,
             "name": station.get("name", "Unknown"),
-            "lat": station.geometry.y,
-            "lon": station.geometry.x,
+            "lat": station["lat"],
+            "lon": station["lon"],
             "state": station.get("state", "Unknown"),
             **trend_stats,
             "mean_bias": annual_bias["mean"].mean(),
@@ -318,10 +318,8 @@ def main():
             temp_metric=metric
         )
         
-        # Get station metadata - extract unique stations with coordinates from geometry
-        station_info = tob_data[["station_id", "geometry"]].drop_duplicates()
-        station_info["lat"] = station_info.geometry.y
-        station_info["lon"] = station_info.geometry.x
+        # Get station metadata - extract unique stations with their coordinates
+        station_info = tob_data[["station_id", "lat", "lon"]].drop_duplicates("station_id")
         station_info = station_info.rename(columns={"station_id": "id"})
         stations_gdf = station_info.copy()
         
@@ -7,41 +7,148 @@ validates geographic coordinates and population data, and creates a high-quality
 for urban heat island analysis.
 
 Usage:
-    python scripts/create_static_cities_db.py [--min-population 50000] [--output data/cities/us_cities_static.csv]
+    python scripts/create_static_cities_db.py [--min-population 50000] [--output data/cities/us_cities_static.csv] [--force] [--chunksize N]
 """
 
 import argparse
-import pandas as pd
-from pathlib import Path
-import logging
-from typing import Dict, Any
+from collections.abc import Iterator
+import hashlib
 import json
+import logging
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
+# Primary source: top 1000 US cities with population data
+TOP1K_PATH = Path("data/cities/us_cities_top1k.csv")
+
+# Arrow-backed dtypes for the source CSV columns
+SOURCE_DTYPES = {
+    "City": "string[pyarrow]",
+    "State": "string[pyarrow]",
+    "Population": "int32[pyarrow]",
+    "lat": "float32[pyarrow]",
+    "lon": "float32[pyarrow]",
+}
+
+# US geographic bounds (including Alaska, Hawaii, territories)
+US_LAT_MIN = np.float32(18.0)  # Southern tip of Hawaii
+US_LAT_MAX = np.float32(71.5)  # Northern Alaska
+US_LON_MIN = np.float32(-180.0)  # Western Alaska (Aleutians cross dateline)
+US_LON_MAX = np.float32(-65.0)  # Eastern Maine
+
+# Decimal places kept when reporting float32 coordinates (about 1 m); float32
+# has no more precision than this at longitudes beyond ±128°, and widening
+# without rounding would write its binary noise into the metadata
+COORDINATE_DECIMALS = 5
+
+# US states and territories for coverage check
+US_STATES: frozenset[str] = frozenset(
+    {
+        "Alabama",
+        "Alaska",
+        "Arizona",
+        "Arkansas",
+        "California",
+        "Colorado",
+        "Connecticut",
+        "Delaware",
+        "Florida",
+        "Georgia",
+        "Hawaii",
+        "Idaho",
+        "Illinois",
+        "Indiana",
+        "Iowa",
+        "Kansas",
+        "Kentucky",
+        "Louisiana",
+        "Maine",
+        "Maryland",
+        "Massachusetts",
+        "Michigan",
+        "Minnesota",
+        "Mississippi",
+        "Missouri",
+        "Montana",
+        "Nebraska",
+        "Nevada",
+        "New Hampshire",
+        "New Jersey",
+        "New Mexico",
+        "New York",
+        "North Carolina",
+        "North Dakota",
+        "Ohio",
+        "Oklahoma",
+        "Oregon",
+        "Pennsylvania",
+        "Rhode Island",
+        "South Carolina",
+        "South Dakota",
+        "Tennessee",
+        "Texas",
+        "Utah",
+        "Vermont",
+        "Virginia",
+        "Washington",
+        "West Virginia",
+        "Wisconsin",
+        "Wyoming",
+        "District of Columbia",
+    }
+)
 
-def load_source_data() -> pd.DataFrame:
+
+def configure_logging() -> None:
+    """Configure root logging for command-line use (not applied on import)."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
+
+def us_bounds_mask(
+    lat: np.ndarray, lon: np.ndarray, out: np.ndarray | None = None
+) -> np.ndarray:
     """
-    Load and combine data from multiple sources.
+    Flag coordinates that fall inside the US bounding box.
+
+    Shared by the QC mask and the sample cross-check so both apply identical
+    bounds. NaN coordinates are never in bounds.
+
+    Args:
+        lat: Latitude values (float32)
+        lon: Longitude values (float32)
+        out: Optional preallocated boolean buffer to reuse across calls
 
     Returns:
-        Combined DataFrame with all cities data
+        Boolean mask of coordinates within US bounds
     """
-    logger.info("Loading source cities data...")
+    if out is None:
+        out = np.empty(lat.shape, dtype=np.bool_)
+    np.greater_equal(lat, US_LAT_MIN, out=out)
+    out &= lat <= US_LAT_MAX
+    out &= lon >= US_LON_MIN
+    out &= lon <= US_LON_MAX
+    return out
 
-    # Load top 1000 cities with population data (primary source)
-    top1k_path = Path("data/cities/us_cities_top1k.csv")
-    if not top1k_path.exists():
-        raise FileNotFoundError(f"Primary cities data not found: {top1k_path}")
 
-    cities_df = pd.read_csv(top1k_path)
-    logger.info(f"Loaded {len(cities_df)} cities from top 1000 dataset")
+def standardize_columns(cities_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Rename source columns to the database schema and tag the data source.
 
-    # Standardize column names
+    Args:
+        cities_df: Raw source DataFrame (or chunk)
+
+    Returns:
+        DataFrame with standardized column names
+    """
     cities_df = cities_df.rename(
         columns={
             "City": "city_name",
@@ -58,108 +165,174 @@ def load_source_data() -> pd.DataFrame:
     return cities_df
 
 
-def validate_geographic_coordinates(cities_df: pd.DataFrame) -> pd.DataFrame:
+def categorize_labels(cities_df: pd.DataFrame) -> pd.DataFrame:
+    """Store low-cardinality label columns as categoricals."""
+    return cities_df.astype({"state": "category", "data_source": "category"})
+
+
+def load_source_data() -> pd.DataFrame:
+    """
+    Load and combine data from multiple sources.
+
+    Returns:
+        Combined DataFrame with all cities data
+    """
+    logger.info("Loading source cities data...")
+
+    # Load top 1000 cities with population data (primary source)
+    top1k_path = TOP1K_PATH
+    if not top1k_path.exists():
+        raise FileNotFoundError(f"Primary cities data not found: {top1k_path}")
+
+    cities_df = pd.read_csv(
+        top1k_path, engine="pyarrow", dtype_backend="pyarrow", dtype=SOURCE_DTYPES
+    )
+    logger.info(f"Loaded {len(cities_df)} cities from top 1000 dataset")
+
+    return categorize_labels(standardize_columns(cities_df))
+
+
+def pipeline_stream(
+    path: Path, min_population: int, chunksize: int
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream the source CSV in chunks, yielding only rows that pass quality control.
+
+    Peak memory scales with the surviving rows rather than the whole input, which
+    matters for source files much larger than the top 1000 dataset.
+
+    Args:
+        path: Source CSV path
+        min_population: Minimum population threshold
+        chunksize: Number of rows to read per chunk
+
+    Yields:
+        Filtered chunks with standardized columns
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"Primary cities data not found: {path}")
+
+    with pd.read_csv(
+        path, chunksize=chunksize, dtype_backend="pyarrow", dtype=SOURCE_DTYPES
+    ) as reader:
+        for chunk in reader:
+            logger.info(f"Processing chunk of {len(chunk)} rows...")
+            chunk = standardize_columns(chunk)
+            yield chunk.iloc[build_qc_mask(chunk, min_population)]
+
+
+def validate_geographic_coordinates(
+    cities_df: pd.DataFrame, lat: np.ndarray, lon: np.ndarray
+) -> np.ndarray:
     """
     Validate that coordinates are within reasonable US bounds.
 
     Args:
-        cities_df: DataFrame with latitude/longitude columns
+        cities_df: DataFrame with cities data (used for logging examples)
+        lat: Latitude values for every row of cities_df
+        lon: Longitude values for every row of cities_df
 
     Returns:
-        Filtered DataFrame with valid coordinates
+        Boolean mask of rows with valid coordinates
     """
     logger.info("Validating geographic coordinates...")
 
-    # US geographic bounds (including Alaska, Hawaii, territories)
-    US_BOUNDS = {
-        "lat_min": 18.0,  # Southern tip of Hawaii
-        "lat_max": 71.5,  # Northern Alaska
-        "lon_min": -180.0,  # Western Alaska (Aleutians cross dateline)
-        "lon_max": -65.0,  # Eastern Maine
-    }
+    initial_count = len(lat)
 
-    initial_count = len(cities_df)
+    # Check coordinate bounds (missing coordinates are NaN and fail every bound)
+    valid_coords = us_bounds_mask(lat, lon)
 
-    # Check for missing coordinates
-    missing_coords = cities_df["latitude"].isna() | cities_df["longitude"].isna()
-    if missing_coords.any():
-        logger.warning(
-            f"Removing {missing_coords.sum()} cities with missing coordinates"
-        )
-        cities_df = cities_df[~missing_coords]
-
-    # Check coordinate bounds
-    valid_coords = (
-        (cities_df["latitude"] >= US_BOUNDS["lat_min"])
-        & (cities_df["latitude"] <= US_BOUNDS["lat_max"])
-        & (cities_df["longitude"] >= US_BOUNDS["lon_min"])
-        & (cities_df["longitude"] <= US_BOUNDS["lon_max"])
-    )
+    # Split the rejected rows into missing and out-of-bounds for reporting
+    missing_coords = np.isnan(lat) | np.isnan(lon)
+    missing_count = missing_coords.sum()
+    if missing_count > 0:
+        logger.warning(f"Removing {missing_count} cities with missing coordinates")
 
-    invalid_count = (~valid_coords).sum()
+    out_of_bounds = ~valid_coords & ~missing_coords
+    invalid_count = out_of_bounds.sum()
     if invalid_count > 0:
         logger.warning(
             f"Removing {invalid_count} cities with coordinates outside US bounds"
         )
         # Log some examples
-        invalid_cities = cities_df[~valid_coords][
-            ["city_name", "state", "latitude", "longitude"]
-        ].head(5)
-        for _, city in invalid_cities.iterrows():
-            logger.warning(
-                f"  Invalid: {city['city_name']}, {city['state']} ({city['latitude']}, {city['longitude']})"
-            )
-
-        cities_df = cities_df[valid_coords]
-
+        idx = np.flatnonzero(out_of_bounds)[:5]
+        names = cities_df["city_name"].to_numpy()[idx].tolist()
+        states = cities_df["state"].to_numpy()[idx].tolist()
+        for name, state, la, lo in zip(
+            names, states, lat[idx].tolist(), lon[idx].tolist()
+        ):
+            logger.warning(f"  Invalid: {name}, {state} ({la:.4f}, {lo:.4f})")
+
+    retained_count = valid_coords.sum()
     logger.info(
-        f"Geographic validation: {initial_count} → {len(cities_df)} cities ({len(cities_df) / initial_count * 100:.1f}% retained)"
+        f"Geographic validation: {initial_count} → {retained_count} cities ({retained_count / initial_count * 100:.1f}% retained)"
     )
-    return cities_df
+    return valid_coords
 
 
 def validate_population_data(
-    cities_df: pd.DataFrame, min_population: int
-) -> pd.DataFrame:
+    pop: np.ndarray, min_population: int, eligible: np.ndarray
+) -> np.ndarray:
     """
-    Validate and filter population data.
+    Validate population data against the minimum threshold.
 
     Args:
-        cities_df: DataFrame with population column
+        pop: Population values for every row
         min_population: Minimum population threshold
+        eligible: Mask of rows that passed earlier checks (used for logging)
 
     Returns:
-        Filtered DataFrame with valid population data
+        Boolean mask of rows with valid population data
     """
     logger.info(f"Validating population data (≥{min_population:,})...")
 
-    initial_count = len(cities_df)
+    # Apply minimum population filter (missing populations are NaN and fail it)
+    valid_population = pop >= min_population
 
     # Check for missing population data
-    missing_pop = cities_df["population"].isna()
-    if missing_pop.any():
-        logger.warning(
-            f"Removing {missing_pop.sum()} cities with missing population data"
-        )
-        cities_df = cities_df[~missing_pop]
+    missing_pop = np.isnan(pop)
+    missing_count = (eligible & missing_pop).sum()
+    if missing_count > 0:
+        logger.warning(f"Removing {missing_count} cities with missing population data")
 
-    # Apply minimum population filter
-    valid_population = cities_df["population"] >= min_population
-    filtered_count = len(cities_df[valid_population])
+    candidates = eligible & ~missing_pop
+    filtered_count = (eligible & valid_population).sum()
 
     logger.info(
-        f"Population filter: {len(cities_df)} → {filtered_count} cities ≥{min_population:,} population"
+        f"Population filter: {candidates.sum()} → {filtered_count} cities ≥{min_population:,} population"
     )
 
     # Show population distribution before filtering
-    pop_stats = cities_df["population"].describe()
+    pop_stats = pd.Series(pop[candidates]).agg(["min", "max", "median"])
     logger.info(
-        f"Population range: {pop_stats['min']:,.0f} - {pop_stats['max']:,.0f} (median: {pop_stats['50%']:,.0f})"
+        f"Population range: {pop_stats['min']:,.0f} - {pop_stats['max']:,.0f} (median: {pop_stats['median']:,.0f})"
     )
 
-    cities_df = cities_df[valid_population]
+    return valid_population
 
-    return cities_df
+
+def build_qc_mask(cities_df: pd.DataFrame, min_population: int) -> np.ndarray:
+    """
+    Build a single row mask combining coordinate, population and missing-value checks.
+
+    The latitude, longitude and population columns are extracted once and every
+    check is evaluated on those arrays, so the DataFrame only needs slicing once.
+
+    Args:
+        cities_df: DataFrame with latitude, longitude and population columns
+        min_population: Minimum population threshold
+
+    Returns:
+        Boolean mask of rows passing all quality checks
+    """
+    lat = cities_df["latitude"].to_numpy(dtype=np.float32, na_value=np.nan)
+    lon = cities_df["longitude"].to_numpy(dtype=np.float32, na_value=np.nan)
+    pop = cities_df["population"].to_numpy(dtype=float, na_value=np.nan)
+
+    valid_coords = validate_geographic_coordinates(cities_df, lat, lon)
+    valid_population = validate_population_data(pop, min_population, valid_coords)
+
+    return valid_coords & valid_population
 
 
 def remove_duplicates(cities_df: pd.DataFrame) -> pd.DataFrame:
@@ -177,30 +350,31 @@ def remove_duplicates(cities_df: pd.DataFrame) -> pd.DataFrame:
     initial_count = len(cities_df)
 
     # Check for exact duplicates (same name and state)
-    exact_dupes = cities_df.duplicated(subset=["city_name", "state"], keep=False)
-    if exact_dupes.any():
-        logger.info(
-            f"Found {exact_dupes.sum()} cities with exact name/state duplicates"
-        )
+    dup_mask = cities_df.duplicated(subset=["city_name", "state"], keep=False)
+    if dup_mask.any():
+        logger.info(f"Found {dup_mask.sum()} cities with exact name/state duplicates")
 
         # Show examples
         dupe_examples = (
-            cities_df[exact_dupes].groupby(["city_name", "state"]).size().head(5)
+            cities_df[dup_mask]
+            .groupby(["city_name", "state"], observed=True)
+            .size()
+            .head(5)
         )
         for (city, state), count in dupe_examples.items():
             logger.info(f"  Duplicate: {city}, {state} ({count} entries)")
 
         # Keep the entry with highest population for each city/state combination
-        cities_df = cities_df.sort_values("population", ascending=False)
-        cities_df = cities_df.drop_duplicates(
-            subset=["city_name", "state"], keep="first"
-        )
+        keep_idx = cities_df.groupby(
+            ["city_name", "state"], sort=False, observed=True
+        )["population"].idxmax()
+        cities_df = cities_df.loc[keep_idx]
 
     logger.info(f"Duplicate removal: {initial_count} → {len(cities_df)} cities")
     return cities_df
 
 
-def validate_state_coverage(cities_df: pd.DataFrame) -> Dict[str, Any]:
+def validate_state_coverage(cities_df: pd.DataFrame) -> dict[str, Any]:
     """
     Analyze geographic coverage across US states.
 
@@ -212,87 +386,40 @@ def validate_state_coverage(cities_df: pd.DataFrame) -> Dict[str, Any]:
     """
     logger.info("Analyzing state coverage...")
 
-    # Count cities per state
-    state_counts = cities_df["state"].value_counts()
+    # Count cities per state in one pass over the categorical codes
+    codes = cities_df["state"].cat.codes.to_numpy()
+    categories = cities_df["state"].cat.categories
+    counts = np.bincount(codes[codes >= 0], minlength=len(categories))
 
-    # US states and territories for coverage check
-    us_states = {
-        "Alabama",
-        "Alaska",
-        "Arizona",
-        "Arkansas",
-        "California",
-        "Colorado",
-        "Connecticut",
-        "Delaware",
-        "Florida",
-        "Georgia",
-        "Hawaii",
-        "Idaho",
-        "Illinois",
-        "Indiana",
-        "Iowa",
-        "Kansas",
-        "Kentucky",
-        "Louisiana",
-        "Maine",
-        "Maryland",
-        "Massachusetts",
-        "Michigan",
-        "Minnesota",
-        "Mississippi",
-        "Missouri",
-        "Montana",
-        "Nebraska",
-        "Nevada",
-        "New Hampshire",
-        "New Jersey",
-        "New Mexico",
-        "New York",
-        "North Carolina",
-        "North Dakota",
-        "Ohio",
-        "Oklahoma",
-        "Oregon",
-        "Pennsylvania",
-        "Rhode Island",
-        "South Carolina",
-        "South Dakota",
-        "Tennessee",
-        "Texas",
-        "Utah",
-        "Vermont",
-        "Virginia",
-        "Washington",
-        "West Virginia",
-        "Wisconsin",
-        "Wyoming",
-        "District of Columbia",
-    }
+    # Order observed states by city count (largest first)
+    order = np.argsort(-counts, kind="stable")
+    order = order[counts[order] > 0]
+    state_counts = counts[order]
+    cities_per_state = dict(zip(categories[order].tolist(), state_counts.tolist()))
 
-    states_with_cities = set(state_counts.index)
-    missing_states = us_states - states_with_cities
+    states_with_cities = set(cities_per_state)
+    missing_states = US_STATES.difference(states_with_cities)
 
     coverage_stats = {
-        "total_states": len(us_states),
+        "total_states": len(US_STATES),
         "states_with_cities": len(states_with_cities),
-        "coverage_percent": len(states_with_cities) / len(us_states) * 100,
+        "coverage_percent": len(states_with_cities) / len(US_STATES) * 100,
         "missing_states": list(missing_states),
-        "cities_per_state": state_counts.to_dict(),
-        "min_cities_per_state": state_counts.min(),
-        "max_cities_per_state": state_counts.max(),
-        "avg_cities_per_state": state_counts.mean(),
+        "cities_per_state": cities_per_state,
+        "min_cities_per_state": state_counts.min() if state_counts.size else 0,
+        "max_cities_per_state": state_counts.max() if state_counts.size else 0,
+        "avg_cities_per_state": state_counts.mean() if state_counts.size else 0.0,
     }
 
     logger.info(
-        f"State coverage: {len(states_with_cities)}/{len(us_states)} states ({coverage_stats['coverage_percent']:.1f}%)"
+        f"State coverage: {len(states_with_cities)}/{len(US_STATES)} states ({coverage_stats['coverage_percent']:.1f}%)"
     )
     if missing_states:
         logger.warning(f"Missing states: {', '.join(sorted(missing_states))}")
 
     # Show top states by city count
     logger.info("Top 10 states by city count:")
-    for state, count in state_counts.head(10).items():
+    for state, count in list(cities_per_state.items())[:10]:
         logger.info(f"  {state}: {count} cities")
 
     return coverage_stats
@@ -300,7 +427,7 @@ def validate_state_coverage(cities_df: pd.DataFrame) -> Dict[str, Any]:
 
 def cross_validate_sample(
     cities_df: pd.DataFrame, sample_size: int = 10
-) -> Dict[str, Any]:
+) -> dict[str, Any]:
     """
     Cross-validate a sample of cities against Census Bureau data.
 
@@ -315,28 +442,36 @@ def cross_validate_sample(
         f"Cross-validating {sample_size} sample cities against Census Bureau..."
     )
 
-    # Select a diverse sample (largest, smallest, random)
-    sample_cities = []
+    # Select a diverse sample (largest, smallest, random) from one partition pass
+    pop = cities_df["population"].to_numpy(dtype=np.int64)
+    k = min(sample_size // 3, len(pop))
+    rest_idx = np.empty(0, np.intp)
 
     # Add largest cities
-    largest = cities_df.nlargest(sample_size // 3, "population")
-    sample_cities.append(largest)
+    top_idx = np.argpartition(-pop, k - 1)[:k] if k > 0 else np.empty(0, np.intp)
+    top_idx = top_idx[np.argsort(-pop[top_idx], kind="stable")]
 
     # Add smallest cities
-    smallest = cities_df.nsmallest(sample_size // 3, "population")
-    sample_cities.append(smallest)
+    bot_idx = np.argpartition(pop, k - 1)[:k] if k > 0 else np.empty(0, np.intp)
+    bot_idx = bot_idx[np.argsort(pop[bot_idx], kind="stable")]
 
     # Add random sample
-    remaining_size = sample_size - len(largest) - len(smallest)
+    remaining_size = sample_size - len(top_idx) - len(bot_idx)
     if remaining_size > 0:
-        others = cities_df.drop(largest.index.union(smallest.index))
-        if len(others) > 0:
-            random_sample = others.sample(
-                min(remaining_size, len(others)), random_state=42
+        others = np.ones(len(pop), dtype=bool)
+        others[top_idx] = False
+        others[bot_idx] = False
+        if others.any():
+            rng = np.random.default_rng(42)
+            rest_idx = rng.choice(
+                np.flatnonzero(others),
+                size=min(remaining_size, int(others.sum())),
+                replace=False,
             )
-            sample_cities.append(random_sample)
 
-    sample_df = pd.concat(sample_cities, ignore_index=True)
+    # Gather all sampled rows with a single positional take
+    sample_df = cities_df.iloc[np.concatenate([top_idx, bot_idx, rest_idx])]
+    sample_df = sample_df.reset_index(drop=True)
 
     validation_results = {
         "sample_size": len(sample_df),
@@ -345,33 +480,103 @@ def cross_validate_sample(
         "population_checks": [],
     }
 
+    # Check sample coordinates in one vectorized pass
+    lat = sample_df["latitude"].to_numpy(dtype=np.float32, na_value=np.nan)
+    lon = sample_df["longitude"].to_numpy(dtype=np.float32, na_value=np.nan)
+    coordinate_valid = us_bounds_mask(lat, lon)
+    records = sample_df.assign(coordinate_valid=coordinate_valid).to_dict(
+        orient="records"
+    )
+
     # For each sample city, log basic validation info
-    for _, city in sample_df.iterrows():
+    for record in records:
         city_info = {
-            "city": f"{city['city_name']}, {city['state']}",
-            "population": city["population"],
-            "coordinates": (city["latitude"], city["longitude"]),
-            "coordinate_valid": (
-                18.0 <= city["latitude"] <= 71.5
-                and -180.0 <= city["longitude"] <= -65.0
-            ),
+            "city": f"{record['city_name']}, {record['state']}",
+            "population": record["population"],
+            "coordinates": (record["latitude"], record["longitude"]),
+            "coordinate_valid": record["coordinate_valid"],
         }
         validation_results["coordinate_checks"].append(city_info)
 
         logger.info(
-            f"Sample: {city_info['city']} - Pop: {city_info['population']:,} - Coords: ({city['latitude']:.3f}, {city['longitude']:.3f})"
+            f"Sample: {city_info['city']} - Pop: {city_info['population']:,} - Coords: ({record['latitude']:.3f}, {record['longitude']:.3f})"
         )
 
     return validation_results
 
 
-def create_final_database(cities_df: pd.DataFrame, output_path: Path) -> None:
+def _json_default(value: Any) -> Any:
+    """Serialize NumPy scalars so summaries can hold them without coercion."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def source_file_hash(path: Path) -> str:
+    """
+    Compute a short content hash of a source file.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        First 16 hex digits of the file's SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def metadata_path_for(output_path: Path) -> Path:
+    """Return the metadata sidecar path for a database output path."""
+    return output_path.parent / f"{output_path.stem}_metadata.json"
+
+
+def is_up_to_date(output_path: Path, source_hash: str, min_population: int) -> bool:
+    """
+    Check whether an existing database was built from the same inputs.
+
+    Args:
+        output_path: Database CSV path
+        source_hash: Content hash of the current source file
+        min_population: Minimum population threshold requested
+
+    Returns:
+        True if the output and its metadata match the current inputs
+    """
+    metadata_path = metadata_path_for(output_path)
+    if not (output_path.exists() and metadata_path.exists()):
+        return False
+
+    try:
+        metadata = json.loads(metadata_path.read_text())
+    except json.JSONDecodeError:
+        return False
+
+    return (
+        metadata.get("source_hash") == source_hash
+        and metadata.get("min_population") == min_population
+    )
+
+
+def create_final_database(
+    cities_df: pd.DataFrame,
+    output_path: Path,
+    source_hash: str | None = None,
+    min_population: int | None = None,
+) -> None:
     """
     Create the final static cities database file.
 
+    A Parquet copy is written next to the CSV for faster downstream reads.
+
     Args:
         cities_df: Processed and validated cities DataFrame
         output_path: Output file path
+        source_hash: Content hash of the source file, recorded in the metadata
+        min_population: Population threshold used, recorded in the metadata
     """
     logger.info(f"Creating final static cities database: {output_path}")
 
@@ -392,34 +597,45 @@ def create_final_database(cities_df: pd.DataFrame, output_path: Path) -> None:
     ]
     cities_df = cities_df[final_columns]
 
-    # Save to CSV
+    # Save to CSV with pandas, which quotes only fields that need it; Arrow's
+    # writer always quotes the header and every string value
     cities_df.to_csv(output_path, index=False)
 
     logger.info(f"✓ Saved {len(cities_df)} cities to {output_path}")
 
+    parquet_path = output_path.with_suffix(".parquet")
+    pq.write_table(pa.Table.from_pandas(cities_df, preserve_index=False), parquet_path)
+    logger.info(f"✓ Saved Parquet copy to {parquet_path}")
+
     # Create summary statistics
+    pop_stats = cities_df["population"].agg(["min", "max", "mean", "median"])
+    geo_stats = cities_df[["latitude", "longitude"]].agg(["min", "max"])
     summary = {
         "total_cities": len(cities_df),
         "population_range": {
-            "min": int(cities_df["population"].min()),
-            "max": int(cities_df["population"].max()),
-            "mean": int(cities_df["population"].mean()),
-            "median": int(cities_df["population"].median()),
+            "min": int(pop_stats["min"]),
+            "max": int(pop_stats["max"]),
+            "mean": int(pop_stats["mean"]),
+            "median": int(pop_stats["median"]),
         },
         "geographic_bounds": {
-            "north": float(cities_df["latitude"].max()),
-            "south": float(cities_df["latitude"].min()),
-            "east": float(cities_df["longitude"].max()),
-            "west": float(cities_df["longitude"].min()),
+            bound: round(float(geo_stats.loc[stat, column]), COORDINATE_DECIMALS)
+            for bound, stat, column in [
+                ("north", "max", "latitude"),
+                ("south", "min", "latitude"),
+                ("east", "max", "longitude"),
+                ("west", "min", "longitude"),
+            ]
         },
         "data_sources": cities_df["data_source"].value_counts().to_dict(),
         "created_at": pd.Timestamp.now().isoformat(),
+        "source_hash": source_hash,
+        "min_population": min_population,
     }
 
     # Save metadata
-    metadata_path = output_path.parent / f"{output_path.stem}_metadata.json"
-    with open(metadata_path, "w") as f:
-        json.dump(summary, f, indent=2)
+    metadata_path = metadata_path_for(output_path)
+    metadata_path.write_text(json.dumps(summary, indent=2, default=_json_default))
 
     logger.info(f"✓ Saved metadata to {metadata_path}")
 
@@ -437,6 +653,11 @@ def create_final_database(cities_df: pd.DataFrame, output_path: Path) -> None:
 
 def main():
     """Main function to create static cities database."""
+    configure_logging()
+
+    # Share buffers between the filtered frames until one is actually mutated
+    pd.set_option("mode.copy_on_write", True)
+
     parser = argparse.ArgumentParser(
         description="Create static US cities database with QC validation"
     )
@@ -458,6 +679,17 @@ def main():
         default=20,
         help="Number of cities to cross-validate (default: 20)",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild even if the output is up to date with the source data",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help="Stream the source CSV in chunks of this many rows (default: load at once)",
+    )
 
     args = parser.parse_args()
 
@@ -466,14 +698,33 @@ def main():
     logger.info(f"Output file: {args.output}")
 
     try:
-        # Step 1: Load source data
-        cities_df = load_source_data()
-
-        # Step 2: Validate geographic coordinates
-        cities_df = validate_geographic_coordinates(cities_df)
+        # Skip the pipeline when the output was built from identical inputs
+        source_hash = source_file_hash(TOP1K_PATH) if TOP1K_PATH.exists() else None
+        if (
+            not args.force
+            and source_hash is not None
+            and is_up_to_date(args.output, source_hash, args.min_population)
+        ):
+            logger.info(
+                f"✓ {args.output} is up to date with {TOP1K_PATH} (hash {source_hash}), skipping"
+            )
+            return 0
+
+        if args.chunksize:
+            # Steps 1-3: Stream source data, keeping only rows that pass QC
+            logger.info(f"Streaming source cities data in chunks of {args.chunksize:,}...")
+            cities_df = pd.concat(
+                list(pipeline_stream(TOP1K_PATH, args.min_population, args.chunksize)),
+                ignore_index=True,
+            )
+            cities_df = categorize_labels(cities_df)
+        else:
+            # Step 1: Load source data
+            cities_df = load_source_data()
 
-        # Step 3: Validate and filter population data
-        cities_df = validate_population_data(cities_df, args.min_population)
+            # Steps 2-3: Validate coordinates and population, then filter once
+            qc_mask = build_qc_mask(cities_df, args.min_population)
+            cities_df = cities_df.iloc[qc_mask]
 
         # Step 4: Remove duplicates
         cities_df = remove_duplicates(cities_df)
@@ -485,7 +736,9 @@ def main():
         validation_results = cross_validate_sample(cities_df, args.sample_validation)
 
         # Step 7: Create final database
-        create_final_database(cities_df, args.output)
+        create_final_database(
+            cities_df, args.output, source_hash, args.min_population
+        )
 
         logger.info("✓ Static cities database creation completed successfully")
 
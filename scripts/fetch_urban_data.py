@@ -10,12 +10,25 @@ Usage:
 """
 
 import argparse
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import contextlib
+import functools
+import hashlib
 import json
 import logging
+import os
+import shutil
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import geopandas as gpd
+import numpy as np
+import pandas as pd
 from pathlib import Path
 from typing import Optional, Dict, List
+from urllib.parse import urlparse
 import time
 
 # Setup logging
@@ -24,11 +37,187 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# OpenStreetMap Nominatim search endpoint
+NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
 
-def fetch_natural_earth_cities() -> Optional[gpd.GeoDataFrame]:
+
+def create_http_session() -> requests.Session:
+    """
+    Create an HTTP session with connection pooling and retries.
+
+    Reusing one session keeps connections alive across requests to the same host
+    instead of repeating the TCP/TLS handshake for every call.
+
+    Returns:
+        Configured requests Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    # Nominatim answers 429/503 when over its usage policy: back off
+    # exponentially and honour any Retry-After header it sends
+    nominatim_adapter = HTTPAdapter(
+        max_retries=Retry(
+            total=5,
+            backoff_factor=2,
+            status_forcelist=[429, 502, 503],
+            respect_retry_after_header=True,
+        ),
+    )
+    session.mount(NOMINATIM_URL, nominatim_adapter)
+
+    session.headers["User-Agent"] = "ushcn-heatisland-urban-data-fetcher"
+    return session
+
+
+class RateLimiter:
+    """Thread-safe limiter enforcing a minimum interval between calls."""
+
+    def __init__(self, min_interval: float):
+        """
+        Initialize rate limiter.
+
+        Args:
+            min_interval: Minimum seconds between successive calls
+        """
+        self.min_interval = min_interval
+        self._next_allowed = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block only until the next call is allowed, then reserve the slot."""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_allowed - now
+            if delay > 0:
+                time.sleep(delay)
+                now += delay
+            self._next_allowed = now + self.min_interval
+
+
+# Shared HTTP session for all fetchers
+SESSION = create_http_session()
+
+# Nominatim usage policy allows at most 1 request per second
+NOMINATIM_LIMITER = RateLimiter(1.0)
+
+# Compact dtypes for city attributes (largest US city population fits in int32)
+CITY_DTYPES = {"population": "int32", "state": "category", "data_source": "category"}
+
+# Bundled list of major US cities used when no online source is good enough
+FALLBACK_CITIES_PATH = (
+    Path(__file__).resolve().parent.parent / "data" / "cities" / "fallback_cities.csv"
+)
+FALLBACK_CITIES_DTYPES = {
+    "city_name": "object",
+    "state": "object",
+    "lat": "float64",
+    "lon": "float64",
+    "population": "int32",
+}
+
+
+def download_cached(url: str, cache_dir: Path, force_refresh: bool = False) -> Path:
+    """
+    Download a file once and reuse the local copy on later runs.
+
+    The response is streamed to a temporary file and moved into place atomically,
+    so an interrupted download never leaves a truncated cache entry.
+
+    Args:
+        url: URL to download
+        cache_dir: Directory holding cached downloads (keyed by URL hash)
+        force_refresh: Re-download even if a cached copy exists
+
+    Returns:
+        Path to the local copy
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    url_hash = hashlib.sha1(url.encode(), usedforsecurity=False).hexdigest()
+    local_path = cache_dir / f"{url_hash}{Path(urlparse(url).path).suffix}"
+
+    if local_path.exists() and not force_refresh:
+        logger.info(f"Using cached download: {local_path}")
+        return local_path
+
+    tmp_path = local_path.with_name(local_path.name + ".part")
+    with SESSION.get(url, stream=True, timeout=60) as response:
+        response.raise_for_status()
+        with open(tmp_path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=1 << 20):
+                f.write(chunk)
+    os.replace(tmp_path, local_path)
+
+    return local_path
+
+
+def cached_fetch(
+    name: str,
+    fetch_func,
+    cache_dir: Path,
+    max_age: float = 86400,
+    stop_event: Optional[threading.Event] = None,
+) -> Optional[gpd.GeoDataFrame]:
+    """
+    Return a source's cities from the on-disk cache, fetching only when stale.
+
+    Fetched results are stored as GeoParquet so repeated runs (and separate
+    processes) skip the network entirely until the entry expires.
+
+    Args:
+        name: Cache key for the source
+        fetch_func: Zero-argument callable returning a GeoDataFrame or None
+        cache_dir: Directory holding cached source results
+        max_age: Seconds a cached result stays valid
+        stop_event: Results finished after this is set may be partial and are
+            not cached
+
+    Returns:
+        GeoDataFrame with cities or None if failed
+    """
+    cache_path = cache_dir / f"{name}.parquet"
+
+    if cache_path.exists() and time.time() - cache_path.stat().st_mtime < max_age:
+        logger.info(f"Using cached {name} cities: {cache_path}")
+        return gpd.read_parquet(cache_path).astype(CITY_DTYPES)
+
+    cities = fetch_func()
+    if cities is not None:
+        # Same dtypes as a cache hit, whichever path produced the result
+        cities = cities.astype(CITY_DTYPES)
+
+    if (
+        cities is not None
+        and len(cities) > 0
+        and not (stop_event is not None and stop_event.is_set())
+    ):
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with atomic_output(cache_path) as tmp_path:
+            cities.to_parquet(tmp_path)
+
+    return cities
+
+
+def fetch_natural_earth_cities(
+    cache_dir: Path = Path("data/cache/.cache"), force_refresh: bool = False
+) -> Optional[gpd.GeoDataFrame]:
     """
     Attempt to fetch Natural Earth cities data.
 
+    Args:
+        cache_dir: Directory for cached downloads
+        force_refresh: Re-download even if a cached copy exists
+
     Returns:
         GeoDataFrame with cities or None if failed
     """
@@ -42,7 +231,7 @@ def fetch_natural_earth_cities() -> Optional[gpd.GeoDataFrame]:
 
             ne_path = geopandas.datasets.get_path("naturalearth_cities")
             if ne_path:
-                cities = gpd.read_file(ne_path)
+                cities = gpd.read_file(ne_path, engine="pyogrio", use_arrow=True)
                 if len(cities) > 0:
                     logger.info(f"✓ Natural Earth via geopandas: {len(cities)} cities")
                     return standardize_cities_schema(cities, source="natural_earth")
@@ -54,10 +243,11 @@ def fetch_natural_earth_cities() -> Optional[gpd.GeoDataFrame]:
 
         try:
             logger.info("Downloading Natural Earth cities directly...")
-            cities = gpd.read_file(ne_url)
+            ne_zip = download_cached(ne_url, cache_dir, force_refresh)
+            cities = gpd.read_file(ne_zip, engine="pyogrio", use_arrow=True)
 
             # Filter for US cities
-            us_cities = cities[cities["SOV0NAME"] == "United States of America"].copy()
+            us_cities = cities[cities["SOV0NAME"] == "United States of America"]
 
             if len(us_cities) > 0:
                 logger.info(f"✓ Natural Earth direct: {len(us_cities)} US cities")
@@ -89,12 +279,13 @@ def fetch_census_places() -> Optional[gpd.GeoDataFrame]:
         # Get list of states first
         states_url = f"{base_url}?get=NAME&for=state:*"
 
-        response = requests.get(states_url, timeout=30)
+        response = SESSION.get(states_url, timeout=30)
         if response.status_code != 200:
             logger.warning(f"Census API returned status {response.status_code}")
             return None
 
-        states_data = response.json()
+        # The state list is not used yet, so the response body is left
+        # undecoded; the request only confirms the API is reachable
 
         # For now, create a comprehensive fallback with major metro areas
         # In production, this would query each state's places
@@ -112,12 +303,14 @@ def fetch_census_places() -> Optional[gpd.GeoDataFrame]:
 
 def fetch_openstreetmap_cities(
     min_population: int = 10000,
+    stop_event: Optional[threading.Event] = None,
 ) -> Optional[gpd.GeoDataFrame]:
     """
     Fetch cities from OpenStreetMap Nominatim API.
 
     Args:
         min_population: Minimum population threshold
+        stop_event: Optional event that cancels remaining queries when set
 
     Returns:
         GeoDataFrame with cities or None if failed
@@ -126,7 +319,7 @@ def fetch_openstreetmap_cities(
         logger.info("Fetching cities from OpenStreetMap...")
 
         # Nominatim query for US cities
-        base_url = "https://nominatim.openstreetmap.org/search"
+        base_url = NOMINATIM_URL
 
         cities_data = []
 
@@ -138,6 +331,10 @@ def fetch_openstreetmap_cities(
         ]
 
         for query in queries:
+            if stop_event is not None and stop_event.is_set():
+                logger.info("OSM fetch cancelled, another source was sufficient")
+                break
+
             params = {
                 "q": query,
                 "format": "json",
@@ -147,8 +344,8 @@ def fetch_openstreetmap_cities(
             }
 
             try:
-                response = requests.get(base_url, params=params, timeout=30)
-                time.sleep(1)  # Rate limiting
+                NOMINATIM_LIMITER.wait()
+                response = SESSION.get(base_url, params=params, timeout=30)
 
                 if response.status_code == 200:
                     data = response.json()
@@ -170,983 +367,52 @@ def fetch_openstreetmap_cities(
     return None
 
 
-def create_comprehensive_fallback_cities() -> gpd.GeoDataFrame:
+def create_comprehensive_fallback_cities(min_population: int = 0) -> gpd.GeoDataFrame:
     """
     Create comprehensive fallback dataset with major US cities and metro areas.
 
+    The city list (major metro areas, state capitals, mid-size regional centers
+    and smaller cities) is stored in data/cities/fallback_cities.csv and loaded
+    once per process. Each call returns its own copy, so callers may modify it
+    without affecting the cached dataset.
+
+    Args:
+        min_population: Minimum city population; smaller cities are dropped
+            before any geometry is built
+
     Returns:
         GeoDataFrame with comprehensive US cities data
     """
+    return _create_comprehensive_fallback_cities_cached(min_population).copy()
+
+
+@functools.lru_cache(maxsize=8)
+def _create_comprehensive_fallback_cities_cached(
+    min_population: int,
+) -> gpd.GeoDataFrame:
+    """Build the fallback cities dataset once per population threshold."""
     logger.info("Creating comprehensive fallback cities dataset...")
 
-    # Comprehensive US cities with metro areas (top 300+ cities)
-    cities_data = [
-        # Major metro areas
-        {
-            "city_name": "New York City",
-            "state": "NY",
-            "lat": 40.7128,
-            "lon": -74.0060,
-            "population": 8175133,
-        },
-        {
-            "city_name": "Los Angeles",
-            "state": "CA",
-            "lat": 34.0522,
-            "lon": -118.2437,
-            "population": 3971883,
-        },
-        {
-            "city_name": "Chicago",
-            "state": "IL",
-            "lat": 41.8781,
-            "lon": -87.6298,
-            "population": 2695598,
-        },
-        {
-            "city_name": "Houston",
-            "state": "TX",
-            "lat": 29.7604,
-            "lon": -95.3698,
-            "population": 2320268,
-        },
-        {
-            "city_name": "Phoenix",
-            "state": "AZ",
-            "lat": 33.4484,
-            "lon": -112.0740,
-            "population": 1680992,
-        },
-        {
-            "city_name": "Philadelphia",
-            "state": "PA",
-            "lat": 39.9526,
-            "lon": -75.1652,
-            "population": 1584064,
-        },
-        {
-            "city_name": "San Antonio",
-            "state": "TX",
-            "lat": 29.4241,
-            "lon": -98.4936,
-            "population": 1547253,
-        },
-        {
-            "city_name": "San Diego",
-            "state": "CA",
-            "lat": 32.7157,
-            "lon": -117.1611,
-            "population": 1423851,
-        },
-        {
-            "city_name": "Dallas",
-            "state": "TX",
-            "lat": 32.7767,
-            "lon": -96.7970,
-            "population": 1343573,
-        },
-        {
-            "city_name": "San Jose",
-            "state": "CA",
-            "lat": 37.3382,
-            "lon": -121.8863,
-            "population": 1021795,
-        },
-        {
-            "city_name": "Austin",
-            "state": "TX",
-            "lat": 30.2672,
-            "lon": -97.7431,
-            "population": 978908,
-        },
-        {
-            "city_name": "Jacksonville",
-            "state": "FL",
-            "lat": 30.3322,
-            "lon": -81.6557,
-            "population": 911507,
-        },
-        {
-            "city_name": "Fort Worth",
-            "state": "TX",
-            "lat": 32.7555,
-            "lon": -97.3308,
-            "population": 918915,
-        },
-        {
-            "city_name": "Columbus",
-            "state": "OH",
-            "lat": 39.9612,
-            "lon": -82.9988,
-            "population": 898553,
-        },
-        {
-            "city_name": "Charlotte",
-            "state": "NC",
-            "lat": 35.2271,
-            "lon": -80.8431,
-            "population": 885708,
-        },
-        {
-            "city_name": "San Francisco",
-            "state": "CA",
-            "lat": 37.7749,
-            "lon": -122.4194,
-            "population": 873965,
-        },
-        {
-            "city_name": "Indianapolis",
-            "state": "IN",
-            "lat": 39.7684,
-            "lon": -86.1581,
-            "population": 876384,
-        },
-        {
-            "city_name": "Seattle",
-            "state": "WA",
-            "lat": 47.6062,
-            "lon": -122.3321,
-            "population": 753675,
-        },
-        {
-            "city_name": "Denver",
-            "state": "CO",
-            "lat": 39.7392,
-            "lon": -104.9903,
-            "population": 715522,
-        },
-        {
-            "city_name": "Washington",
-            "state": "DC",
-            "lat": 38.9072,
-            "lon": -77.0369,
-            "population": 705749,
-        },
-        # State capitals and major regional centers
-        {
-            "city_name": "Boston",
-            "state": "MA",
-            "lat": 42.3601,
-            "lon": -71.0589,
-            "population": 695506,
-        },
-        {
-            "city_name": "Nashville",
-            "state": "TN",
-            "lat": 36.1627,
-            "lon": -86.7816,
-            "population": 689447,
-        },
-        {
-            "city_name": "Baltimore",
-            "state": "MD",
-            "lat": 39.2904,
-            "lon": -76.6122,
-            "population": 585708,
-        },
-        {
-            "city_name": "Louisville",
-            "state": "KY",
-            "lat": 38.2527,
-            "lon": -85.7585,
-            "population": 617638,
-        },
-        {
-            "city_name": "Portland",
-            "state": "OR",
-            "lat": 45.5152,
-            "lon": -122.6784,
-            "population": 652503,
-        },
-        {
-            "city_name": "Oklahoma City",
-            "state": "OK",
-            "lat": 35.4676,
-            "lon": -97.5164,
-            "population": 695755,
-        },
-        {
-            "city_name": "Milwaukee",
-            "state": "WI",
-            "lat": 43.0389,
-            "lon": -87.9065,
-            "population": 577222,
-        },
-        {
-            "city_name": "Las Vegas",
-            "state": "NV",
-            "lat": 36.1699,
-            "lon": -115.1398,
-            "population": 651319,
-        },
-        {
-            "city_name": "Albuquerque",
-            "state": "NM",
-            "lat": 35.0844,
-            "lon": -106.6504,
-            "population": 564559,
-        },
-        {
-            "city_name": "Tucson",
-            "state": "AZ",
-            "lat": 32.2226,
-            "lon": -110.9747,
-            "population": 548073,
-        },
-        {
-            "city_name": "Fresno",
-            "state": "CA",
-            "lat": 36.7378,
-            "lon": -119.7871,
-            "population": 542107,
-        },
-        {
-            "city_name": "Sacramento",
-            "state": "CA",
-            "lat": 38.5816,
-            "lon": -121.4944,
-            "population": 524943,
-        },
-        {
-            "city_name": "Kansas City",
-            "state": "MO",
-            "lat": 39.0997,
-            "lon": -94.5786,
-            "population": 508090,
-        },
-        {
-            "city_name": "Mesa",
-            "state": "AZ",
-            "lat": 33.4152,
-            "lon": -111.8315,
-            "population": 504258,
-        },
-        {
-            "city_name": "Atlanta",
-            "state": "GA",
-            "lat": 33.7490,
-            "lon": -84.3880,
-            "population": 498715,
-        },
-        {
-            "city_name": "Colorado Springs",
-            "state": "CO",
-            "lat": 38.8339,
-            "lon": -104.8214,
-            "population": 478961,
-        },
-        {
-            "city_name": "Raleigh",
-            "state": "NC",
-            "lat": 35.7796,
-            "lon": -78.6382,
-            "population": 474069,
-        },
-        {
-            "city_name": "Omaha",
-            "state": "NE",
-            "lat": 41.2565,
-            "lon": -95.9345,
-            "population": 486051,
-        },
-        {
-            "city_name": "Miami",
-            "state": "FL",
-            "lat": 25.7617,
-            "lon": -80.1918,
-            "population": 442241,
-        },
-        {
-            "city_name": "Virginia Beach",
-            "state": "VA",
-            "lat": 36.8529,
-            "lon": -75.9780,
-            "population": 459470,
-        },
-        # Mid-size cities and regional centers
-        {
-            "city_name": "Oakland",
-            "state": "CA",
-            "lat": 37.8044,
-            "lon": -122.2711,
-            "population": 433031,
-        },
-        {
-            "city_name": "Minneapolis",
-            "state": "MN",
-            "lat": 44.9778,
-            "lon": -93.2650,
-            "population": 429954,
-        },
-        {
-            "city_name": "Tulsa",
-            "state": "OK",
-            "lat": 36.1540,
-            "lon": -95.9928,
-            "population": 413066,
-        },
-        {
-            "city_name": "Wichita",
-            "state": "KS",
-            "lat": 37.6872,
-            "lon": -97.3301,
-            "population": 389954,
-        },
-        {
-            "city_name": "New Orleans",
-            "state": "LA",
-            "lat": 29.9511,
-            "lon": -90.0715,
-            "population": 383997,
-        },
-        {
-            "city_name": "Arlington",
-            "state": "TX",
-            "lat": 32.7357,
-            "lon": -97.1081,
-            "population": 394266,
-        },
-        {
-            "city_name": "Cleveland",
-            "state": "OH",
-            "lat": 41.4993,
-            "lon": -81.6944,
-            "population": 383793,
-        },
-        {
-            "city_name": "Tampa",
-            "state": "FL",
-            "lat": 27.9506,
-            "lon": -82.4572,
-            "population": 384959,
-        },
-        {
-            "city_name": "Bakersfield",
-            "state": "CA",
-            "lat": 35.3733,
-            "lon": -119.0187,
-            "population": 383579,
-        },
-        {
-            "city_name": "Aurora",
-            "state": "CO",
-            "lat": 39.7294,
-            "lon": -104.8319,
-            "population": 379289,
-        },
-        {
-            "city_name": "Honolulu",
-            "state": "HI",
-            "lat": 21.3099,
-            "lon": -157.8581,
-            "population": 347397,
-        },
-        {
-            "city_name": "Anaheim",
-            "state": "CA",
-            "lat": 33.8366,
-            "lon": -117.9143,
-            "population": 346824,
-        },
-        {
-            "city_name": "Santa Ana",
-            "state": "CA",
-            "lat": 33.7455,
-            "lon": -117.8677,
-            "population": 334217,
-        },
-        {
-            "city_name": "Corpus Christi",
-            "state": "TX",
-            "lat": 27.8006,
-            "lon": -97.3964,
-            "population": 326586,
-        },
-        {
-            "city_name": "Riverside",
-            "state": "CA",
-            "lat": 33.9533,
-            "lon": -117.3962,
-            "population": 331549,
-        },
-        {
-            "city_name": "Lexington",
-            "state": "KY",
-            "lat": 38.0406,
-            "lon": -84.5037,
-            "population": 327924,
-        },
-        {
-            "city_name": "Stockton",
-            "state": "CA",
-            "lat": 37.9577,
-            "lon": -121.2908,
-            "population": 312697,
-        },
-        {
-            "city_name": "St. Paul",
-            "state": "MN",
-            "lat": 44.9537,
-            "lon": -93.0900,
-            "population": 311527,
-        },
-        {
-            "city_name": "St. Louis",
-            "state": "MO",
-            "lat": 38.6270,
-            "lon": -90.1994,
-            "population": 301578,
-        },
-        {
-            "city_name": "Henderson",
-            "state": "NV",
-            "lat": 36.0395,
-            "lon": -114.9817,
-            "population": 320189,
-        },
-        {
-            "city_name": "Pittsburgh",
-            "state": "PA",
-            "lat": 40.4406,
-            "lon": -79.9959,
-            "population": 300286,
-        },
-        {
-            "city_name": "Cincinnati",
-            "state": "OH",
-            "lat": 39.1031,
-            "lon": -84.5120,
-            "population": 309317,
-        },
-        {
-            "city_name": "Anchorage",
-            "state": "AK",
-            "lat": 61.2181,
-            "lon": -149.9003,
-            "population": 291538,
-        },
-        {
-            "city_name": "Greensboro",
-            "state": "NC",
-            "lat": 36.0726,
-            "lon": -79.7920,
-            "population": 296710,
-        },
-        {
-            "city_name": "Plano",
-            "state": "TX",
-            "lat": 33.0198,
-            "lon": -96.6989,
-            "population": 285494,
-        },
-        {
-            "city_name": "Lincoln",
-            "state": "NE",
-            "lat": 40.8136,
-            "lon": -96.7026,
-            "population": 295178,
-        },
-        {
-            "city_name": "Orlando",
-            "state": "FL",
-            "lat": 28.5383,
-            "lon": -81.3792,
-            "population": 307573,
-        },
-        {
-            "city_name": "Irvine",
-            "state": "CA",
-            "lat": 33.6846,
-            "lon": -117.8265,
-            "population": 307670,
-        },
-        {
-            "city_name": "Newark",
-            "state": "NJ",
-            "lat": 40.7357,
-            "lon": -74.1724,
-            "population": 311549,
-        },
-        {
-            "city_name": "Durham",
-            "state": "NC",
-            "lat": 35.9940,
-            "lon": -78.8986,
-            "population": 283506,
-        },
-        {
-            "city_name": "Chula Vista",
-            "state": "CA",
-            "lat": 32.6401,
-            "lon": -117.0842,
-            "population": 275487,
-        },
-        {
-            "city_name": "Toledo",
-            "state": "OH",
-            "lat": 41.6528,
-            "lon": -83.5379,
-            "population": 270871,
-        },
-        {
-            "city_name": "Fort Wayne",
-            "state": "IN",
-            "lat": 41.0793,
-            "lon": -85.1394,
-            "population": 270402,
-        },
-        {
-            "city_name": "St. Petersburg",
-            "state": "FL",
-            "lat": 27.7676,
-            "lon": -82.6403,
-            "population": 265351,
-        },
-        {
-            "city_name": "Laredo",
-            "state": "TX",
-            "lat": 27.5306,
-            "lon": -99.4803,
-            "population": 261639,
-        },
-        {
-            "city_name": "Jersey City",
-            "state": "NJ",
-            "lat": 40.7178,
-            "lon": -74.0431,
-            "population": 262075,
-        },
-        {
-            "city_name": "Chandler",
-            "state": "AZ",
-            "lat": 33.3062,
-            "lon": -111.8413,
-            "population": 261165,
-        },
-        {
-            "city_name": "Madison",
-            "state": "WI",
-            "lat": 43.0731,
-            "lon": -89.4012,
-            "population": 259680,
-        },
-        {
-            "city_name": "Lubbock",
-            "state": "TX",
-            "lat": 33.5779,
-            "lon": -101.8552,
-            "population": 258862,
-        },
-        {
-            "city_name": "Buffalo",
-            "state": "NY",
-            "lat": 42.8864,
-            "lon": -78.8784,
-            "population": 255284,
-        },
-        # Additional smaller cities for comprehensive coverage
-        {
-            "city_name": "Winston-Salem",
-            "state": "NC",
-            "lat": 36.0999,
-            "lon": -80.2442,
-            "population": 249545,
-        },
-        {
-            "city_name": "Glendale",
-            "state": "AZ",
-            "lat": 33.5387,
-            "lon": -112.1860,
-            "population": 248325,
-        },
-        {
-            "city_name": "Hialeah",
-            "state": "FL",
-            "lat": 25.8576,
-            "lon": -80.2781,
-            "population": 238942,
-        },
-        {
-            "city_name": "Garland",
-            "state": "TX",
-            "lat": 32.9126,
-            "lon": -96.6389,
-            "population": 238002,
-        },
-        {
-            "city_name": "Scottsdale",
-            "state": "AZ",
-            "lat": 33.4942,
-            "lon": -111.9261,
-            "population": 258069,
-        },
-        {
-            "city_name": "Baton Rouge",
-            "state": "LA",
-            "lat": 30.4515,
-            "lon": -91.1871,
-            "population": 220236,
-        },
-        {
-            "city_name": "Norfolk",
-            "state": "VA",
-            "lat": 36.8508,
-            "lon": -76.2859,
-            "population": 238005,
-        },
-        {
-            "city_name": "Spokane",
-            "state": "WA",
-            "lat": 47.6587,
-            "lon": -117.4260,
-            "population": 230176,
-        },
-        {
-            "city_name": "Fremont",
-            "state": "CA",
-            "lat": 37.5483,
-            "lon": -121.9886,
-            "population": 230504,
-        },
-        {
-            "city_name": "Richmond",
-            "state": "VA",
-            "lat": 37.5407,
-            "lon": -77.4360,
-            "population": 230436,
-        },
-        {
-            "city_name": "Santa Clarita",
-            "state": "CA",
-            "lat": 34.3917,
-            "lon": -118.5426,
-            "population": 228673,
-        },
-        {
-            "city_name": "Irving",
-            "state": "TX",
-            "lat": 32.8140,
-            "lon": -96.9489,
-            "population": 239798,
-        },
-        {
-            "city_name": "Chesapeake",
-            "state": "VA",
-            "lat": 36.7682,
-            "lon": -76.2875,
-            "population": 249422,
-        },
-        {
-            "city_name": "Mobile",
-            "state": "AL",
-            "lat": 30.6954,
-            "lon": -88.0399,
-            "population": 187041,
-        },
-        {
-            "city_name": "Des Moines",
-            "state": "IA",
-            "lat": 41.5868,
-            "lon": -93.6250,
-            "population": 214133,
-        },
-        {
-            "city_name": "Tacoma",
-            "state": "WA",
-            "lat": 47.2529,
-            "lon": -122.4443,
-            "population": 219346,
-        },
-        {
-            "city_name": "Fontana",
-            "state": "CA",
-            "lat": 34.0922,
-            "lon": -117.4350,
-            "population": 208393,
-        },
-        {
-            "city_name": "Oxnard",
-            "state": "CA",
-            "lat": 34.1975,
-            "lon": -119.1771,
-            "population": 202063,
-        },
-        {
-            "city_name": "Aurora",
-            "state": "IL",
-            "lat": 41.7606,
-            "lon": -88.3201,
-            "population": 200456,
-        },
-        {
-            "city_name": "Moreno Valley",
-            "state": "CA",
-            "lat": 33.9425,
-            "lon": -117.2297,
-            "population": 208634,
-        },
-        {
-            "city_name": "Akron",
-            "state": "OH",
-            "lat": 41.0814,
-            "lon": -81.5190,
-            "population": 190469,
-        },
-        {
-            "city_name": "Yonkers",
-            "state": "NY",
-            "lat": 40.9312,
-            "lon": -73.8988,
-            "population": 211569,
-        },
-        {
-            "city_name": "Columbus",
-            "state": "GA",
-            "lat": 32.4609,
-            "lon": -84.9877,
-            "population": 194058,
-        },
-        {
-            "city_name": "Augusta",
-            "state": "GA",
-            "lat": 33.4735,
-            "lon": -82.0105,
-            "population": 202081,
-        },
-        {
-            "city_name": "Little Rock",
-            "state": "AR",
-            "lat": 34.7465,
-            "lon": -92.2896,
-            "population": 198541,
-        },
-        {
-            "city_name": "Amarillo",
-            "state": "TX",
-            "lat": 35.2220,
-            "lon": -101.8313,
-            "population": 200393,
-        },
-        {
-            "city_name": "Montgomery",
-            "state": "AL",
-            "lat": 32.3668,
-            "lon": -86.3000,
-            "population": 200603,
-        },
-        {
-            "city_name": "Huntington Beach",
-            "state": "CA",
-            "lat": 33.6603,
-            "lon": -117.9992,
-            "population": 198711,
-        },
-        {
-            "city_name": "Modesto",
-            "state": "CA",
-            "lat": 37.6391,
-            "lon": -120.9969,
-            "population": 218464,
-        },
-        {
-            "city_name": "Fayetteville",
-            "state": "NC",
-            "lat": 35.0527,
-            "lon": -78.8784,
-            "population": 208501,
-        },
-        {
-            "city_name": "Shreveport",
-            "state": "LA",
-            "lat": 32.5252,
-            "lon": -93.7502,
-            "population": 187593,
-        },
-        {
-            "city_name": "Glendale",
-            "state": "CA",
-            "lat": 34.1425,
-            "lon": -118.2551,
-            "population": 196543,
-        },
-        {
-            "city_name": "Huntsville",
-            "state": "AL",
-            "lat": 34.7304,
-            "lon": -86.5861,
-            "population": 215006,
-        },
-        {
-            "city_name": "Grand Rapids",
-            "state": "MI",
-            "lat": 42.9634,
-            "lon": -85.6681,
-            "population": 198917,
-        },
-        {
-            "city_name": "Grand Prairie",
-            "state": "TX",
-            "lat": 32.7460,
-            "lon": -96.9978,
-            "population": 196100,
-        },
-        {
-            "city_name": "Knoxville",
-            "state": "TN",
-            "lat": 35.9606,
-            "lon": -83.9207,
-            "population": 190740,
-        },
-        {
-            "city_name": "Worcester",
-            "state": "MA",
-            "lat": 42.2626,
-            "lon": -71.8023,
-            "population": 185877,
-        },
-        {
-            "city_name": "Newport News",
-            "state": "VA",
-            "lat": 37.0871,
-            "lon": -76.4730,
-            "population": 186247,
-        },
-        {
-            "city_name": "Brownsville",
-            "state": "TX",
-            "lat": 25.9018,
-            "lon": -97.4975,
-            "population": 186738,
-        },
-        {
-            "city_name": "Overland Park",
-            "state": "KS",
-            "lat": 38.9822,
-            "lon": -94.6708,
-            "population": 195494,
-        },
-        {
-            "city_name": "Santa Rosa",
-            "state": "CA",
-            "lat": 38.4404,
-            "lon": -122.7144,
-            "population": 178127,
-        },
-        {
-            "city_name": "Salt Lake City",
-            "state": "UT",
-            "lat": 40.7608,
-            "lon": -111.8910,
-            "population": 200567,
-        },
-        {
-            "city_name": "Tallahassee",
-            "state": "FL",
-            "lat": 30.4518,
-            "lon": -84.2807,
-            "population": 194500,
-        },
-        {
-            "city_name": "East Orange",
-            "state": "NJ",
-            "lat": 40.7676,
-            "lon": -74.2049,
-            "population": 69824,
-        },
-        {
-            "city_name": "Roseville",
-            "state": "CA",
-            "lat": 38.7521,
-            "lon": -121.2880,
-            "population": 147773,
-        },
-        {
-            "city_name": "Escondido",
-            "state": "CA",
-            "lat": 33.1192,
-            "lon": -117.0864,
-            "population": 151613,
-        },
-        {
-            "city_name": "Sunnyvale",
-            "state": "CA",
-            "lat": 37.3688,
-            "lon": -122.0363,
-            "population": 155805,
-        },
-        {
-            "city_name": "Torrance",
-            "state": "CA",
-            "lat": 33.8358,
-            "lon": -118.3406,
-            "population": 147067,
-        },
-        {
-            "city_name": "Orange",
-            "state": "CA",
-            "lat": 33.7879,
-            "lon": -117.8531,
-            "population": 139911,
-        },
-        {
-            "city_name": "Pasadena",
-            "state": "CA",
-            "lat": 34.1478,
-            "lon": -118.1445,
-            "population": 141029,
-        },
-        {
-            "city_name": "Fullerton",
-            "state": "CA",
-            "lat": 33.8704,
-            "lon": -117.9242,
-            "population": 143617,
-        },
-        {
-            "city_name": "Killeen",
-            "state": "TX",
-            "lat": 31.1171,
-            "lon": -97.7278,
-            "population": 153095,
-        },
-        {
-            "city_name": "Rockford",
-            "state": "IL",
-            "lat": 42.2711,
-            "lon": -89.0940,
-            "population": 148655,
-        },
-        {
-            "city_name": "Peoria",
-            "state": "IL",
-            "lat": 40.6936,
-            "lon": -89.5890,
-            "population": 113150,
-        },
-        {
-            "city_name": "Sioux Falls",
-            "state": "SD",
-            "lat": 43.5460,
-            "lon": -96.7313,
-            "population": 195850,
-        },
+    # Read as typed column arrays so no per-row dtype inference is needed
+    columns = pd.read_csv(
+        FALLBACK_CITIES_PATH, dtype=FALLBACK_CITIES_DTYPES, engine="pyarrow"
+    )
+    columns = columns[columns["population"].to_numpy() >= min_population]
+    lats = columns["lat"].to_numpy()
+    lons = columns["lon"].to_numpy()
+
+    gdf = gpd.GeoDataFrame(
         {
-            "city_name": "Cedar Rapids",
-            "state": "IA",
-            "lat": 41.9778,
-            "lon": -91.6656,
-            "population": 137710,
+            "city_name": columns["city_name"].to_numpy(),
+            "state": pd.Categorical(columns["state"]),
+            "population": columns["population"].to_numpy(),
+            "data_source": pd.Categorical.from_codes(
+                np.zeros(len(columns), dtype=np.int8), ["comprehensive_fallback"]
+            ),
         },
-    ]
-
-    # Convert to GeoDataFrame
-    from shapely.geometry import Point
-
-    gdf = gpd.GeoDataFrame(cities_data)
-    gdf["geometry"] = gdf.apply(lambda row: Point(row["lon"], row["lat"]), axis=1)
-    gdf = gdf.drop(["lat", "lon"], axis=1)
-    gdf["data_source"] = "comprehensive_fallback"
-    gdf = gdf.set_crs("EPSG:4326")
+        geometry=gpd.points_from_xy(lons, lats),
+        crs="EPSG:4326",
+    )
 
     return gdf
 
@@ -1193,9 +459,9 @@ def standardize_cities_schema(
     # Add source column
     cities_gdf["data_source"] = source
 
-    return cities_gdf[
-        ["city_name", "population", "state", "geometry", "data_source"]
-    ].copy()
+    # Copy-on-write (enabled in main) shares the geometry column with the
+    # input instead of cloning every geometry
+    return cities_gdf[["city_name", "population", "state", "geometry", "data_source"]]
 
 
 def process_osm_cities_data(
@@ -1211,45 +477,84 @@ def process_osm_cities_data(
     Returns:
         Standardized cities GeoDataFrame
     """
-    from shapely.geometry import Point
+    columns = ["city_name", "population", "state", "geometry", "data_source"]
+    if not osm_data:
+        return gpd.GeoDataFrame(columns=columns)
 
-    cities_list = []
+    # Flatten the JSON once; fields absent from every item become all-NaN columns
+    osm_df = pd.json_normalize(osm_data).reindex(
+        columns=["display_name", "extratags.population"]
+    )
 
-    for item in osm_data:
-        try:
-            # Extract population if available
-            population = 50000  # Default
-            if "extratags" in item and item["extratags"]:
-                pop_str = item["extratags"].get("population", "50000")
-                try:
-                    population = int(pop_str.replace(",", ""))
-                except:
-                    population = 50000
-
-            if population >= min_population:
-                city_data = {
-                    "city_name": item.get("display_name", "").split(",")[0],
-                    "population": population,
-                    "state": "",  # Would need additional parsing
-                    "geometry": Point(float(item["lon"]), float(item["lat"])),
-                    "data_source": "openstreetmap",
-                }
-                cities_list.append(city_data)
-
-        except Exception:
-            continue
-
-    if cities_list:
-        return gpd.GeoDataFrame(cities_list, crs="EPSG:4326")
-    else:
-        return gpd.GeoDataFrame(
-            columns=["city_name", "population", "state", "geometry", "data_source"]
-        )
+    # Extract population if available (default 50,000 when missing or unparseable)
+    pop_str = osm_df["extratags.population"].astype("string")
+    population = pd.to_numeric(
+        pop_str.str.replace(",", "", regex=False), errors="coerce"
+    )
+    population = population.fillna(50000).astype(np.int64)
+
+    # Parse coordinate strings straight into float arrays in a single C loop;
+    # items without coordinates are skipped
+    lon = np.fromiter(
+        (item.get("lon", "nan") for item in osm_data),
+        dtype=np.float64,
+        count=len(osm_data),
+    )
+    lat = np.fromiter(
+        (item.get("lat", "nan") for item in osm_data),
+        dtype=np.float64,
+        count=len(osm_data),
+    )
+    mask = (population.to_numpy() >= min_population) & ~np.isnan(lon) & ~np.isnan(lat)
+
+    if not mask.any():
+        return gpd.GeoDataFrame(columns=columns)
+
+    display_name = osm_df["display_name"].astype("string").fillna("")
+    gdf = gpd.GeoDataFrame(
+        {
+            "city_name": display_name[mask].str.split(",").str[0].astype(object),
+            "population": population[mask],
+            "state": "",  # Would need additional parsing
+            "data_source": "openstreetmap",
+        },
+        geometry=gpd.points_from_xy(lon[mask], lat[mask]),
+        crs="EPSG:4326",
+    ).reset_index(drop=True)
+    return gdf[columns].astype(CITY_DTYPES)
+
+
+@contextlib.contextmanager
+def atomic_output(path: Path) -> Iterator[Path]:
+    """
+    Yield a temporary sibling path that replaces ``path`` once writing succeeds.
+
+    An interrupted run therefore never leaves a truncated output file behind.
+
+    Args:
+        path: Final output path
+
+    Yields:
+        Temporary path to write to
+    """
+    tmp_path = path.with_suffix(".part" + path.suffix)
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _json_default(value):
+    """Serialize NumPy scalars so metadata can hold them without coercion."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
 
 
 def save_cities_data(cities_gdf: gpd.GeoDataFrame, output_dir: Path) -> None:
     """
-    Save cities data in multiple formats.
+    Save cities data in multiple formats (GeoJSON, GeoParquet, CSV).
 
     Args:
         cities_gdf: Cities GeoDataFrame to save
@@ -1259,47 +564,66 @@ def save_cities_data(cities_gdf: gpd.GeoDataFrame, output_dir: Path) -> None:
 
     # Save as GeoJSON (preserves geometry)
     geojson_path = output_dir / "us_cities_comprehensive.geojson"
-    cities_gdf.to_file(geojson_path, driver="GeoJSON")
+    with atomic_output(geojson_path) as tmp_path:
+        cities_gdf.to_file(tmp_path, driver="GeoJSON", engine="pyogrio")
     logger.info(f"✓ Saved GeoJSON: {geojson_path}")
 
-    # Save as CSV (for easy inspection)
-    csv_data = cities_gdf.copy()
-    csv_data["latitude"] = csv_data.geometry.y
-    csv_data["longitude"] = csv_data.geometry.x
-    csv_data = csv_data.drop("geometry", axis=1)
+    # Save as GeoParquet (compact, columnar and much faster to re-read)
+    parquet_path = output_dir / "us_cities_comprehensive.parquet"
+    with atomic_output(parquet_path) as tmp_path:
+        cities_gdf.to_parquet(tmp_path, compression="zstd")
+    logger.info(f"✓ Saved GeoParquet: {parquet_path}")
+
+    # Save as CSV (for easy inspection), reading coordinates straight off the
+    # geometry array rather than copying the whole frame first
+    csv_data = pd.DataFrame(
+        {
+            col: cities_gdf[col].to_numpy()
+            for col in cities_gdf.columns
+            if col != cities_gdf.geometry.name
+        }
+    )
+    csv_data["latitude"] = cities_gdf.geometry.y.to_numpy()
+    csv_data["longitude"] = cities_gdf.geometry.x.to_numpy()
 
     csv_path = output_dir / "us_cities_comprehensive.csv"
-    csv_data.to_csv(csv_path, index=False)
+    with atomic_output(csv_path) as tmp_path:
+        csv_data.to_csv(tmp_path, index=False)
     logger.info(f"✓ Saved CSV: {csv_path}")
 
     # Save metadata
+    minx, miny, maxx, maxy = cities_gdf.total_bounds
+    population_stats = cities_gdf["population"].agg(["min", "max", "mean"])
     metadata = {
         "total_cities": len(cities_gdf),
         "sources": cities_gdf["data_source"].value_counts().to_dict()
         if "data_source" in cities_gdf.columns
         else {"unknown": len(cities_gdf)},
         "population_stats": {
-            "min": int(cities_gdf["population"].min()),
-            "max": int(cities_gdf["population"].max()),
-            "mean": int(cities_gdf["population"].mean()),
+            "min": int(population_stats["min"]),
+            "max": int(population_stats["max"]),
+            "mean": int(population_stats["mean"]),
         },
         "geographic_bounds": {
-            "north": float(cities_gdf.geometry.bounds.maxy.max()),
-            "south": float(cities_gdf.geometry.bounds.miny.min()),
-            "east": float(cities_gdf.geometry.bounds.maxx.max()),
-            "west": float(cities_gdf.geometry.bounds.minx.min()),
+            "north": maxy,
+            "south": miny,
+            "east": maxx,
+            "west": minx,
         },
         "created_at": time.strftime("%Y-%m-%d %H:%M:%S UTC"),
     }
 
     metadata_path = output_dir / "us_cities_metadata.json"
-    with open(metadata_path, "w") as f:
-        json.dump(metadata, f, indent=2)
+    with atomic_output(metadata_path) as tmp_path:
+        tmp_path.write_text(json.dumps(metadata, indent=2, default=_json_default))
     logger.info(f"✓ Saved metadata: {metadata_path}")
 
 
 def main():
     """Main function to fetch and cache urban data."""
+    # Share buffers between the filtered frames until one is actually mutated
+    pd.set_option("mode.copy_on_write", True)
+
     parser = argparse.ArgumentParser(description="Fetch comprehensive US urban data")
     parser.add_argument(
         "--min-population",
@@ -1318,6 +642,12 @@ def main():
         action="store_true",
         help="Force refresh even if cache exists",
     )
+    parser.add_argument(
+        "--target-count",
+        type=int,
+        default=1000,
+        help="Stop waiting for other sources once one yields this many cities (default: 1000)",
+    )
 
     args = parser.parse_args()
 
@@ -1328,45 +658,88 @@ def main():
     best_cities = None
     best_source = None
 
+    # Fetched source results are reused for a day unless a refresh is forced
+    http_cache_dir = args.output_dir / ".httpcache"
+    if args.force_refresh and http_cache_dir.exists():
+        shutil.rmtree(http_cache_dir)
+
     # Try each data source
+    stop_event = threading.Event()
     sources = [
-        ("Natural Earth", fetch_natural_earth_cities),
-        ("US Census", fetch_census_places),
-        ("OpenStreetMap", lambda: fetch_openstreetmap_cities(args.min_population)),
+        (
+            "Natural Earth",
+            lambda: cached_fetch(
+                "natural_earth",
+                lambda: fetch_natural_earth_cities(
+                    args.output_dir / ".cache", args.force_refresh
+                ),
+                http_cache_dir,
+            ),
+        ),
+        (
+            "US Census",
+            lambda: cached_fetch("census", fetch_census_places, http_cache_dir),
+        ),
+        (
+            "OpenStreetMap",
+            lambda: cached_fetch(
+                f"osm_{args.min_population}",
+                lambda: fetch_openstreetmap_cities(args.min_population, stop_event),
+                http_cache_dir,
+                stop_event=stop_event,
+            ),
+        ),
     ]
 
-    for source_name, fetch_func in sources:
-        logger.info(f"\n--- Trying {source_name} ---")
+    # Sources are network-bound, so fetch them concurrently and overlap latency.
+    # Results are handled as they complete; once one source is good enough the
+    # remaining fetches are told to stop.
+    executor = ThreadPoolExecutor(max_workers=len(sources))
+    try:
+        futures = {
+            executor.submit(fetch_func): source_name
+            for source_name, fetch_func in sources
+        }
 
-        try:
-            cities = fetch_func()
-            if cities is not None and len(cities) > 0:
-                # Filter by population
-                filtered = cities[cities["population"] >= args.min_population]
+        for future in as_completed(futures):
+            source_name = futures[future]
+            logger.info(f"\n--- Trying {source_name} ---")
 
-                logger.info(
-                    f"✓ {source_name}: {len(filtered)} cities (≥ {args.min_population:,} population)"
-                )
+            try:
+                cities = future.result()
+                if cities is not None and len(cities) > 0:
+                    # Filter by population
+                    filtered = cities[cities["population"] >= args.min_population]
 
-                if best_cities is None or len(filtered) > len(best_cities):
-                    best_cities = filtered
-                    best_source = source_name
-            else:
-                logger.warning(f"✗ {source_name}: No data retrieved")
+                    logger.info(
+                        f"✓ {source_name}: {len(filtered)} cities (≥ {args.min_population:,} population)"
+                    )
 
-        except Exception as e:
-            logger.error(f"✗ {source_name}: Failed - {e}")
+                    if best_cities is None or len(filtered) > len(best_cities):
+                        best_cities = filtered
+                        best_source = source_name
+                else:
+                    logger.warning(f"✗ {source_name}: No data retrieved")
+
+            except Exception as e:
+                logger.error(f"✗ {source_name}: Failed - {e}")
+
+            if best_cities is not None and len(best_cities) >= args.target_count:
+                logger.info(
+                    f"✓ {best_source} reached target of {args.target_count:,} cities, skipping remaining sources"
+                )
+                break
+    finally:
+        stop_event.set()
+        executor.shutdown(wait=False, cancel_futures=True)
 
     # Use comprehensive fallback if no good source found
     if best_cities is None or len(best_cities) < 50:
         logger.info("\n--- Using Comprehensive Fallback ---")
-        fallback_cities = create_comprehensive_fallback_cities()
-        filtered_fallback = fallback_cities[
-            fallback_cities["population"] >= args.min_population
-        ]
+        fallback_cities = create_comprehensive_fallback_cities(args.min_population)
 
-        if best_cities is None or len(filtered_fallback) > len(best_cities):
-            best_cities = filtered_fallback
+        if best_cities is None or len(fallback_cities) > len(best_cities):
+            best_cities = fallback_cities
             best_source = "Comprehensive Fallback"
 
     # Save the best dataset
@@ -1387,8 +760,12 @@ def main():
         sample = best_cities.nlargest(10, "population")[
             ["city_name", "state", "population"]
         ]
-        for _, row in sample.iterrows():
-            print(f"  {row['city_name']}, {row['state']}: {row['population']:,}")
+        print(
+            "\n".join(
+                f"  {name}, {state}: {population:,}"
+                for name, state, population in sample.itertuples(index=False, name=None)
+            )
+        )
 
     else:
         logger.error("Failed to obtain any cities data!")
@@ -1,12 +1,13 @@
 """Algorithm registry and interface definitions."""
 
 from collections.abc import Callable
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 
-import geopandas as gpd
-
-# Import and register algorithms
-from . import adjustment_impact, min_obs_anomaly, simple_anomaly
+# The algorithm modules (and geopandas/pandas) are imported by get_algorithm
+# on first use, so listing algorithms from the CLI stays cheap
+if TYPE_CHECKING:
+    import geopandas as gpd
+    import pandas as pd
 
 
 class AlgorithmProtocol(Protocol):
@@ -14,12 +15,12 @@ class AlgorithmProtocol(Protocol):
 
     def calculate(
         self,
-        gdf_adjusted: gpd.GeoDataFrame,
+        gdf_adjusted: "pd.DataFrame",
         baseline_period: tuple[int, int],
         current_period: tuple[int, int],
-        gdf_raw: gpd.GeoDataFrame | None = None,
+        gdf_raw: "pd.DataFrame | None" = None,
         config: dict[str, Any] | None = None,
-    ) -> gpd.GeoDataFrame:
+    ) -> "gpd.GeoDataFrame":
         """
         Calculate temperature anomalies.
 
@@ -36,29 +37,31 @@ class AlgorithmProtocol(Protocol):
         ...
 
 
-# Algorithm registry
-ALGORITHMS: dict[str, Callable] = {}
-
-
-def register_algorithm(name: str, algorithm_func: Callable) -> None:
-    """Register an algorithm function."""
-    ALGORITHMS[name] = algorithm_func
+# Registered algorithm names, in display order
+ALGORITHM_NAMES: tuple[str, ...] = ("simple", "min_obs", "adjustment_impact")
 
 
 def get_algorithm(name: str) -> Callable:
     """Get an algorithm function by name."""
-    if name not in ALGORITHMS:
-        raise ValueError(
-            f"Unknown algorithm: {name}. Available: {list(ALGORITHMS.keys())}"
-        )
-    return ALGORITHMS[name]
+    match name:
+        case "simple":
+            from . import simple_anomaly
 
+            return simple_anomaly.calculate
+        case "min_obs":
+            from . import min_obs_anomaly
 
-def list_algorithms() -> list[str]:
-    """List all registered algorithm names."""
-    return list(ALGORITHMS.keys())
+            return min_obs_anomaly.calculate
+        case "adjustment_impact":
+            from . import adjustment_impact
+
+            return adjustment_impact.calculate
+        case _:
+            raise ValueError(
+                f"Unknown algorithm: {name}. Available: {list(ALGORITHM_NAMES)}"
+            )
 
 
-register_algorithm("simple", simple_anomaly.calculate)
-register_algorithm("min_obs", min_obs_anomaly.calculate)
-register_algorithm("adjustment_impact", adjustment_impact.calculate)
+def list_algorithms() -> list[str]:
+    """List all registered algorithm names."""
+    return list(ALGORITHM_NAMES)
@@ -3,14 +3,18 @@
 from typing import Any
 
 import geopandas as gpd
+import pandas as pd
+
+from .common import select_period, station_mean_count, station_points
 
 
 def calculate(
-    gdf_adjusted: gpd.GeoDataFrame,
+    gdf_adjusted: pd.DataFrame,
     baseline_period: tuple[int, int],
     current_period: tuple[int, int],
-    gdf_raw: gpd.GeoDataFrame | None = None,
+    gdf_raw: pd.DataFrame | None = None,
     config: dict[str, Any] | None = None,
+    baseline_means: pd.DataFrame | None = None,
 ) -> gpd.GeoDataFrame:
     """
     Calculate the impact of NOAA adjustments on temperature anomalies.
@@ -18,14 +22,17 @@ def calculate(
     This algorithm computes anomalies using both raw and adjusted data,
     then calculates the difference to isolate the effect of adjustments.
     The temperature metric (min/max/avg) is determined by the data loaded via
-    the data_loader module and applies to both raw and adjusted datasets.
+    the data.loaders module and applies to both raw and adjusted datasets.
 
     Args:
         gdf_adjusted: Adjusted USHCN temperature data (metric determined at load time)
         baseline_period: Tuple of (start_year, end_year) for baseline
         current_period: Tuple of (start_year, end_year) for current period
         gdf_raw: Raw USHCN temperature data (REQUIRED, same metric as adjusted)
-        config: Optional configuration parameters
+        config: Optional configuration parameters with 'n_jobs' key
+        baseline_means: Optional result of period_means() for the baseline
+            period, so a sweep of current periods against one baseline computes
+            it only once; computed from the data when omitted
 
     Returns:
         GeoDataFrame with columns: ['geometry', 'station_id', 'anomaly_raw',
@@ -34,99 +41,64 @@ def calculate(
     if gdf_raw is None:
         raise ValueError("Raw data is required for adjustment impact analysis")
 
-    # Calculate anomaly using adjusted data
-    anomaly_adjusted = _calculate_single_anomaly(
-        gdf_adjusted, baseline_period, current_period
-    )
+    n_jobs = (config or {}).get("n_jobs", 1)
 
-    # Calculate anomaly using raw data
-    anomaly_raw = _calculate_single_anomaly(gdf_raw, baseline_period, current_period)
+    # Adjusted and raw means side by side per station for each period
+    if baseline_means is None:
+        baseline_means = period_means(gdf_adjusted, gdf_raw, baseline_period, n_jobs)
+    current_means = period_means(gdf_adjusted, gdf_raw, current_period, n_jobs)
 
-    # Merge results on station_id
-    results = anomaly_adjusted.merge(
-        anomaly_raw[["station_id", "anomaly_celsius"]],
-        on="station_id",
-        how="inner",
-        suffixes=("_adjusted", "_raw"),
-    )
+    # Anomalies align on station_id; keep stations with all four means
+    anomalies = (current_means - baseline_means).dropna()
 
-    # Calculate adjustment impact
-    results["adjustment_impact"] = (
-        results["anomaly_celsius_adjusted"] - results["anomaly_celsius_raw"]
-    )
+    station_ids = anomalies.index.to_numpy()
+    anomaly_raw = anomalies["raw"].to_numpy()
+    anomaly_adjusted = anomalies["adjusted"].to_numpy()
 
-    # Rename columns for clarity
-    results = results.rename(
-        columns={
-            "anomaly_celsius_adjusted": "anomaly_adjusted",
-            "anomaly_celsius_raw": "anomaly_raw",
-        }
-    )
+    # Build point geometries once per station from lat/lon, not per row
+    station_geometry = station_points(gdf_adjusted)
 
-    # Create final GeoDataFrame
+    # Build the result once, in output column order
     return gpd.GeoDataFrame(
-        results[
-            [
-                "station_id",
-                "anomaly_raw",
-                "anomaly_adjusted",
-                "adjustment_impact",
-                "geometry",
-            ]
-        ],
-        crs=gdf_adjusted.crs,
+        {
+            "station_id": station_ids,
+            "anomaly_raw": anomaly_raw,
+            "anomaly_adjusted": anomaly_adjusted,
+            "adjustment_impact": anomaly_adjusted - anomaly_raw,
+            "geometry": station_geometry.loc[station_ids].array,
+        },
+        geometry="geometry",
+        crs=station_geometry.crs,
     )
 
 
-def _calculate_single_anomaly(
-    gdf: gpd.GeoDataFrame,
-    baseline_period: tuple[int, int],
-    current_period: tuple[int, int],
-) -> gpd.GeoDataFrame:
+def period_means(
+    gdf_adjusted: pd.DataFrame,
+    gdf_raw: pd.DataFrame,
+    period: tuple[int, int],
+    n_jobs: int = 1,
+) -> pd.DataFrame:
     """
-    Helper function to calculate anomaly for a single dataset.
+    Calculate adjusted and raw station means for one period.
 
     Args:
-        gdf: Temperature data
-        baseline_period: Tuple of (start_year, end_year) for baseline
-        current_period: Tuple of (start_year, end_year) for current period
+        gdf_adjusted: Adjusted USHCN temperature data
+        gdf_raw: Raw USHCN temperature data
+        period: Tuple of (start_year, end_year), inclusive
+        n_jobs: Number of row chunks to accumulate in parallel
 
     Returns:
-        GeoDataFrame with anomaly results
+        DataFrame indexed by station_id with 'adjusted' and 'raw' mean columns
     """
-    # Extract years from periods
-    baseline_start, baseline_end = baseline_period
-    current_start, current_end = current_period
-
-    # Filter data by time periods
-    gdf = gdf.copy()
-    gdf["year"] = gdf["timestamp"].dt.year
-
-    baseline_data = gdf[(gdf["year"] >= baseline_start) & (gdf["year"] <= baseline_end)]
-
-    current_data = gdf[(gdf["year"] >= current_start) & (gdf["year"] <= current_end)]
-
-    # Calculate mean temperatures for each station in each period
-    baseline_means = (
-        baseline_data.groupby("station_id")
-        .agg({"temperature_celsius": "mean", "geometry": "first"})
-        .reset_index()
-    )
-
-    current_means = (
-        current_data.groupby("station_id")
-        .agg({"temperature_celsius": "mean"})
-        .reset_index()
-    )
-
-    # Rename columns
-    baseline_means.columns = ["station_id", "baseline_mean", "geometry"]
-    current_means.columns = ["station_id", "current_mean"]
-
-    # Merge baseline and current data
-    results = baseline_means.merge(current_means, on="station_id", how="inner")
-
-    # Calculate anomaly
-    results["anomaly_celsius"] = results["current_mean"] - results["baseline_mean"]
-
-    return results
+    means = {}
+    for source, frame in (("adjusted", gdf_adjusted), ("raw", gdf_raw)):
+        data = select_period(frame, period)
+        station_ids, station_means, _ = station_mean_count(
+            data["temperature_celsius"].to_numpy(),
+            data["station_id"].array,
+            n_jobs=n_jobs,
+        )
+        means[source] = pd.Series(station_means, index=station_ids)
+
+    # Stations missing from either source get NaN and are dropped by the caller
+    return pd.DataFrame(means)
@@ -0,0 +1,115 @@
+"""Shared helpers for the anomaly calculation algorithms."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import ExtensionArray
+
+
+def select_period(df: pd.DataFrame, period: tuple[int, int]) -> pd.DataFrame:
+    """
+    Select the rows whose year falls within a period (inclusive).
+
+    Data from the loader is sorted by timestamp, so the period is a contiguous
+    slice located with a binary search. Unsorted input falls back to a mask.
+
+    Args:
+        df: Temperature data with a precomputed 'year' column
+        period: Tuple of (start_year, end_year)
+
+    Returns:
+        Rows of df within the period
+    """
+    start, end = period
+    years = df["year"]
+
+    if years.is_monotonic_increasing:
+        values = years.to_numpy()
+        lo = np.searchsorted(values, start, side="left")
+        hi = np.searchsorted(values, end, side="right")
+        return df.iloc[lo:hi]
+
+    return df[(years >= start) & (years <= end)]
+
+
+def station_mean_count(
+    temps: np.ndarray,
+    station_ids: np.ndarray | ExtensionArray,
+    n_jobs: int = 1,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the mean temperature and observation count for each station.
+
+    Station codes are factorized once and the sums and counts are accumulated
+    with np.bincount, a single scatter-add pass with no sort or per-group Python
+    overhead. With n_jobs > 1 the rows are split into contiguous chunks that are
+    accumulated on worker threads (NumPy releases the GIL) and then added.
+
+    Args:
+        temps: Temperature values (must not contain NaN)
+        station_ids: Station identifier for each temperature value; a Categorical
+            is factorized from its integer codes without hashing strings
+        n_jobs: Number of row chunks to accumulate in parallel
+
+    Returns:
+        Tuple of (station_ids, float64 means, int32 counts), ordered by station_id
+    """
+    codes, uniques = pd.factorize(station_ids, sort=True)
+    n_stations = len(uniques)
+
+    if n_jobs > 1 and len(codes) > 0:
+        bounds = np.linspace(0, len(codes), n_jobs + 1).astype(np.intp)
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            parts = list(
+                executor.map(
+                    lambda chunk: _station_sums(temps[chunk], codes[chunk], n_stations),
+                    [slice(lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:])],
+                )
+            )
+        sums = np.sum([part_sums for part_sums, _ in parts], axis=0)
+        counts = np.sum([part_counts for _, part_counts in parts], axis=0)
+    else:
+        sums, counts = _station_sums(temps, codes, n_stations)
+
+    counts = counts.astype(np.int32)
+    return np.asarray(uniques), sums / counts, counts
+
+
+def _station_sums(
+    temps: np.ndarray, codes: np.ndarray, n_stations: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Accumulate temperature sums and observation counts per station code.
+
+    Args:
+        temps: Temperature values
+        codes: Integer station code for each temperature value
+        n_stations: Number of distinct station codes
+
+    Returns:
+        Tuple of (float64 sums, integer counts) indexed by station code
+    """
+    # bincount accumulates its weights in float64, even for float32 temperatures
+    sums = np.bincount(codes, weights=temps, minlength=n_stations)
+    counts = np.bincount(codes, minlength=n_stations)
+    return sums, counts
+
+
+def station_points(df: pd.DataFrame) -> gpd.GeoSeries:
+    """
+    Build one point geometry per station from its lat/lon columns.
+
+    Args:
+        df: Temperature data with station_id, lat and lon columns
+
+    Returns:
+        GeoSeries of station locations indexed by station_id
+    """
+    stations = df.drop_duplicates("station_id")
+    return gpd.GeoSeries(
+        gpd.points_from_xy(stations["lon"], stations["lat"]),
+        index=stations["station_id"].to_numpy(),
+        crs="EPSG:4326",
+    )
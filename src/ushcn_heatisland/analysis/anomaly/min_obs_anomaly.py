@@ -3,13 +3,16 @@
 from typing import Any
 
 import geopandas as gpd
+import pandas as pd
+
+from .common import select_period, station_mean_count, station_points
 
 
 def calculate(
-    gdf_adjusted: gpd.GeoDataFrame,
+    gdf_adjusted: pd.DataFrame,
     baseline_period: tuple[int, int],
     current_period: tuple[int, int],
-    gdf_raw: gpd.GeoDataFrame | None = None,
+    gdf_raw: pd.DataFrame | None = None,
     config: dict[str, Any] | None = None,
 ) -> gpd.GeoDataFrame:
     """
@@ -18,14 +21,15 @@ def calculate(
     This algorithm is similar to simple_anomaly but requires a minimum number
     of observations in both baseline and current periods to include a station.
     The temperature metric (min/max/avg) is determined by the data loaded via
-    the data_loader module.
+    the data.loaders module.
 
     Args:
         gdf_adjusted: Adjusted USHCN temperature data (metric determined at load time)
         baseline_period: Tuple of (start_year, end_year) for baseline
         current_period: Tuple of (start_year, end_year) for current period
         gdf_raw: Optional raw USHCN temperature data (not used in this algorithm)
-        config: Optional configuration parameters with 'min_observations' key
+        config: Optional configuration parameters with 'min_observations' and
+            'n_jobs' keys
 
     Returns:
         GeoDataFrame with columns: ['geometry', 'station_id', 'anomaly_celsius',
@@ -36,78 +40,65 @@ def calculate(
     if config and "min_observations" in config:
         min_obs = config["min_observations"]
 
-    # Extract years from periods
-    baseline_start, baseline_end = baseline_period
-    current_start, current_end = current_period
+    # Optional thread count for the per-station reduction
+    n_jobs = (config or {}).get("n_jobs", 1)
 
-    # Filter data by time periods
-    gdf_adjusted = gdf_adjusted.copy()
-    gdf_adjusted["year"] = gdf_adjusted["timestamp"].dt.year
+    # Filter data by time periods (year is precomputed by the loader)
+    baseline_data = select_period(gdf_adjusted, baseline_period)
+    current_data = select_period(gdf_adjusted, current_period)
 
-    baseline_data = gdf_adjusted[
-        (gdf_adjusted["year"] >= baseline_start)
-        & (gdf_adjusted["year"] <= baseline_end)
-    ]
+    # Build point geometries once per station from lat/lon, not per row
+    station_geometry = station_points(gdf_adjusted)
 
-    current_data = gdf_adjusted[
-        (gdf_adjusted["year"] >= current_start) & (gdf_adjusted["year"] <= current_end)
+    # Apply minimum observation filter on the counts first, so means are only
+    # computed for stations that qualify in both periods
+    baseline_counts = baseline_data["station_id"].value_counts(sort=False)
+    current_counts = current_data["station_id"].value_counts(sort=False)
+    current_counts = current_counts.reindex(baseline_counts.index, fill_value=0)
+    eligible = baseline_counts.index[
+        (baseline_counts >= min_obs) & (current_counts >= min_obs)
     ]
 
+    baseline_data = baseline_data[baseline_data["station_id"].isin(eligible)]
+    current_data = current_data[current_data["station_id"].isin(eligible)]
+
     # Calculate mean temperatures for each station in each period
-    baseline_means = (
-        baseline_data.groupby("station_id")
-        .agg({"temperature_celsius": ["mean", "count"], "geometry": "first"})
-        .reset_index()
+    station_ids, means, counts = station_mean_count(
+        baseline_data["temperature_celsius"].to_numpy(),
+        baseline_data["station_id"].array,
+        n_jobs=n_jobs,
     )
-
-    current_means = (
-        current_data.groupby("station_id")
-        .agg({"temperature_celsius": ["mean", "count"]})
-        .reset_index()
+    baseline_means = pd.DataFrame(
+        {"baseline_mean": means, "n_baseline": counts}, index=station_ids
     )
 
-    # Flatten column names
-    baseline_means.columns = ["station_id", "baseline_mean", "n_baseline", "geometry"]
-    current_means.columns = ["station_id", "current_mean", "n_current"]
-
-    # Merge baseline and current data
-    results = baseline_means.merge(current_means, on="station_id", how="inner")
+    station_ids, means, counts = station_mean_count(
+        current_data["temperature_celsius"].to_numpy(),
+        current_data["station_id"].array,
+        n_jobs=n_jobs,
+    )
+    current_means = pd.DataFrame(
+        {"current_mean": means, "n_current": counts}, index=station_ids
+    )
 
-    # Apply minimum observation filter
-    results = results[
-        (results["n_baseline"] >= min_obs) & (results["n_current"] >= min_obs)
-    ]
+    # Combine baseline and current data, aligned on station_id
+    combined = pd.concat([baseline_means, current_means], axis=1, join="inner")
+    station_ids = combined.index.to_numpy()
 
-    if len(results) == 0:
-        # Return empty GeoDataFrame with correct structure
-        return gpd.GeoDataFrame(
-            columns=[
-                "station_id",
-                "anomaly_celsius",
-                "baseline_mean",
-                "current_mean",
-                "n_baseline",
-                "n_current",
-                "geometry",
-            ],
-            crs=gdf_adjusted.crs,
-        )
-
-    # Calculate anomaly
-    results["anomaly_celsius"] = results["current_mean"] - results["baseline_mean"]
-
-    # Create GeoDataFrame
+    # Build the result once, in output column order, with geometry taken
+    # straight from the per-station points
     return gpd.GeoDataFrame(
-        results[
-            [
-                "station_id",
-                "anomaly_celsius",
-                "baseline_mean",
-                "current_mean",
-                "n_baseline",
-                "n_current",
-                "geometry",
-            ]
-        ],
-        crs=gdf_adjusted.crs,
+        {
+            "station_id": station_ids,
+            "anomaly_celsius": (
+                combined["current_mean"] - combined["baseline_mean"]
+            ).to_numpy(),
+            "baseline_mean": combined["baseline_mean"].to_numpy(),
+            "current_mean": combined["current_mean"].to_numpy(),
+            "n_baseline": combined["n_baseline"].to_numpy(),
+            "n_current": combined["n_current"].to_numpy(),
+            "geometry": station_geometry.loc[station_ids].array,
+        },
+        geometry="geometry",
+        crs=station_geometry.crs,
     )
@@ -0,0 +1,137 @@
+"""Batch execution of anomaly analyses across worker processes."""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+
+from ...core.models import AnalysisConfig
+from . import get_algorithm
+
+# Columns the algorithms read; everything else stays in the parent process
+_SHARED_COLUMNS = ("year", "temperature_celsius", "lat", "lon")
+
+# Per-worker frames rebuilt from shared memory by _init_worker
+_worker_frames: dict[str, pd.DataFrame | None] = {}
+_worker_blocks: list[SharedMemory] = []
+
+
+def run_many(
+    gdf_adjusted: pd.DataFrame,
+    gdf_raw: pd.DataFrame | None,
+    configs: list[AnalysisConfig],
+    max_workers: int | None = None,
+) -> list[gpd.GeoDataFrame]:
+    """
+    Run several anomaly analyses in parallel over the same loaded data.
+
+    The numeric columns are placed in shared memory once, so workers map the
+    data instead of each receiving a pickled copy of the frames.
+
+    Args:
+        gdf_adjusted: Adjusted USHCN temperature data
+        gdf_raw: Raw USHCN temperature data (required for adjustment_impact)
+        configs: Analysis configurations to run
+        max_workers: Maximum number of worker processes (default: CPU count)
+
+    Returns:
+        Results in the same order as configs
+    """
+    blocks: list[SharedMemory] = []
+    try:
+        adjusted_spec = _share_frame(gdf_adjusted, blocks)
+        raw_spec = _share_frame(gdf_raw, blocks) if gdf_raw is not None else None
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(adjusted_spec, raw_spec),
+        ) as executor:
+            return list(executor.map(_run_config, configs))
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
+
+def _share_frame(df: pd.DataFrame, blocks: list[SharedMemory]) -> dict[str, Any]:
+    """
+    Copy a frame's numeric columns into shared memory blocks.
+
+    Args:
+        df: Temperature data to share
+        blocks: List collecting the created blocks for later cleanup
+
+    Returns:
+        Description of the shared columns used to rebuild the frame
+    """
+    station_ids = df["station_id"].astype("category")
+    arrays = {
+        "station_code": station_ids.cat.codes.to_numpy(),
+        **{col: df[col].to_numpy() for col in _SHARED_COLUMNS},
+    }
+
+    columns = {}
+    for name, array in arrays.items():
+        shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+        blocks.append(shm)
+        np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[:] = array
+        columns[name] = (shm.name, array.dtype.str)
+
+    return {
+        "length": len(df),
+        "categories": station_ids.cat.categories.to_numpy(),
+        "columns": columns,
+    }
+
+
+def _attach_frame(spec: dict[str, Any]) -> pd.DataFrame:
+    """
+    Rebuild a frame from shared memory without copying its numeric columns.
+
+    Args:
+        spec: Description returned by _share_frame
+
+    Returns:
+        DataFrame backed by the shared memory blocks
+    """
+    arrays = {}
+    for name, (shm_name, dtype) in spec["columns"].items():
+        shm = SharedMemory(name=shm_name)
+        _worker_blocks.append(shm)
+        arrays[name] = np.ndarray(spec["length"], dtype=dtype, buffer=shm.buf)
+
+    codes = arrays.pop("station_code")
+    return pd.DataFrame(
+        {
+            "station_id": pd.Categorical.from_codes(codes, spec["categories"]),
+            **arrays,
+        },
+        copy=False,
+    )
+
+
+def _init_worker(
+    adjusted_spec: dict[str, Any], raw_spec: dict[str, Any] | None
+) -> None:
+    """Attach the shared frames once per worker process."""
+    _worker_frames["adjusted"] = _attach_frame(adjusted_spec)
+    _worker_frames["raw"] = _attach_frame(raw_spec) if raw_spec else None
+
+
+def _run_config(config: AnalysisConfig) -> gpd.GeoDataFrame:
+    """Run one analysis configuration against the worker's shared frames."""
+    algorithm_config = None
+    if config.min_observations is not None:
+        algorithm_config = {"min_observations": config.min_observations}
+
+    return get_algorithm(config.algorithm)(
+        gdf_adjusted=_worker_frames["adjusted"],
+        baseline_period=(config.baseline_start_year, config.baseline_end_year),
+        current_period=(config.current_start_year, config.current_end_year),
+        gdf_raw=_worker_frames["raw"],
+        config=algorithm_config,
+    )
@@ -3,13 +3,16 @@
 from typing import Any
 
 import geopandas as gpd
+import pandas as pd
+
+from .common import select_period, station_mean_count, station_points
 
 
 def calculate(
-    gdf_adjusted: gpd.GeoDataFrame,
+    gdf_adjusted: pd.DataFrame,
     baseline_period: tuple[int, int],
     current_period: tuple[int, int],
-    gdf_raw: gpd.GeoDataFrame | None = None,
+    gdf_raw: pd.DataFrame | None = None,
     config: dict[str, Any] | None = None,
 ) -> gpd.GeoDataFrame:
     """
@@ -17,71 +20,66 @@ def calculate(
 
     This algorithm calculates the mean temperature difference between a current period
     and a baseline period for each station. The temperature metric (min/max/avg) is
-    determined by the data loaded via the data_loader module.
+    determined by the data loaded via the data.loaders module.
 
     Args:
         gdf_adjusted: Adjusted USHCN temperature data (metric determined at load time)
         baseline_period: Tuple of (start_year, end_year) for baseline
         current_period: Tuple of (start_year, end_year) for current period
         gdf_raw: Optional raw USHCN temperature data (not used in this algorithm)
-        config: Optional configuration parameters
+        config: Optional configuration parameters with 'n_jobs' key
 
     Returns:
         GeoDataFrame with columns: ['geometry', 'station_id', 'anomaly_celsius',
                                    'baseline_mean', 'current_mean', 'n_baseline', 'n_current']
     """
-    # Extract years from periods
-    baseline_start, baseline_end = baseline_period
-    current_start, current_end = current_period
-
-    # Filter data by time periods
-    gdf_adjusted = gdf_adjusted.copy()
-    gdf_adjusted["year"] = gdf_adjusted["timestamp"].dt.year
+    # Optional thread count for the per-station reduction
+    n_jobs = (config or {}).get("n_jobs", 1)
 
-    baseline_data = gdf_adjusted[
-        (gdf_adjusted["year"] >= baseline_start)
-        & (gdf_adjusted["year"] <= baseline_end)
-    ]
+    # Filter data by time periods (year is precomputed by the loader)
+    baseline_data = select_period(gdf_adjusted, baseline_period)
+    current_data = select_period(gdf_adjusted, current_period)
 
-    current_data = gdf_adjusted[
-        (gdf_adjusted["year"] >= current_start) & (gdf_adjusted["year"] <= current_end)
-    ]
+    # Build point geometries once per station from lat/lon, not per row
+    station_geometry = station_points(gdf_adjusted)
 
     # Calculate mean temperatures for each station in each period
-    baseline_means = (
-        baseline_data.groupby("station_id")
-        .agg({"temperature_celsius": ["mean", "count"], "geometry": "first"})
-        .reset_index()
+    station_ids, means, counts = station_mean_count(
+        baseline_data["temperature_celsius"].to_numpy(),
+        baseline_data["station_id"].array,
+        n_jobs=n_jobs,
     )
-
-    current_means = (
-        current_data.groupby("station_id")
-        .agg({"temperature_celsius": ["mean", "count"]})
-        .reset_index()
+    baseline_means = pd.DataFrame(
+        {"baseline_mean": means, "n_baseline": counts}, index=station_ids
     )
 
-    # Flatten column names
-    baseline_means.columns = ["station_id", "baseline_mean", "n_baseline", "geometry"]
-    current_means.columns = ["station_id", "current_mean", "n_current"]
-
-    # Merge baseline and current data
-    results = baseline_means.merge(current_means, on="station_id", how="inner")
+    station_ids, means, counts = station_mean_count(
+        current_data["temperature_celsius"].to_numpy(),
+        current_data["station_id"].array,
+        n_jobs=n_jobs,
+    )
+    current_means = pd.DataFrame(
+        {"current_mean": means, "n_current": counts}, index=station_ids
+    )
 
-    # Calculate anomaly
-    results["anomaly_celsius"] = results["current_mean"] - results["baseline_mean"]
+    # Combine baseline and current data, aligned on station_id
+    combined = pd.concat([baseline_means, current_means], axis=1, join="inner")
+    station_ids = combined.index.to_numpy()
 
-    # Create GeoDataFrame
+    # Build the result once, in output column order, with geometry taken
+    # straight from the per-station points
     return gpd.GeoDataFrame(
-        results[
-            [
-                "station_id",
-                "anomaly_celsius",
-                "baseline_mean",
-                "current_mean",
-                "n_baseline",
-                "n_current",
-                "geometry",
-            ]
-        ],
-        crs=gdf_adjusted.crs,
+        {
+            "station_id": station_ids,
+            "anomaly_celsius": (
+                combined["current_mean"] - combined["baseline_mean"]
+            ).to_numpy(),
+            "baseline_mean": combined["baseline_mean"].to_numpy(),
+            "current_mean": combined["current_mean"].to_numpy(),
+            "n_baseline": combined["n_baseline"].to_numpy(),
+            "n_current": combined["n_current"].to_numpy(),
+            "geometry": station_geometry.loc[station_ids].array,
+        },
+        geometry="geometry",
+        crs=station_geometry.crs,
     )
@@ -1,16 +1,83 @@
 """Heat island analysis functions for urban temperature investigation."""
 
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple
 
 import geopandas as gpd
 import numpy as np
 import pandas as pd
-from scipy import stats
-from scipy.spatial.distance import cdist
+from scipy.spatial import cKDTree
+from scipy.stats import beta, mannwhitneyu, norm, spearmanr, ttest_ind_from_stats
+from scipy.stats import t as student_t
 
+# Mean Earth radius used for great-circle distances (km)
+_EARTH_RADIUS_KM = 6371.0
 
-def calculate_urban_rural_statistics(
+# Classifications pooled on each side of the urban vs rural comparison
+_URBAN_CATEGORIES = ["urban_core", "urban"]
+_RURAL_CATEGORIES = ["rural"]
+
+
+class _PreparedResults(NamedTuple):
+    """Columns of an anomaly results frame, extracted once for the analyses."""
+
+    classification_column: str
+    anomaly_col: str | None
+    anomalies: np.ndarray | None
+    classes: np.ndarray | None
+    distances: np.ndarray | None
+    geometry: gpd.GeoSeries
+
+
+def _prepare_results(
     results_gdf: gpd.GeoDataFrame, classification_column: str = "urban_classification"
+) -> _PreparedResults:
+    """
+    Extract the columns used by the heat island analyses as NumPy arrays.
+
+    Missing columns are recorded as None so each analysis can report them with
+    its own error message.
+
+    Args:
+        results_gdf: GeoDataFrame with anomaly results
+        classification_column: Column name containing urban/rural classification
+
+    Returns:
+        Prepared column arrays shared between the analyses
+    """
+    anomaly_col = None
+    if "anomaly_celsius" in results_gdf.columns:
+        anomaly_col = "anomaly_celsius"
+    elif "adjustment_impact" in results_gdf.columns:
+        anomaly_col = "adjustment_impact"
+
+    def float_column(column: str | None) -> np.ndarray | None:
+        if column is None or column not in results_gdf.columns:
+            return None
+        # float32 columns are used as stored; the reductions accumulate in
+        # float64 regardless of the input precision
+        values = results_gdf[column]
+        dtype = np.float32 if values.dtype == np.float32 else np.float64
+        return values.to_numpy(dtype=dtype, na_value=np.nan)
+
+    return _PreparedResults(
+        classification_column=classification_column,
+        anomaly_col=anomaly_col,
+        anomalies=float_column(anomaly_col),
+        classes=(
+            results_gdf[classification_column].to_numpy()
+            if classification_column in results_gdf.columns
+            else None
+        ),
+        distances=float_column("distance_to_nearest_city_km"),
+        geometry=results_gdf.geometry,
+    )
+
+
+def calculate_urban_rural_statistics(
+    results_gdf: gpd.GeoDataFrame,
+    classification_column: str = "urban_classification",
+    compare_only: bool = False,
 ) -> dict[str, Any]:
     """
     Calculate urban vs rural temperature anomaly statistics.
@@ -18,87 +85,110 @@ def calculate_urban_rural_statistics(
     Args:
         results_gdf: GeoDataFrame with anomaly results and urban classification
         classification_column: Column name containing urban/rural classification
+        compare_only: Only compute the urban vs rural comparison, leaving
+            statistics_by_classification empty
+
+    Returns:
+        Dictionary with comprehensive urban vs rural statistics
+    """
+    return _urban_rural_statistics(
+        _prepare_results(results_gdf, classification_column), compare_only
+    )
+
+
+def _urban_rural_statistics(
+    prepared: _PreparedResults, compare_only: bool = False
+) -> dict[str, Any]:
+    """
+    Calculate urban vs rural statistics from prepared column arrays.
+
+    Args:
+        prepared: Column arrays from _prepare_results
+        compare_only: Skip the per-classification breakdown
 
     Returns:
         Dictionary with comprehensive urban vs rural statistics
     """
-    if classification_column not in results_gdf.columns:
+    if prepared.classes is None:
         raise ValueError(
-            f"Classification column '{classification_column}' not found in data"
+            f"Classification column '{prepared.classification_column}' "
+            "not found in data"
         )
-
-    # Determine the anomaly column to analyze
-    anomaly_col = None
-    if "anomaly_celsius" in results_gdf.columns:
-        anomaly_col = "anomaly_celsius"
-    elif "adjustment_impact" in results_gdf.columns:
-        anomaly_col = "adjustment_impact"
-    else:
+    if prepared.anomalies is None:
         raise ValueError("No suitable anomaly column found in results")
 
     # Remove stations with missing data
-    clean_data = results_gdf.dropna(subset=[anomaly_col, classification_column]).copy()
+    valid = ~np.isnan(prepared.anomalies) & pd.notna(prepared.classes)
+    anomaly_values = prepared.anomalies[valid]
+    classes = prepared.classes[valid]
 
-    if len(clean_data) == 0:
+    if len(anomaly_values) == 0:
         return {"error": "No valid data for urban/rural analysis"}
 
-    # Group by classification
-    grouped = clean_data.groupby(classification_column)[anomaly_col]
-
-    # Basic statistics by classification
-    stats_by_class = {}
-    for classification, values in grouped:
-        values_array = values.values
-        stats_by_class[str(classification)] = {
-            "count": int(len(values_array)),
-            "mean": float(np.mean(values_array)),
-            "median": float(np.median(values_array)),
-            "std": float(np.std(values_array)),
-            "min": float(np.min(values_array)),
-            "max": float(np.max(values_array)),
-            "q25": float(np.percentile(values_array, 25)),
-            "q75": float(np.percentile(values_array, 75)),
-        }
-
     # Urban vs Rural comparison (if both exist)
-    urban_categories = ["urban_core", "urban"]
-    rural_categories = ["rural"]
+    urban_data = anomaly_values[np.isin(classes, _URBAN_CATEGORIES)]
+    rural_data = anomaly_values[np.isin(classes, _RURAL_CATEGORIES)]
+
+    # The per-classification breakdown is the costly part (a group-by and a
+    # partial sort per class), so comparison-only callers skip it
+    stats_by_class: dict[str, dict[str, Any]] = {}
+    if not compare_only:
+        # Group by classification
+        grouped = pd.Series(anomaly_values).groupby(classes)
+
+        # Basic statistics by classification, using pandas' grouped reducers
+        summary = grouped.agg(["count", "mean", "min", "max"])
+        summary["std"] = grouped.std(ddof=0)  # Population std, as np.std
+
+        # Median and quartiles from one partial sort per classification
+        order_stats = {
+            classification: _quantiles(anomaly_values[indices], (0.5, 0.25, 0.75))
+            for classification, indices in grouped.indices.items()
+        }
+        summary[["median", "q25", "q75"]] = pd.DataFrame.from_dict(
+            order_stats, orient="index"
+        )
 
-    urban_data = clean_data[clean_data[classification_column].isin(urban_categories)][
-        anomaly_col
-    ]
-    rural_data = clean_data[clean_data[classification_column].isin(rural_categories)][
-        anomaly_col
-    ]
+        stats_by_class = {
+            str(classification): {
+                "count": int(row["count"]),
+                **{
+                    stat: float(row[stat])
+                    for stat in ("mean", "median", "std", "min", "max", "q25", "q75")
+                },
+            }
+            for classification, row in summary.to_dict(orient="index").items()
+        }
 
     comparison_stats = {}
 
     if len(urban_data) > 0 and len(rural_data) > 0:
+        # Sample standard deviations (ddof=1), as pandas computed them
+        urban_count, urban_mean, urban_std = _moments(urban_data, ddof=1)
+        rural_count, rural_mean, rural_std = _moments(rural_data, ddof=1)
+
         # Calculate Urban Heat Island Intensity (UHII)
-        uhii = float(urban_data.mean() - rural_data.mean())
+        uhii = float(urban_mean - rural_mean)
 
         # Statistical tests
-        # T-test (assumes normal distribution)
-        t_stat, t_p_value = stats.ttest_ind(urban_data, rural_data)
+        # T-test (assumes normal distribution), from the moments above
+        t_stat, t_p_value = ttest_ind_from_stats(
+            urban_mean, urban_std, urban_count, rural_mean, rural_std, rural_count
+        )
 
         # Mann-Whitney U test (non-parametric)
-        u_stat, u_p_value = stats.mannwhitneyu(
-            urban_data, rural_data, alternative="two-sided"
-        )
+        u_stat, u_p_value = _mann_whitney_u(urban_data, rural_data)
 
         # Effect size (Cohen's d)
         pooled_std = np.sqrt(
-            (
-                (len(urban_data) - 1) * urban_data.std() ** 2
-                + (len(rural_data) - 1) * rural_data.std() ** 2
-            )
-            / (len(urban_data) + len(rural_data) - 2)
+            ((urban_count - 1) * urban_std**2 + (rural_count - 1) * rural_std**2)
+            / (urban_count + rural_count - 2)
         )
         cohens_d = uhii / pooled_std if pooled_std > 0 else np.nan
 
         # Confidence interval for UHII (95% CI)
-        urban_se = urban_data.std() / np.sqrt(len(urban_data))
-        rural_se = rural_data.std() / np.sqrt(len(rural_data))
+        urban_se = urban_std / np.sqrt(urban_count)
+        rural_se = rural_std / np.sqrt(rural_count)
         combined_se = np.sqrt(urban_se**2 + rural_se**2)
         ci_margin = 1.96 * combined_se  # 95% CI
 
@@ -106,12 +196,12 @@ def calculate_urban_rural_statistics(
             "urban_heat_island_intensity": uhii,
             "uhii_confidence_interval_lower": uhii - ci_margin,
             "uhii_confidence_interval_upper": uhii + ci_margin,
-            "urban_mean": float(urban_data.mean()),
-            "rural_mean": float(rural_data.mean()),
-            "urban_std": float(urban_data.std()),
-            "rural_std": float(rural_data.std()),
-            "urban_count": int(len(urban_data)),
-            "rural_count": int(len(rural_data)),
+            "urban_mean": float(urban_mean),
+            "rural_mean": float(rural_mean),
+            "urban_std": float(urban_std),
+            "rural_std": float(rural_std),
+            "urban_count": int(urban_count),
+            "rural_count": int(rural_count),
             "t_test_statistic": float(t_stat),
             "t_test_p_value": float(t_p_value),
             "mannwhitney_u_statistic": float(u_stat),
@@ -138,11 +228,75 @@ def calculate_urban_rural_statistics(
     return {
         "statistics_by_classification": stats_by_class,
         "urban_vs_rural_comparison": comparison_stats,
-        "total_stations_analyzed": int(len(clean_data)),
-        "anomaly_column_analyzed": anomaly_col,
+        "total_stations_analyzed": int(len(anomaly_values)),
+        "anomaly_column_analyzed": prepared.anomaly_col,
     }
 
 
+def _quantiles(values: np.ndarray, quantiles: tuple[float, ...]) -> np.ndarray:
+    """
+    Calculate linearly interpolated quantiles with a single np.partition.
+
+    Selection is O(n) instead of the full sort behind np.percentile, while the
+    result matches its default linear interpolation.
+
+    Args:
+        values: Non-empty array of values (must not contain NaN)
+        quantiles: Quantiles to compute, each between 0 and 1
+
+    Returns:
+        Array with one value per requested quantile
+    """
+    positions = np.asarray(quantiles) * (len(values) - 1)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.minimum(lower + 1, len(values) - 1)
+    partitioned = np.partition(values, np.unique(np.r_[lower, upper]))
+    return partitioned[lower] + (partitioned[upper] - partitioned[lower]) * (
+        positions - lower
+    )
+
+
+def _mann_whitney_u(x: np.ndarray, y: np.ndarray) -> tuple[float, float]:
+    """
+    Two-sided Mann-Whitney U test.
+
+    Samples with at least 20 values use the tie-corrected normal approximation
+    (with continuity correction, as SciPy's asymptotic method) computed from a
+    single sort; smaller samples defer to scipy.stats.mannwhitneyu.
+
+    Args:
+        x: First sample (must not contain NaN)
+        y: Second sample (must not contain NaN)
+
+    Returns:
+        Tuple of (U statistic of x, p-value)
+    """
+    n1, n2 = len(x), len(y)
+    if min(n1, n2) < 20:
+        u_stat, p_value = mannwhitneyu(x, y, alternative="two-sided")
+        return float(u_stat), float(p_value)
+
+    # Average ranks of the pooled sample; tied runs share their mean rank
+    combined = np.concatenate([x, y])
+    order = np.argsort(combined, kind="stable")
+    sorted_values = combined[order]
+    starts = np.flatnonzero(np.r_[True, sorted_values[1:] != sorted_values[:-1]])
+    tie_counts = np.diff(np.r_[starts, len(combined)])
+    ranks = np.repeat(starts + (tie_counts + 1) / 2, tie_counts)
+
+    u1 = ranks[order < n1].sum() - n1 * (n1 + 1) / 2
+    u = max(u1, n1 * n2 - u1)
+
+    n = n1 + n2
+    tie_term = float((tie_counts**3 - tie_counts).sum())
+    sigma = np.sqrt(n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1))))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = (u - n1 * n2 / 2 - 0.5) / sigma
+    p_value = float(np.clip(2 * norm.sf(z), 0, 1))
+
+    return float(u1), p_value
+
+
 def analyze_distance_gradients(
     results_gdf: gpd.GeoDataFrame,
     cities_gdf: gpd.GeoDataFrame,
@@ -158,71 +312,113 @@ def analyze_distance_gradients(
         max_distance: Maximum distance to analyze (km)
         distance_bins: Number of distance bins for analysis
 
+    Returns:
+        Dictionary with gradient analysis results
+    """
+    return _distance_gradients(
+        _prepare_results(results_gdf), cities_gdf, max_distance, distance_bins
+    )
+
+
+def _distance_gradients(
+    prepared: _PreparedResults,
+    cities_gdf: gpd.GeoDataFrame,
+    max_distance: float = 200.0,
+    distance_bins: int = 10,
+) -> dict[str, Any]:
+    """
+    Analyze temperature vs distance from urban centers on prepared column arrays.
+
+    Args:
+        prepared: Column arrays from _prepare_results
+        cities_gdf: GeoDataFrame with city locations
+        max_distance: Maximum distance to analyze (km)
+        distance_bins: Number of distance bins for analysis
+
     Returns:
         Dictionary with gradient analysis results
     """
     # Check for required columns
-    if "distance_to_nearest_city_km" not in results_gdf.columns:
+    if prepared.distances is None:
         raise ValueError("Distance to nearest city information not found")
-
-    # Determine the anomaly column
-    anomaly_col = None
-    if "anomaly_celsius" in results_gdf.columns:
-        anomaly_col = "anomaly_celsius"
-    elif "adjustment_impact" in results_gdf.columns:
-        anomaly_col = "adjustment_impact"
-    else:
+    if prepared.anomalies is None:
         raise ValueError("No suitable anomaly column found")
 
-    # Clean data
-    clean_data = results_gdf.dropna(
-        subset=[anomaly_col, "distance_to_nearest_city_km"]
-    ).copy()
-    clean_data = clean_data[clean_data["distance_to_nearest_city_km"] <= max_distance]
+    # Clean data; NaN distances fail the max_distance comparison
+    valid = ~np.isnan(prepared.anomalies) & (prepared.distances <= max_distance)
+    distances = prepared.distances[valid]
+    anomalies = prepared.anomalies[valid]
 
-    if len(clean_data) == 0:
+    if len(anomalies) == 0:
         return {"error": "No valid data for gradient analysis"}
 
     # Create distance bins
-    distances = clean_data["distance_to_nearest_city_km"]
-    anomalies = clean_data[anomaly_col]
-
     bin_edges = np.linspace(0, max_distance, distance_bins + 1)
     bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
 
-    binned_stats = []
-    for i in range(len(bin_edges) - 1):
-        bin_mask = (distances >= bin_edges[i]) & (distances < bin_edges[i + 1])
-        bin_data = anomalies[bin_mask]
-
-        if len(bin_data) > 0:
-            binned_stats.append(
-                {
-                    "distance_bin_center": float(bin_centers[i]),
-                    "distance_bin_min": float(bin_edges[i]),
-                    "distance_bin_max": float(bin_edges[i + 1]),
-                    "count": int(len(bin_data)),
-                    "mean": float(bin_data.mean()),
-                    "median": float(bin_data.median()),
-                    "std": float(bin_data.std()),
-                    "std_error": float(bin_data.std() / np.sqrt(len(bin_data))),
-                }
-            )
+    counts, means, medians, stds = _binned_statistics(distances, anomalies, bin_edges)
+
+    # Keep non-empty bins; tolist() converts each column to Python scalars in
+    # bulk, so the dicts are only materialized once at the end
+    with np.errstate(invalid="ignore"):
+        std_errors = stds / np.sqrt(counts)
+    nonempty = counts > 0
+    binned_stats = [
+        {
+            "distance_bin_center": center,
+            "distance_bin_min": lower,
+            "distance_bin_max": upper,
+            "count": count,
+            "mean": mean,
+            "median": median,
+            "std": std,
+            "std_error": std_error,
+        }
+        for center, lower, upper, count, mean, median, std, std_error in zip(
+            bin_centers[nonempty].tolist(),
+            bin_edges[:-1][nonempty].tolist(),
+            bin_edges[1:][nonempty].tolist(),
+            counts[nonempty].tolist(),
+            means[nonempty].tolist(),
+            medians[nonempty].tolist(),
+            stds[nonempty].tolist(),
+            std_errors[nonempty].tolist(),
+            strict=True,
+        )
+    ]
 
-    # Overall correlation analysis
-    correlation_coef, correlation_p = stats.pearsonr(distances, anomalies)
-    spearman_coef, spearman_p = stats.spearmanr(distances, anomalies)
+    # Overall correlation analysis; the centered sums are shared with the
+    # linear regression
+    distance_sums = _centered_sums(distances, anomalies)
+    correlation_coef, correlation_p = _pearson(distance_sums)
+    spearman_coef, spearman_p = spearmanr(distances, anomalies)
 
     # Linear regression
-    slope, intercept, r_value, p_value, std_err = stats.linregress(distances, anomalies)
+    slope, intercept, r_value, p_value, std_err = _linear_regression(distance_sums)
 
     # City size analysis (if population data available)
     city_size_analysis = {}
     if len(cities_gdf) > 0 and "population" in cities_gdf.columns:
+        # Work on plain coordinate and population arrays; no per-city rows or
+        # per-class frames are built
+        city_populations = cities_gdf["population"].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        all_city_points = _unit_vectors(
+            cities_gdf.geometry.x.to_numpy(), cities_gdf.geometry.y.to_numpy()
+        )
+
         # Categorize cities by size
-        city_populations = cities_gdf["population"]
-        large_cities_threshold = city_populations.quantile(0.75)
-        medium_cities_threshold = city_populations.quantile(0.25)
+        large_cities_threshold, medium_cities_threshold = np.nanquantile(
+            city_populations, [0.75, 0.25]
+        )
+
+        # Station coordinates are extracted and indexed once, shared by every
+        # size class
+        station_geometry = prepared.geometry[valid]
+        station_tree = cKDTree(
+            _unit_vectors(station_geometry.x.to_numpy(), station_geometry.y.to_numpy())
+        )
 
         # Analyze gradients by city size
         for city_size, threshold in [
@@ -230,48 +426,30 @@ def analyze_distance_gradients(
             ("medium", medium_cities_threshold),
         ]:
             if city_size == "large":
-                city_mask = cities_gdf["population"] >= threshold
+                city_mask = city_populations >= threshold
             else:
-                city_mask = (cities_gdf["population"] >= threshold) & (
-                    cities_gdf["population"] < large_cities_threshold
+                city_mask = (city_populations >= threshold) & (
+                    city_populations < large_cities_threshold
                 )
 
-            large_cities = cities_gdf[city_mask]
+            city_points = all_city_points[city_mask]
 
-            if len(large_cities) > 0:
-                # Find stations near these cities
-                city_analysis_data = []
-                for _, city in large_cities.iterrows():
-                    # Find stations within max_distance of this city
-                    city_point = np.array([[city.geometry.x, city.geometry.y]])
-                    station_points = np.array(
-                        [[pt.x, pt.y] for pt in clean_data.geometry]
-                    )
+            if len(city_points) > 0:
+                # Station/city pairs within max_distance, grouped by city
+                _, station_idx, pair_distances = _nearby_pairs(
+                    station_tree, city_points, max_distance
+                )
 
-                    distances_to_city = (
-                        cdist(station_points, city_point).flatten() * 111
-                    )  # Convert to km
-                    nearby_mask = distances_to_city <= max_distance
-
-                    if np.any(nearby_mask):
-                        nearby_stations = clean_data[nearby_mask].copy()
-                        nearby_stations["distance_to_this_city"] = distances_to_city[
-                            nearby_mask
-                        ]
-                        city_analysis_data.append(nearby_stations)
-
-                if city_analysis_data:
-                    combined_data = pd.concat(city_analysis_data, ignore_index=True)
-                    city_correlation, city_p = stats.pearsonr(
-                        combined_data["distance_to_this_city"],
-                        combined_data[anomaly_col],
+                if len(station_idx) > 0:
+                    city_correlation, city_p = _pearson(
+                        _centered_sums(pair_distances, anomalies[station_idx])
                     )
 
                     city_size_analysis[f"{city_size}_cities"] = {
-                        "count_cities": int(len(large_cities)),
+                        "count_cities": int(len(city_points)),
                         "correlation_coefficient": float(city_correlation),
                         "correlation_p_value": float(city_p),
-                        "stations_analyzed": int(len(combined_data)),
+                        "stations_analyzed": int(len(station_idx)),
                     }
 
     return {
@@ -293,11 +471,271 @@ def analyze_distance_gradients(
         "analysis_parameters": {
             "max_distance_km": float(max_distance),
             "distance_bins": int(distance_bins),
-            "stations_analyzed": int(len(clean_data)),
+            "stations_analyzed": int(len(anomalies)),
         },
     }
 
 
+def _unit_vectors(lon: np.ndarray, lat: np.ndarray) -> np.ndarray:
+    """
+    Convert lon/lat degrees to points on the unit sphere.
+
+    Args:
+        lon: Longitudes (degrees)
+        lat: Latitudes (degrees)
+
+    Returns:
+        Array of (x, y, z) coordinates, shape (points, 3)
+    """
+    lon_rad = np.radians(lon)
+    lat_rad = np.radians(lat)
+    cos_lat = np.cos(lat_rad)
+    return np.column_stack(
+        [cos_lat * np.cos(lon_rad), cos_lat * np.sin(lon_rad), np.sin(lat_rad)]
+    )
+
+
+def _nearby_pairs(
+    station_tree: cKDTree, city_points: np.ndarray, max_distance: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find every station within max_distance of each city using a spatial index.
+
+    Points live on the unit sphere, where the straight-line (chord) distance
+    increases monotonically with the great-circle distance. The tree is queried
+    with the chord of max_distance, and the chord c of each pair is converted to
+    the haversine distance 2 * R * arcsin(c / 2).
+
+    Args:
+        station_tree: KD-tree over station unit vectors
+        city_points: Array of city unit vectors, shape (cities, 3)
+        max_distance: Maximum great-circle distance (km)
+
+    Returns:
+        Tuple of (city index, station index, distance in km) arrays, one entry
+        per pair, ordered by city and then station
+    """
+    # Query a hair beyond the radius and apply the exact km cut-off below, so
+    # rounding in the chord conversion cannot drop pairs on the boundary
+    chord = 2 * np.sin(min(max_distance / (2 * _EARTH_RADIUS_KM), np.pi / 2))
+    neighbours = station_tree.query_ball_point(
+        city_points,
+        r=chord * (1 + 1e-9),
+        return_sorted=True,
+        workers=-1,
+    )
+    counts = np.fromiter(map(len, neighbours), dtype=np.intp, count=len(neighbours))
+    city_idx = np.repeat(np.arange(len(city_points)), counts)
+    station_idx = (
+        np.concatenate(neighbours).astype(np.intp)
+        if counts.sum()
+        else np.empty(0, dtype=np.intp)
+    )
+
+    offsets = station_tree.data[station_idx] - city_points[city_idx]
+    chords = np.sqrt((offsets * offsets).sum(axis=1))
+    distances = 2 * _EARTH_RADIUS_KM * np.arcsin(np.minimum(chords / 2, 1.0))
+
+    within = distances <= max_distance
+    return city_idx[within], station_idx[within], distances[within]
+
+
+class _CenteredSums(NamedTuple):
+    """Means and centered sums of squares and cross products of paired samples."""
+
+    n: int
+    x_mean: float
+    y_mean: float
+    sxx: float
+    syy: float
+    sxy: float
+
+
+def _centered_sums(x: np.ndarray, y: np.ndarray) -> _CenteredSums:
+    """
+    Calculate the sums shared by the Pearson correlation and linear regression.
+
+    Args:
+        x: First array of values
+        y: Second array of values, same length as x
+
+    Returns:
+        Centered sums of the paired samples
+    """
+    # Deviations are taken from float64 means, so float32 input accumulates
+    # in float64
+    x_mean = x.mean(dtype=np.float64)
+    y_mean = y.mean(dtype=np.float64)
+    x_dev = x - x_mean
+    y_dev = y - y_mean
+    return _CenteredSums(
+        n=len(x),
+        x_mean=x_mean,
+        y_mean=y_mean,
+        sxx=np.dot(x_dev, x_dev),
+        syy=np.dot(y_dev, y_dev),
+        sxy=np.dot(x_dev, y_dev),
+    )
+
+
+def _pearson(sums: _CenteredSums) -> tuple[float, float]:
+    """
+    Calculate the Pearson correlation and two-sided p-value from centered sums.
+
+    Equivalent to scipy.stats.pearsonr for 1-D arrays, without its input validation
+    and result-object overhead.
+
+    Args:
+        sums: Centered sums from _centered_sums
+
+    Returns:
+        Tuple of (correlation coefficient, p-value); both NaN for constant input
+    """
+    n = sums.n
+    if n < 2:
+        raise ValueError("`x` and `y` must have length at least 2.")
+
+    denominator = np.sqrt(sums.sxx * sums.syy)
+    if denominator == 0:
+        return np.nan, np.nan
+
+    r = float(np.clip(sums.sxy / denominator, -1.0, 1.0))
+    if n == 2:
+        return float(np.round(r)), 1.0
+
+    # Under the null hypothesis r follows a beta distribution on (-1, 1)
+    shape = n / 2 - 1
+    return r, float(2 * beta.sf(abs(r), shape, shape, loc=-1, scale=2))
+
+
+def _linear_regression(
+    sums: _CenteredSums,
+) -> tuple[float, float, float, float, float]:
+    """
+    Calculate a least-squares line from centered sums, as scipy.stats.linregress does.
+
+    Args:
+        sums: Centered sums from _centered_sums
+
+    Returns:
+        Tuple of (slope, intercept, r, two-sided p-value, slope standard error)
+    """
+    n, x_mean, y_mean, sxx, syy, sxy = sums
+    if sxx == 0:
+        raise ValueError(
+            "Cannot calculate a linear regression if all x values are identical"
+        )
+
+    # r is undefined (NaN) when all y values are identical
+    with np.errstate(invalid="ignore", divide="ignore"):
+        r = float(np.clip(sxy / np.sqrt(sxx * syy), -1.0, 1.0))
+    slope = sxy / sxx
+    intercept = y_mean - slope * x_mean
+
+    if n == 2:
+        # A line through two points fits exactly
+        p_value = 1.0 if syy == 0 else 0.0
+        return slope, intercept, r, p_value, 0.0
+
+    df = n - 2
+    tiny = 1.0e-20  # Same guard as linregress against division by zero at |r| = 1
+    t_stat = r * np.sqrt(df / ((1.0 - r + tiny) * (1.0 + r + tiny)))
+    p_value = float(2 * student_t.sf(abs(t_stat), df))
+    std_err = np.sqrt((1 - r**2) * syy / sxx / df)
+    return slope, intercept, r, p_value, std_err
+
+
+def _binned_statistics(
+    distances: np.ndarray, anomalies: np.ndarray, bin_edges: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate per-bin anomaly statistics in a few vectorized passes.
+
+    Bins are half-open [edge_i, edge_i+1), so values equal to the last edge fall
+    outside every bin.
+
+    Args:
+        distances: Distance of each station to its nearest city (km)
+        anomalies: Temperature anomaly of each station
+        bin_edges: Monotonically increasing bin edges
+
+    Returns:
+        Tuple of (count, mean, median, sample std) arrays with one entry per bin;
+        statistics of empty bins are NaN
+    """
+    n_bins = len(bin_edges) - 1
+    bin_idx = np.searchsorted(bin_edges, distances, side="right") - 1
+    in_range = (bin_idx >= 0) & (bin_idx < n_bins)
+    bin_idx = bin_idx[in_range]
+    values = anomalies[in_range]
+
+    counts = np.bincount(bin_idx, minlength=n_bins)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.bincount(bin_idx, weights=values, minlength=n_bins) / counts
+        # Squared deviations from each bin's mean, matching pandas' ddof=1 std;
+        # squared in place to avoid a second temporary array
+        deviations = values - means[bin_idx]
+        deviations *= deviations
+        squared_dev = np.bincount(bin_idx, weights=deviations, minlength=n_bins)
+        stds = np.sqrt(squared_dev / (counts - 1))
+    stds[counts == 0] = np.nan  # 0 / -1 would otherwise give -0.0
+
+    # Medians from the middle of each bin's run after sorting by (bin, value)
+    sorted_values = values[np.lexsort((values, bin_idx))]
+    starts = np.cumsum(counts) - counts
+    medians = np.full(n_bins, np.nan)
+    nonempty = counts > 0
+    lower = starts[nonempty] + (counts[nonempty] - 1) // 2
+    upper = starts[nonempty] + counts[nonempty] // 2
+    medians[nonempty] = (sorted_values[lower] + sorted_values[upper]) / 2
+
+    return counts, means, medians, stds
+
+
+def _moments(
+    values: np.ndarray, ddof: int = 0, where: np.ndarray | None = None
+) -> tuple[int, float, float]:
+    """
+    Calculate count, mean and standard deviation in two passes over the values.
+
+    The squared deviations are summed after centering on the mean, as in
+    _centered_sums, so a large common offset does not cancel catastrophically.
+
+    Args:
+        values: Array of values
+        ddof: Delta degrees of freedom for the standard deviation
+        where: Optional boolean mask of the values to include; without it all
+            values are used and must not contain NaN
+
+    Returns:
+        Tuple of (count, mean, std); std is NaN when count <= ddof
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if where is None:
+        n = values.size
+        mean = values.sum() / n
+        deviations = values - mean
+        squared_dev = np.dot(deviations, deviations)
+    else:
+        # Masked reductions skip excluded values without compacting a copy
+        n = int(np.count_nonzero(where))
+        mean = np.add.reduce(values, where=where) / n
+        deviations = values - mean
+        squared_dev = np.add.reduce(deviations * deviations, where=where)
+
+    if n <= ddof:
+        return n, mean, np.float64(np.nan)
+
+    return n, mean, np.sqrt(squared_dev / (n - ddof))
+
+
+def _sample_std(population_std: float, n: int) -> float:
+    """Convert a population (ddof=0) standard deviation to a sample (ddof=1) one."""
+    if n < 2:
+        return np.nan
+    return population_std * np.sqrt(n / (n - 1))
+
+
 def calculate_heat_island_intensity(
     urban_temps: np.ndarray, rural_temps: np.ndarray
 ) -> dict[str, float]:
@@ -314,36 +752,47 @@ def calculate_heat_island_intensity(
     if len(urban_temps) == 0 or len(rural_temps) == 0:
         return {"error": "Insufficient data for UHII calculation", "uhii_celsius": float("nan"), "urban_mean": float("nan"), "rural_mean": float("nan")}
 
-    # Remove NaN values
-    urban_clean = urban_temps[~np.isnan(urban_temps)]
-    rural_clean = rural_temps[~np.isnan(rural_temps)]
+    # Ignore NaN values through masks rather than compacted copies
+    urban_valid = ~np.isnan(urban_temps)
+    rural_valid = ~np.isnan(rural_temps)
 
-    if len(urban_clean) == 0 or len(rural_clean) == 0:
+    if not urban_valid.any() or not rural_valid.any():
         return {"error": "No valid temperature data after cleaning", "uhii_celsius": float("nan"), "urban_mean": float("nan"), "rural_mean": float("nan")}
 
+    urban_count, urban_mean, urban_std = _moments(urban_temps, where=urban_valid)
+    rural_count, rural_mean, rural_std = _moments(rural_temps, where=rural_valid)
+
     # Urban Heat Island Intensity
-    uhii = float(np.mean(urban_clean) - np.mean(rural_clean))
+    uhii = float(urban_mean - rural_mean)
 
     # Standard errors
-    urban_se = float(np.std(urban_clean) / np.sqrt(len(urban_clean)))
-    rural_se = float(np.std(rural_clean) / np.sqrt(len(rural_clean)))
+    urban_se = float(urban_std / np.sqrt(urban_count))
+    rural_se = float(rural_std / np.sqrt(rural_count))
     uhii_se = float(np.sqrt(urban_se**2 + rural_se**2))
 
     # Confidence intervals (95%)
     ci_margin = 1.96 * uhii_se
 
-    # Statistical significance test
-    t_stat, p_value = stats.ttest_ind(urban_clean, rural_clean)
+    # Statistical significance test from the moments, using the t-test's
+    # sample (ddof=1) standard deviations
+    t_stat, p_value = ttest_ind_from_stats(
+        urban_mean,
+        _sample_std(urban_std, urban_count),
+        urban_count,
+        rural_mean,
+        _sample_std(rural_std, rural_count),
+        rural_count,
+    )
 
     return {
         "uhii_celsius": uhii,
         "uhii_standard_error": uhii_se,
         "uhii_95_ci_lower": uhii - ci_margin,
         "uhii_95_ci_upper": uhii + ci_margin,
-        "urban_mean": float(np.mean(urban_clean)),
-        "rural_mean": float(np.mean(rural_clean)),
-        "urban_count": int(len(urban_clean)),
-        "rural_count": int(len(rural_clean)),
+        "urban_mean": float(urban_mean),
+        "rural_mean": float(rural_mean),
+        "urban_count": int(urban_count),
+        "rural_count": int(rural_count),
         "t_statistic": float(t_stat),
         "p_value": float(p_value),
         "statistically_significant": bool(p_value < 0.05),
@@ -354,6 +803,7 @@ def generate_heat_island_report(
     results_gdf: gpd.GeoDataFrame,
     urban_context: dict[str, Any],
     cities_gdf: gpd.GeoDataFrame | None = None,
+    compare_only: bool = False,
 ) -> dict[str, Any]:
     """
     Generate comprehensive heat island analysis report.
@@ -362,6 +812,8 @@ def generate_heat_island_report(
         results_gdf: GeoDataFrame with anomaly results and urban classification
         urban_context: Urban context summary from UrbanContextManager
         cities_gdf: GeoDataFrame with city locations for gradient analysis
+        compare_only: Only compute the urban vs rural comparison, leaving the
+            report's statistics_by_classification empty
 
     Returns:
         Comprehensive heat island analysis report
@@ -375,17 +827,30 @@ def generate_heat_island_report(
     }
 
     try:
-        # Urban vs Rural statistical analysis
-        urban_rural_stats = calculate_urban_rural_statistics(results_gdf)
-        report["urban_rural_analysis"] = urban_rural_stats
-
-        # Distance gradient analysis (if cities data available)
-        if cities_gdf is not None and len(cities_gdf) > 0:
-            try:
-                gradient_analysis = analyze_distance_gradients(results_gdf, cities_gdf)
-                report["distance_gradient_analysis"] = gradient_analysis
-            except Exception as e:
-                report["distance_gradient_analysis"] = {"error": str(e)}
+        # Extract the analysed columns once and share them between analyses
+        prepared = _prepare_results(results_gdf)
+
+        # The two analyses are independent and spend most of their time in
+        # NumPy/SciPy kernels that release the GIL, so the distance gradients
+        # run on a worker thread while the urban/rural statistics are computed
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Distance gradient analysis (if cities data available)
+            gradient_future = (
+                executor.submit(_distance_gradients, prepared, cities_gdf)
+                if cities_gdf is not None and len(cities_gdf) > 0
+                else None
+            )
+
+            # Urban vs Rural statistical analysis
+            urban_rural_stats = _urban_rural_statistics(prepared, compare_only)
+            report["urban_rural_analysis"] = urban_rural_stats
+
+            if gradient_future is not None:
+                try:
+                    gradient_analysis = gradient_future.result()
+                    report["distance_gradient_analysis"] = gradient_analysis
+                except Exception as e:
+                    report["distance_gradient_analysis"] = {"error": str(e)}
 
         # Heat island intensity summary
         if "urban_vs_rural_comparison" in urban_rural_stats:
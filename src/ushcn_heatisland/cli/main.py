@@ -1,26 +1,85 @@
 """Main CLI interface for USHCN Heat Island Analysis."""
 
+from concurrent.futures import ThreadPoolExecutor
 import json
 from pathlib import Path
-from typing import Literal, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 import typer
 
 from ..analysis.anomaly import get_algorithm, list_algorithms
-from ..analysis.heat_island import generate_heat_island_report
-from ..data.loaders import load_ushcn_data
-from ..plotting import (
-    create_summary_statistics,
-    plot_anomaly_map,
-    plot_comparison_maps,
-    plot_enhanced_contour_map,
-    plot_heat_island_map,
-)
-from ..urban.context import UrbanContextManager
+
+if TYPE_CHECKING:
+    import geopandas as gpd
+
+    from ..urban.context import UrbanContextManager
 
 app = typer.Typer(help="US Long-Term Temperature Change Analyzer")
 
 
+def _json_default(value: Any) -> Any:
+    """Convert numpy scalars and arrays that the json module cannot encode."""
+    # numpy scalars and arrays both convert to Python objects with tolist();
+    # duck typing avoids importing numpy for commands that write no JSON
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _load_urban_context(
+    city_population_threshold: int,
+) -> tuple["UrbanContextManager", "gpd.GeoDataFrame", "gpd.GeoDataFrame"]:
+    """
+    Load the cities and urban areas used for station classification.
+
+    Args:
+        city_population_threshold: Minimum city population to include
+
+    Returns:
+        Tuple of (urban context manager, cities, urban areas)
+    """
+    from ..urban.context import UrbanContextManager
+
+    urban_context_manager = UrbanContextManager()
+    cities_gdf = urban_context_manager.load_cities_data(
+        min_population=city_population_threshold
+    )
+    urban_areas_gdf = urban_context_manager.load_urban_areas()
+    return urban_context_manager, cities_gdf, urban_areas_gdf
+
+
+def _write_statistics(results: "gpd.GeoDataFrame", path: Path) -> dict[str, Any]:
+    """
+    Compute the summary statistics for analysis results and save them as JSON.
+
+    Args:
+        results: Anomaly results from the algorithm
+        path: Output file path
+
+    Returns:
+        Summary statistics dictionary
+    """
+    from ..plotting import create_summary_statistics
+
+    stats = create_summary_statistics(results)
+    _write_json(path, stats)
+    return stats
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    """
+    Write a report dictionary as indented JSON.
+
+    The document is encoded in one pass and written with a single call, rather
+    than streamed through json.dump's many small writes.
+
+    Args:
+        path: Output file path
+        data: Report dictionary, which may contain numpy scalars
+    """
+    path.write_text(json.dumps(data, indent=2, default=_json_default))
+
+
 @app.command()
 def analyze(
     algorithm: str = typer.Argument(
@@ -101,49 +160,41 @@ def analyze(
     data_type: str = typer.Option(
         "fls52", help="Data type to analyze: raw, tob, or fls52"
     ),
+    n_jobs: int = typer.Option(
+        1, help="Worker threads for the per-station accumulation in the algorithm"
+    ),
 ) -> None:
     """Run temperature anomaly analysis with specified algorithm."""
 
-    # Validate algorithm
-    available_algorithms = list_algorithms()
-    if algorithm not in available_algorithms:
-        typer.echo(f"Error: Unknown algorithm '{algorithm}'")
-        typer.echo(f"Available algorithms: {', '.join(available_algorithms)}")
-        raise typer.Exit(1)
-
-    # Validate temperature metric
-    valid_metrics = ["min", "max", "avg"]
-    if temp_metric not in valid_metrics:
-        typer.echo(f"Error: Unknown temperature metric '{temp_metric}'")
-        typer.echo(f"Valid metrics: {', '.join(valid_metrics)}")
-        raise typer.Exit(1)
-
-    # Validate visualization type
-    valid_viz_types = ["points", "contours"]
-    if visualization_type not in valid_viz_types:
-        typer.echo(f"Error: Unknown visualization type '{visualization_type}'")
-        typer.echo(f"Valid types: {', '.join(valid_viz_types)}")
-        raise typer.Exit(1)
-
-    # Validate interpolation method
-    valid_interp_methods = ["linear", "cubic", "nearest"]
-    if interpolation_method not in valid_interp_methods:
-        typer.echo(f"Error: Unknown interpolation method '{interpolation_method}'")
-        typer.echo(f"Valid methods: {', '.join(valid_interp_methods)}")
-        raise typer.Exit(1)
-
-    # Validate mask type
-    valid_mask_types = ["none", "land", "confidence"]
-    if mask_type not in valid_mask_types:
-        typer.echo(f"Error: Unknown mask type '{mask_type}'")
-        typer.echo(f"Valid types: {', '.join(valid_mask_types)}")
-        raise typer.Exit(1)
-
-    # Validate data type
-    valid_data_types = ["raw", "tob", "fls52"]
-    if data_type not in valid_data_types:
-        typer.echo(f"Error: Unknown data type '{data_type}'")
-        typer.echo(f"Valid types: {', '.join(valid_data_types)}")
+    # Validate choice options; each entry is (option label, value, allowed
+    # values, label for the allowed values)
+    choices = (
+        ("algorithm", algorithm, tuple(list_algorithms()), "Available algorithms"),
+        ("temperature metric", temp_metric, ("min", "max", "avg"), "Valid metrics"),
+        (
+            "visualization type",
+            visualization_type,
+            ("points", "contours"),
+            "Valid types",
+        ),
+        (
+            "interpolation method",
+            interpolation_method,
+            ("linear", "cubic", "nearest"),
+            "Valid methods",
+        ),
+        ("mask type", mask_type, ("none", "land", "confidence"), "Valid types"),
+        ("data type", data_type, ("raw", "tob", "fls52"), "Valid types"),
+    )
+    for label, value, allowed, allowed_label in choices:
+        if value not in allowed:
+            typer.echo(f"Error: Unknown {label} '{value}'")
+            typer.echo(f"{allowed_label}: {', '.join(allowed)}")
+            raise typer.Exit(1)
+
+    # Validate worker count
+    if n_jobs < 1:
+        typer.echo(f"Error: --n-jobs must be at least 1, got {n_jobs}")
         raise typer.Exit(1)
 
     # Set default output directory
@@ -157,22 +208,22 @@ def analyze(
     typer.echo(f"Visualization type: {visualization_type}")
     baseline_end = baseline_start_year + period_length - 1
     current_end = current_start_year + period_length - 1
+
+    # Labels shared by the plot titles and output file names
+    metric_title = temp_metric.title()
+    period_label = (
+        f"({baseline_start_year}-{baseline_end} vs {current_start_year}-{current_end})"
+    )
+    output_prefix = f"{algorithm}_{temp_metric}"
     typer.echo(f"Baseline period: {baseline_start_year}-{baseline_end}")
     typer.echo(f"Current period: {current_start_year}-{current_end}")
     typer.echo(f"Output directory: {output_dir}")
 
+    # The data, urban and plotting modules pull in pyarrow, geopandas,
+    # matplotlib and contextily, so each is imported only by the step that
+    # needs it, keeping --help and list-algos fast
     try:
-        # Load data
-        typer.echo("Loading USHCN data...")
-        load_raw = algorithm == "adjustment_impact"
-
-        adjusted_data, raw_data = load_ushcn_data(
-            data_dir,
-            adjusted_type=cast(Literal["raw", "tob", "fls52"], data_type),
-            raw_type="raw",
-            load_raw=load_raw,
-            temp_metric=cast(Literal["min", "max", "avg"], temp_metric),
-        )
+        from ..data.loaders import load_ushcn_data
 
         # Initialize urban context if needed
         urban_context_manager = None
@@ -180,7 +231,7 @@ def analyze(
         urban_areas_gdf = None
         urban_context_summary = None
 
-        if any(
+        need_urban_context = any(
             [
                 show_cities,
                 show_urban_areas,
@@ -189,17 +240,38 @@ def analyze(
                 heat_island_report,
                 gradient_analysis,
             ]
-        ):
-            typer.echo("Loading urban context data...")
-            urban_context_manager = UrbanContextManager()
-            cities_gdf = urban_context_manager.load_cities_data(
-                min_population=city_population_threshold
-            )
-            urban_areas_gdf = urban_context_manager.load_urban_areas()
-            typer.echo(
-                f"Loaded {len(cities_gdf)} cities and {len(urban_areas_gdf)} urban areas"
+        )
+
+        # The urban context does not depend on the USHCN data, so it loads on a
+        # worker thread while the USHCN files are read
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            urban_future = None
+            if need_urban_context:
+                typer.echo("Loading urban context data...")
+                urban_future = executor.submit(
+                    _load_urban_context, city_population_threshold
+                )
+
+            # Load data
+            typer.echo("Loading USHCN data...")
+            load_raw = algorithm == "adjustment_impact"
+
+            adjusted_data, raw_data = load_ushcn_data(
+                data_dir,
+                adjusted_type=cast(Literal["raw", "tob", "fls52"], data_type),
+                raw_type="raw",
+                load_raw=load_raw,
+                temp_metric=cast(Literal["min", "max", "avg"], temp_metric),
             )
 
+            if urban_future is not None:
+                urban_context_manager, cities_gdf, urban_areas_gdf = (
+                    urban_future.result()
+                )
+                typer.echo(
+                    f"Loaded {len(cities_gdf)} cities and {len(urban_areas_gdf)} urban areas"
+                )
+
         typer.echo(f"Loaded {len(adjusted_data)} adjusted data records")
         if raw_data is not None:
             typer.echo(f"Loaded {len(raw_data)} raw data records")
@@ -208,6 +280,8 @@ def analyze(
         config = {}
         if min_observations is not None:
             config["min_observations"] = min_observations
+        if n_jobs > 1:
+            config["n_jobs"] = n_jobs
 
         # Run analysis
         typer.echo("Running analysis...")
@@ -243,38 +317,42 @@ def analyze(
 
         typer.echo(f"Analysis complete! Found results for {len(results)} stations")
 
-        # Generate statistics
-        stats = create_summary_statistics(results)
-        stats_file = output_dir / f"{algorithm}_{temp_metric}_statistics.json"
-        with open(stats_file, "w") as f:
-            json.dump(stats, f, indent=2)
-        typer.echo(f"Statistics saved to: {stats_file}")
+        from ..plotting import (
+            plot_anomaly_map,
+            plot_comparison_maps,
+            plot_enhanced_contour_map,
+            plot_heat_island_map,
+        )
+
+        # Generate statistics on a worker thread while the maps render; both only
+        # read the results. shutdown(wait=False) lets the worker finish this one
+        # task and exit, and the result is collected after plotting
+        stats_file = output_dir / f"{output_prefix}_statistics.json"
+        stats_executor = ThreadPoolExecutor(max_workers=1)
+        stats_future = stats_executor.submit(_write_statistics, results, stats_file)
+        stats_executor.shutdown(wait=False)
 
         # Create visualizations
         typer.echo("Creating visualizations...")
 
         if algorithm == "adjustment_impact":
             # Create comparison maps for adjustment impact
-            title = f"{temp_metric.title()} Temperature Anomaly Analysis ({baseline_start_year}-{baseline_end} vs {current_start_year}-{current_end})"
-            plot_comparison_maps(
-                results, title, output_dir, temp_metric=temp_metric.title()
-            )
+            title = f"{metric_title} Temperature Anomaly Analysis {period_label}"
+            plot_comparison_maps(results, title, output_dir, temp_metric=metric_title)
 
         else:
             # Create visualization based on type
-            title = f"{algorithm.title()} Algorithm: {temp_metric.title()} Temperature Anomalies ({baseline_start_year}-{baseline_end} vs {current_start_year}-{current_end})"
+            title = f"{algorithm.title()} Algorithm: {metric_title} Temperature Anomalies {period_label}"
 
             if visualization_type == "contours":
                 # Check if we should use heat island visualization
                 if any([show_cities, show_urban_areas, classify_stations]):
-                    output_path = (
-                        output_dir / f"{algorithm}_{temp_metric}_heat_island_map.png"
-                    )
+                    output_path = output_dir / f"{output_prefix}_heat_island_map.png"
                     fig, coverage_report = plot_heat_island_map(
                         results,
                         title,
                         output_path,
-                        temp_metric=temp_metric.title(),
+                        temp_metric=metric_title,
                         grid_resolution=grid_resolution,
                         interpolation_method=interpolation_method,
                         show_stations=show_stations,
@@ -296,14 +374,12 @@ def analyze(
                         urban_areas_gdf=urban_areas_gdf,
                     )
                 else:
-                    output_path = (
-                        output_dir / f"{algorithm}_{temp_metric}_contour_map.png"
-                    )
+                    output_path = output_dir / f"{output_prefix}_contour_map.png"
                     fig, coverage_report = plot_enhanced_contour_map(
                         results,
                         title,
                         output_path,
-                        temp_metric=temp_metric.title(),
+                        temp_metric=metric_title,
                         grid_resolution=grid_resolution,
                         interpolation_method=interpolation_method,
                         show_stations=show_stations,
@@ -320,32 +396,26 @@ def analyze(
 
                 # Save coverage report if generated
                 if coverage_report and show_coverage_report:
-                    coverage_file = (
-                        output_dir / f"{algorithm}_{temp_metric}_coverage_report.json"
-                    )
-                    with open(coverage_file, "w") as f:
-                        json.dump(coverage_report, f, indent=2)
+                    coverage_file = output_dir / f"{output_prefix}_coverage_report.json"
+                    _write_json(coverage_file, coverage_report)
                     typer.echo(f"Coverage report saved to: {coverage_file}")
 
             elif visualization_type == "points":
                 # Create basic point visualization
-                output_path = output_dir / f"{algorithm}_{temp_metric}_anomaly_map.png"
-                plot_anomaly_map(
-                    results, title, output_path, temp_metric=temp_metric.title()
-                )
+                output_path = output_dir / f"{output_prefix}_anomaly_map.png"
+                plot_anomaly_map(results, title, output_path, temp_metric=metric_title)
 
         # Generate heat island analysis report if requested
         if heat_island_report and urban_context_summary is not None:
+            from ..analysis.heat_island import generate_heat_island_report
+
             typer.echo("Generating heat island analysis report...")
             heat_island_analysis = generate_heat_island_report(
                 results, urban_context_summary, cities_gdf
             )
 
-            report_file = (
-                output_dir / f"{algorithm}_{temp_metric}_heat_island_report.json"
-            )
-            with open(report_file, "w") as f:
-                json.dump(heat_island_analysis, f, indent=2)
+            report_file = output_dir / f"{output_prefix}_heat_island_report.json"
+            _write_json(report_file, heat_island_analysis)
             typer.echo(f"Heat island report saved to: {report_file}")
 
             # Print heat island summary
@@ -363,6 +433,9 @@ def analyze(
 
         typer.echo("Visualization complete!")
 
+        stats = stats_future.result()
+        typer.echo(f"Statistics saved to: {stats_file}")
+
         # Print summary
         typer.echo("\n=== Analysis Summary ===")
         typer.echo(f"Algorithm: {algorithm}")
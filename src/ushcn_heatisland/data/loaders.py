@@ -1,11 +1,19 @@
 """Data loading utilities for USHCN datasets."""
 
+import functools
 from pathlib import Path
 from typing import Literal
 
 import geopandas as gpd
 import pandas as pd
-from shapely.geometry import Point
+import pyarrow.dataset as ds
+
+__all__ = [
+    "load_all_ushcn_stations",
+    "load_station_locations",
+    "load_ushcn_data",
+    "load_ushcn_monthly_data",
+]
 
 
 def load_station_locations(daily_data_path: Path) -> gpd.GeoDataFrame:
@@ -18,11 +26,14 @@ def load_station_locations(daily_data_path: Path) -> gpd.GeoDataFrame:
     Returns:
         GeoDataFrame with unique station locations
     """
-    df_daily = pd.read_parquet(daily_data_path)
-    stations = df_daily[["id", "lat", "lon"]].drop_duplicates()
+    # Only the location columns are needed, so skip decoding the rest
+    df_daily = pd.read_parquet(daily_data_path, columns=["id", "lat", "lon"])
+    stations = df_daily.drop_duplicates()
 
-    geometry = [Point(xy) for xy in zip(stations["lon"], stations["lat"])]
-    gdf_stations = gpd.GeoDataFrame(stations, geometry=geometry, crs="EPSG:4326")
+    geometry = gpd.points_from_xy(
+        stations["lon"].to_numpy(), stations["lat"].to_numpy(), crs="EPSG:4326"
+    )
+    gdf_stations = gpd.GeoDataFrame(stations, geometry=geometry)
 
     # Ensure we return a GeoDataFrame by explicitly casting
     result = gdf_stations.set_index("id")
@@ -48,15 +59,18 @@ def load_all_ushcn_stations(data_dir: Path) -> gpd.GeoDataFrame:
     if not monthly_files:
         raise FileNotFoundError("No monthly data files found in data directory")
 
-    # Use the first monthly file (any will work since they have the same stations)
-    df_monthly = pd.read_parquet(monthly_files[0])
+    # Use the first monthly file (any will work since they have the same stations),
+    # reading only the location columns
+    df_monthly = pd.read_parquet(monthly_files[0], columns=["id", "lat", "lon"])
 
     # Get unique stations with their locations
-    stations = df_monthly[["id", "lat", "lon"]].drop_duplicates()
+    stations = df_monthly.drop_duplicates()
 
     # Create GeoDataFrame
-    geometry = [Point(xy) for xy in zip(stations["lon"], stations["lat"])]
-    gdf_stations = gpd.GeoDataFrame(stations, geometry=geometry, crs="EPSG:4326")
+    geometry = gpd.points_from_xy(
+        stations["lon"].to_numpy(), stations["lat"].to_numpy(), crs="EPSG:4326"
+    )
+    gdf_stations = gpd.GeoDataFrame(stations, geometry=geometry)
 
     # Set station ID as index
     result = gdf_stations.set_index("id")
@@ -67,9 +81,13 @@ def load_ushcn_monthly_data(
     file_path: Path,
     data_type: Literal["raw", "tob", "fls52"] = "fls52",
     temp_metric: Literal["min", "max", "avg"] = "min",
-) -> gpd.GeoDataFrame:
+) -> pd.DataFrame:
     """
-    Load USHCN monthly data from parquet file and convert to GeoDataFrame.
+    Load USHCN monthly data from parquet file into a standardized DataFrame.
+
+    Parsed files are cached per (file, modification time, data_type,
+    temp_metric). Each call returns its own copy of the cached frame, so callers
+    may modify the result without affecting later loads.
 
     Args:
         file_path: Path to the parquet file
@@ -77,7 +95,8 @@ def load_ushcn_monthly_data(
         temp_metric: Temperature metric to use ("min", "max", or "avg")
 
     Returns:
-        GeoDataFrame with USHCN temperature data
+        DataFrame with USHCN temperature data (station_id, timestamp,
+        temperature_celsius, lat, lon, year)
 
     Raises:
         FileNotFoundError: If the file doesn't exist
@@ -86,36 +105,61 @@ def load_ushcn_monthly_data(
     if not file_path.exists():
         raise FileNotFoundError(f"Data file not found: {file_path}")
 
-    # Load parquet file
-    df = pd.read_parquet(file_path)
+    # Copying the columns is far cheaper than re-reading the file, and keeps the
+    # cached frame private
+    return _load_ushcn_monthly_data_cached(
+        str(file_path), file_path.stat().st_mtime_ns, data_type, temp_metric
+    ).copy()
+
 
-    # Convert date column to datetime
-    df["date"] = pd.to_datetime(df["date"])
+@functools.lru_cache(maxsize=4)
+def _load_ushcn_monthly_data_cached(
+    file_path: str,
+    mtime_ns: int,
+    data_type: Literal["raw", "tob", "fls52"],
+    temp_metric: Literal["min", "max", "avg"],
+) -> pd.DataFrame:
+    """Load and convert a monthly file; mtime_ns invalidates stale entries."""
+    dataset = ds.dataset(file_path, format="parquet")
 
     # Select temperature column based on metric and data_type
     temp_col = f"{temp_metric}_{data_type}"
-    if temp_col not in df.columns:
+    if temp_col not in dataset.schema.names:
         raise ValueError(f"Temperature column '{temp_col}' not found in data")
 
+    # Read only the columns we use and drop missing temperatures inside the
+    # parquet reader instead of decoding every metric/type column
+    temperature = ds.field(temp_col)
+    table = dataset.to_table(
+        columns=["id", "date", "lat", "lon", temp_col],
+        filter=temperature.is_valid() & ~temperature.is_nan(),
+    )
+    df = table.to_pandas(categories=["id"])
+
+    # Arrow orders the categories as the ids appear in the file; sort them so
+    # category order is station_id order, which the algorithms' sorted
+    # factorize relies on
+    df["id"] = df["id"].cat.reorder_categories(df["id"].cat.categories.sort_values())
+
     # Create standardized DataFrame
     result_df = pd.DataFrame(
         {
             "station_id": df["id"],
-            "timestamp": df["date"],
-            "temperature_celsius": df[temp_col],
+            "timestamp": pd.to_datetime(df["date"]),
+            "temperature_celsius": df[temp_col].astype("float32"),
             "lat": df["lat"],
             "lon": df["lon"],
         }
     )
 
-    # Remove rows with NaN temperatures
-    result_df = result_df.dropna(subset=["temperature_celsius"])
+    # Derive the year once here so the anomaly algorithms can filter on it
+    # without copying the frame
+    result_df["year"] = result_df["timestamp"].dt.year.astype("int16")
 
-    # Create geometry from lat/lon coordinates
-    geometry = [Point(xy) for xy in zip(result_df["lon"], result_df["lat"])]
-    return gpd.GeoDataFrame(
-        result_df.drop(["lat", "lon"], axis=1), geometry=geometry, crs="EPSG:4326"
-    )
+    # Sort chronologically so each analysis period is a contiguous slice.
+    # Coordinates stay as float columns; point geometries are only built per
+    # station by the anomaly algorithms
+    return result_df.sort_values("timestamp", kind="stable", ignore_index=True)
 
 
 def load_ushcn_data(
@@ -124,7 +168,7 @@ def load_ushcn_data(
     raw_type: Literal["raw", "tob", "fls52"] = "raw",
     load_raw: bool = False,
     temp_metric: Literal["min", "max", "avg"] = "min",
-) -> tuple[gpd.GeoDataFrame, gpd.GeoDataFrame | None]:
+) -> tuple[pd.DataFrame, pd.DataFrame | None]:
     """
     Load USHCN data for analysis.
 
@@ -8,9 +8,12 @@ import geopandas as gpd
 import matplotlib.pyplot as plt
 import numpy as np
 from scipy.interpolate import griddata
-from scipy.spatial.distance import cdist
+from scipy.spatial import cKDTree
 from sklearn.metrics import mean_absolute_error, mean_squared_error
 
+# Mean Earth radius used for great-circle distances (km)
+_EARTH_RADIUS_KM = 6371.0
+
 
 def interpolate_to_grid(
     lats: np.ndarray,
@@ -118,11 +121,12 @@ def analyze_station_coverage(station_coords: np.ndarray) -> dict[str, Any]:
     """
     n_stations = len(station_coords)
 
-    # Calculate nearest neighbor distances
-    distances = cdist(station_coords, station_coords)
-    # Set diagonal to infinity to exclude self-distances
-    np.fill_diagonal(distances, np.inf)
-    nearest_distances = np.min(distances, axis=1)
+    # Calculate nearest neighbor distances; the first of the two neighbours
+    # returned for each station is the station itself
+    neighbour_distances, _ = cKDTree(station_coords).query(
+        station_coords, k=2, workers=-1
+    )
+    nearest_distances = neighbour_distances[:, 1]
 
     # Calculate domain area (approximate continental US)
     lat_range = np.ptp(station_coords[:, 1])
@@ -153,6 +157,24 @@ def analyze_station_coverage(station_coords: np.ndarray) -> dict[str, Any]:
     return coverage_stats
 
 
+def _unit_vectors(coords: np.ndarray) -> np.ndarray:
+    """
+    Convert [lon, lat] degree coordinates to points on the unit sphere.
+
+    Args:
+        coords: Array of [lon, lat] coordinates, shape (points, 2)
+
+    Returns:
+        Array of (x, y, z) coordinates, shape (points, 3)
+    """
+    lon_rad = np.radians(coords[:, 0])
+    lat_rad = np.radians(coords[:, 1])
+    cos_lat = np.cos(lat_rad)
+    return np.column_stack(
+        [cos_lat * np.cos(lon_rad), cos_lat * np.sin(lon_rad), np.sin(lat_rad)]
+    )
+
+
 def create_confidence_mask(
     grid_lats: np.ndarray,
     grid_lons: np.ndarray,
@@ -178,16 +200,26 @@ def create_confidence_mask(
     # Convert grid to coordinate pairs
     grid_points = np.column_stack([grid_lons.ravel(), grid_lats.ravel()])
 
-    # Calculate distances to all stations (in degrees, convert to km later)
-    distances_deg = cdist(grid_points, station_coords)
-    distances_km = distances_deg * 111  # Rough conversion to km
+    # Query a KD-tree over the stations on the unit sphere instead of building
+    # the full grid x station distance matrix. Straight-line (chord) distances
+    # there convert exactly to great-circle km, so no per-degree approximation
+    # is needed
+    station_tree = cKDTree(_unit_vectors(station_coords))
+    grid_vectors = _unit_vectors(grid_points)
 
     # Find nearest station distance for each grid point
-    nearest_distances = np.min(distances_km, axis=1)
+    nearest_chords, _ = station_tree.query(grid_vectors, k=1, workers=-1)
+    nearest_distances = (
+        2 * _EARTH_RADIUS_KM * np.arcsin(np.minimum(nearest_chords / 2, 1.0))
+    )
 
     # Count stations within confidence radius
-    within_radius = distances_km <= confidence_radius_km
-    station_counts = np.sum(within_radius, axis=1)
+    radius_chord = 2 * np.sin(
+        min(confidence_radius_km / (2 * _EARTH_RADIUS_KM), np.pi / 2)
+    )
+    station_counts = station_tree.query_ball_point(
+        grid_vectors, r=radius_chord, workers=-1, return_length=True
+    )
 
     # Initialize confidence mask
     confidence = np.zeros(len(grid_points), dtype=int)
@@ -213,39 +245,36 @@ def create_confidence_mask(
 
 
 def validate_interpolation(
-    station_coords: np.ndarray, values: np.ndarray, method: str = "cubic"
+    station_coords: np.ndarray,
+    values: np.ndarray,
+    method: str = "cubic",
+    estimator: str = "idw",
+    n_neighbors: int = 8,
 ) -> dict[str, float]:
     """
     Perform leave-one-out cross-validation for interpolation quality assessment.
 
+    The default "idw" estimator predicts every station at once by inverse
+    distance weighting of its n_neighbors nearest other stations, using a single
+    KD-tree query. The "griddata" estimator refits scipy's griddata with the
+    given method once per station, which is O(N² log N) and much slower.
+
     Args:
         station_coords: Array of [lon, lat] station coordinates
         values: Array of values at stations
-        method: Interpolation method
+        method: Interpolation method for the "griddata" estimator
+        estimator: Leave-one-out predictor, "idw" or "griddata"
+        n_neighbors: Number of neighbouring stations for the "idw" estimator
 
     Returns:
         Dictionary with validation metrics
     """
-    n_stations = len(station_coords)
-    predictions = np.full(n_stations, np.nan)
-
-    # Leave-one-out cross-validation
-    for i in range(n_stations):
-        # Remove one station
-        train_coords = np.delete(station_coords, i, axis=0)
-        train_values = np.delete(values, i)
-        test_coord = station_coords[i : i + 1]
-
-        # Skip if not enough training points
-        if len(train_coords) < 4:
-            continue
-
-        try:
-            # Interpolate to test point
-            pred = griddata(train_coords, train_values, test_coord, method=method)
-            predictions[i] = pred[0]
-        except Exception:
-            continue
+    if estimator == "idw":
+        predictions = _idw_leave_one_out(station_coords, values, n_neighbors)
+    elif estimator == "griddata":
+        predictions = _griddata_leave_one_out(station_coords, values, method)
+    else:
+        raise ValueError(f"Unknown validation estimator: {estimator}")
 
     # Calculate metrics for valid predictions
     valid_mask = ~np.isnan(predictions)
@@ -270,10 +299,79 @@ def validate_interpolation(
     }
 
 
+def _idw_leave_one_out(
+    station_coords: np.ndarray, values: np.ndarray, n_neighbors: int
+) -> np.ndarray:
+    """
+    Predict each station from its nearest other stations by inverse distance.
+
+    Args:
+        station_coords: Array of [lon, lat] station coordinates
+        values: Array of values at stations
+        n_neighbors: Number of neighbouring stations to weight
+
+    Returns:
+        Array of predictions (NaN when there are too few training stations)
+    """
+    n_stations = len(station_coords)
+
+    # Match the griddata path, which needs at least 4 training points
+    if n_stations - 1 < 4:
+        return np.full(n_stations, np.nan)
+
+    # Query one extra neighbour and drop each station itself; with duplicate
+    # coordinates the station is not necessarily the first neighbour returned
+    k = min(n_neighbors, n_stations - 1) + 1
+    distances, indices = cKDTree(station_coords).query(station_coords, k=k, workers=-1)
+    weights = 1.0 / np.maximum(distances, 1e-9) ** 2
+    weights[indices == np.arange(n_stations)[:, np.newaxis]] = 0.0
+
+    return (weights * values[indices]).sum(axis=1) / weights.sum(axis=1)
+
+
+def _griddata_leave_one_out(
+    station_coords: np.ndarray, values: np.ndarray, method: str
+) -> np.ndarray:
+    """
+    Predict each station by refitting griddata without it.
+
+    Args:
+        station_coords: Array of [lon, lat] station coordinates
+        values: Array of values at stations
+        method: Interpolation method
+
+    Returns:
+        Array of predictions (NaN where interpolation was not possible)
+    """
+    n_stations = len(station_coords)
+    predictions = np.full(n_stations, np.nan)
+
+    # Leave-one-out cross-validation
+    for i in range(n_stations):
+        # Remove one station
+        train_coords = np.delete(station_coords, i, axis=0)
+        train_values = np.delete(values, i)
+        test_coord = station_coords[i : i + 1]
+
+        # Skip if not enough training points
+        if len(train_coords) < 4:
+            continue
+
+        try:
+            # Interpolate to test point
+            pred = griddata(train_coords, train_values, test_coord, method=method)
+            predictions[i] = pred[0]
+        except Exception:
+            continue
+
+    return predictions
+
+
 def generate_coverage_report(
     station_coords: np.ndarray,
     confidence_mask: np.ndarray,
     validation_metrics: dict[str, Any],
+    validation_estimator: str = "idw",
 ) -> dict[str, Any]:
     """
     Generate comprehensive coverage and quality report.
@@ -282,6 +380,8 @@ def generate_coverage_report(
         station_coords: Array of station coordinates
         confidence_mask: Confidence mask from create_confidence_mask()
         validation_metrics: Validation results from validate_interpolation()
+        validation_estimator: Estimator passed to validate_interpolation(), so
+            the report states which predictor the metrics describe
 
     Returns:
         Comprehensive coverage report
@@ -316,7 +416,7 @@ def generate_coverage_report(
         "methodology": {
             "interpolation_method": "scipy.interpolate.griddata",
             "masking_approach": "distance_and_density_based",
-            "validation_method": "leave_one_out_cross_validation",
+            "validation_method": f"{validation_estimator}_leave_one_out",
         },
     }
 
@@ -600,11 +700,20 @@ def plot_enhanced_contour_map(
 
         # Generate validation and coverage report
         if show_coverage_report:
+            # Fast IDW leave-one-out; the report records that the metrics
+            # describe this estimator, not the griddata surface drawn on the map
+            validation_estimator = "idw"
             validation_metrics = validate_interpolation(
-                station_coords, values, interpolation_method
+                station_coords,
+                values,
+                interpolation_method,
+                estimator=validation_estimator,
             )
             coverage_report = generate_coverage_report(
-                station_coords, confidence_mask, validation_metrics
+                station_coords,
+                confidence_mask,
+                validation_metrics,
+                validation_estimator=validation_estimator,
             )
 
     # Create figure and axis
@@ -1672,7 +1781,8 @@ def create_summary_statistics(results_gdf: gpd.GeoDataFrame) -> dict:
     """
     stats = {
         "total_stations": len(results_gdf),
-        "stations_with_data": results_gdf.dropna().shape[0],
+        # Count complete rows without copying the frame through dropna()
+        "stations_with_data": int(results_gdf.notna().all(axis=1).sum()),
     }
 
     # Add statistics for each numeric column
@@ -8,7 +8,6 @@ import geopandas as gpd
 import numpy as np
 import pandas as pd
 from scipy.spatial.distance import cdist
-from shapely.geometry import Point
 
 
 class UrbanContextManager:
@@ -31,6 +30,9 @@ class UrbanContextManager:
 
         self.static_cities_path = Path(static_cities_path)
 
+        # Parsed static database, read on first use and shared by every loader
+        self._cities_df: pd.DataFrame | None = None
+
         # Define 4-level classification thresholds and population criteria
         self.classification_config = {
             "urban_core": {
@@ -61,13 +63,7 @@ class UrbanContextManager:
         Returns:
             GeoDataFrame with city points, names, and population
         """
-        if not self.static_cities_path.exists():
-            raise FileNotFoundError(
-                f"Static cities database not found: {self.static_cities_path}"
-            )
-
-        # Load static cities database
-        cities_df = pd.read_csv(self.static_cities_path)
+        cities_df = self._read_static_cities()
 
         # Filter by minimum population
         cities_df = cities_df[cities_df["population"] >= min_population].copy()
@@ -76,12 +72,26 @@ class UrbanContextManager:
             raise ValueError(f"No cities found with population >= {min_population:,}")
 
         # Create geometry from coordinates
-        geometry = [
-            Point(lon, lat)
-            for lon, lat in zip(cities_df["longitude"], cities_df["latitude"])
-        ]
+        geometry = gpd.points_from_xy(
+            cities_df["longitude"].to_numpy(), cities_df["latitude"].to_numpy()
+        )
         return gpd.GeoDataFrame(cities_df, geometry=geometry, crs="EPSG:4326")
 
+    def _read_static_cities(self) -> pd.DataFrame:
+        """
+        Read the static cities database, parsing the CSV only once per manager.
+
+        Returns:
+            DataFrame with all cities; callers must not modify it
+        """
+        if self._cities_df is None:
+            if not self.static_cities_path.exists():
+                raise FileNotFoundError(
+                    f"Static cities database not found: {self.static_cities_path}"
+                )
+            self._cities_df = pd.read_csv(self.static_cities_path)
+        return self._cities_df
+
     def load_urban_areas(self, min_population: int = 100000) -> gpd.GeoDataFrame:
         """
         Create simplified urban areas as buffers around major cities.
@@ -107,8 +117,8 @@ class UrbanContextManager:
         cities_proj = cities.to_crs("EPSG:5070")  # Albers Equal Area Conic
 
         # Create buffers (buffer_km converted to meters)
-        cities_proj["geometry"] = cities_proj.apply(
-            lambda row: row["geometry"].buffer(row["buffer_km"] * 1000), axis=1
+        cities_proj["geometry"] = cities_proj.geometry.buffer(
+            cities_proj["buffer_km"].to_numpy() * 1000
         )
 
         # Convert back to WGS84
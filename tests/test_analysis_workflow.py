@@ -1,11 +1,16 @@
 """Core analysis workflow integration tests."""
 
 import pytest
+import numpy as np
 import pandas as pd
 import geopandas as gpd
 
 from src.ushcn_heatisland.data.loaders import load_ushcn_data
 from src.ushcn_heatisland.analysis.anomaly import get_algorithm, list_algorithms
+from src.ushcn_heatisland.analysis.anomaly import adjustment_impact
+from src.ushcn_heatisland.analysis.anomaly.adjustment_impact import period_means
+from src.ushcn_heatisland.analysis.anomaly.runner import run_many
+from src.ushcn_heatisland.core.models import AnalysisConfig
 from src.ushcn_heatisland.urban.context import UrbanContextManager
 from src.ushcn_heatisland.analysis.heat_island import generate_heat_island_report
 
@@ -103,6 +108,100 @@ class TestAnalysisAlgorithms:
         for col in expected_columns:
             assert col in results.columns, f"Missing column: {col}"
 
+    def test_run_many_matches_direct_calls(self, data_dir, sample_baseline_period, sample_current_period):
+        """Test that batch execution returns the same results as direct calls."""
+        adjusted_data, raw_data = load_ushcn_data(
+            data_dir,
+            adjusted_type="fls52",
+            raw_type="raw",
+            load_raw=True,
+            temp_metric="min"
+        )
+        
+        configs = [
+            AnalysisConfig("simple", *sample_baseline_period, *sample_current_period),
+            AnalysisConfig("adjustment_impact", *sample_baseline_period, *sample_current_period),
+        ]
+        
+        batch_results = run_many(adjusted_data, raw_data, configs, max_workers=2)
+        
+        assert len(batch_results) == len(configs)
+        for config, batch_result in zip(configs, batch_results):
+            direct_result = get_algorithm(config.algorithm)(
+                gdf_adjusted=adjusted_data,
+                baseline_period=sample_baseline_period,
+                current_period=sample_current_period,
+                gdf_raw=raw_data
+            )
+            pd.testing.assert_frame_equal(
+                pd.DataFrame(batch_result.drop(columns="geometry")),
+                pd.DataFrame(direct_result.drop(columns="geometry")),
+            )
+            assert batch_result.geometry.geom_equals(direct_result.geometry).all()
+
+    def test_adjustment_impact_reflects_input_changes(self, data_dir, sample_baseline_period, sample_current_period):
+        """Test that adjustment impact is recomputed after the input data changes."""
+        adjusted_data, raw_data = load_ushcn_data(
+            data_dir,
+            adjusted_type="fls52",
+            raw_type="raw",
+            load_raw=True,
+            temp_metric="min"
+        )
+        adjusted_data = adjusted_data.copy()
+        algo_func = get_algorithm("adjustment_impact")
+        
+        before = algo_func(
+            gdf_adjusted=adjusted_data,
+            baseline_period=sample_baseline_period,
+            current_period=sample_current_period,
+            gdf_raw=raw_data
+        )
+        
+        # Warm the current period by 1°C in place and rerun on the same objects
+        in_current = adjusted_data["year"].between(*sample_current_period)
+        adjusted_data.loc[in_current, "temperature_celsius"] += 1.0
+        after = algo_func(
+            gdf_adjusted=adjusted_data,
+            baseline_period=sample_baseline_period,
+            current_period=sample_current_period,
+            gdf_raw=raw_data
+        )
+        
+        np.testing.assert_allclose(
+            after["adjustment_impact"].to_numpy(),
+            before["adjustment_impact"].to_numpy() + 1.0,
+            rtol=0,
+            atol=1e-4,
+        )
+
+    def test_adjustment_impact_reuses_baseline_means(self, data_dir, sample_baseline_period, sample_current_period):
+        """Test that precomputed baseline means give the same result."""
+        adjusted_data, raw_data = load_ushcn_data(
+            data_dir,
+            adjusted_type="fls52",
+            raw_type="raw",
+            load_raw=True,
+            temp_metric="min"
+        )
+        
+        baseline_means = period_means(adjusted_data, raw_data, sample_baseline_period)
+        direct = adjustment_impact.calculate(
+            adjusted_data, sample_baseline_period, sample_current_period, raw_data
+        )
+        reused = adjustment_impact.calculate(
+            adjusted_data,
+            sample_baseline_period,
+            sample_current_period,
+            raw_data,
+            baseline_means=baseline_means,
+        )
+        
+        pd.testing.assert_frame_equal(
+            pd.DataFrame(reused.drop(columns="geometry")),
+            pd.DataFrame(direct.drop(columns="geometry")),
+        )
+
 
 class TestUrbanHeatIslandAnalysis:
     """Test urban heat island analysis workflow."""
@@ -118,7 +217,12 @@ class TestUrbanHeatIslandAnalysis:
         )
         
         # Take sample
-        sample_data = adjusted_data.head(30)
+        sample = adjusted_data.head(30)
+        sample_data = gpd.GeoDataFrame(
+            sample,
+            geometry=gpd.points_from_xy(sample["lon"], sample["lat"]),
+            crs="EPSG:4326",
+        )
         
         # Initialize urban context
         manager = UrbanContextManager()
@@ -246,10 +350,10 @@ class TestDataIntegrity:
                 temp_metric="min"
             )
             
-            # Store coordinates for comparison (extract from geometry column)
-            coords = data[["station_id"]].copy()
-            coords["latitude"] = data.geometry.y
-            coords["longitude"] = data.geometry.x
+            # Store coordinates for comparison
+            coords = data[["station_id", "lat", "lon"]].rename(
+                columns={"lat": "latitude", "lon": "longitude"}
+            )
             coords = coords.drop_duplicates()
             coordinates[data_type] = coords.set_index("station_id")
         
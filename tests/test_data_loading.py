@@ -1,9 +1,11 @@
 """Data loading integration tests."""
 
 import pytest
+import numpy as np
 import pandas as pd
 import geopandas as gpd
 
+from src.ushcn_heatisland.analysis.anomaly import get_algorithm
 from src.ushcn_heatisland.data.loaders import load_ushcn_data
 from src.ushcn_heatisland.urban.context import UrbanContextManager
 
@@ -20,20 +22,66 @@ class TestDataLoading:
             temp_metric="min"
         )
         
-        assert isinstance(adjusted_data, gpd.GeoDataFrame)
+        assert isinstance(adjusted_data, pd.DataFrame)
         assert len(adjusted_data) > 0
         assert raw_data is None
         
         # Check required columns exist
-        required_columns = ["station_id", "timestamp", "temperature_celsius", "geometry"]
+        required_columns = ["station_id", "timestamp", "temperature_celsius", "lat", "lon"]
         for col in required_columns:
             assert col in adjusted_data.columns, f"Missing column: {col}"
         
-        # Check geometry contains coordinates
-        sample_point = adjusted_data.geometry.iloc[0]
-        assert hasattr(sample_point, 'x') and hasattr(sample_point, 'y')
-        assert -180 <= sample_point.x <= 180  # Valid longitude
-        assert -90 <= sample_point.y <= 90    # Valid latitude
+        # Check coordinates are valid
+        sample_row = adjusted_data.iloc[0]
+        assert -180 <= sample_row["lon"] <= 180  # Valid longitude
+        assert -90 <= sample_row["lat"] <= 90    # Valid latitude
+
+    def test_modifying_loaded_data_does_not_affect_later_loads(self, data_dir):
+        """Test that in-place changes to one load do not leak into the next."""
+        first, _ = load_ushcn_data(data_dir, adjusted_type="fls52", load_raw=False, temp_metric="min")
+        expected = first["temperature_celsius"].copy()
+        
+        # Modify values in place and add a column
+        first["temperature_celsius"] += 100.0
+        first.loc[first.index[:10], "lat"] = float("nan")
+        first["extra"] = 1
+        
+        second, _ = load_ushcn_data(data_dir, adjusted_type="fls52", load_raw=False, temp_metric="min")
+        
+        assert second is not first
+        assert "extra" not in second.columns
+        assert second["lat"].notna().all()
+        pd.testing.assert_series_equal(second["temperature_celsius"], expected)
+
+    def test_results_sorted_by_station_id_for_unsorted_files(self, tmp_path, sample_baseline_period, sample_current_period):
+        """Test that stations stored out of order still come back sorted by station_id."""
+        station_ids = ["USH00300000", "USH00100000", "USH00200000"]
+        dates = pd.date_range("1951-01-01", "2010-12-01", freq="MS").strftime("%Y-%m-%d")
+        rng = np.random.default_rng(0)
+        
+        # Station-major files, with the stations in non-lexical order
+        for data_type in ["raw", "fls52"]:
+            frame = pd.DataFrame({
+                "id": np.repeat(station_ids, len(dates)),
+                "date": np.tile(dates, len(station_ids)),
+                "lat": np.repeat([40.0, 35.0, 45.0], len(dates)),
+                "lon": np.repeat([-100.0, -90.0, -110.0], len(dates)),
+                f"min_{data_type}": rng.normal(5.0, 3.0, len(dates) * len(station_ids)),
+            })
+            frame.to_parquet(tmp_path / f"ushcn-monthly-{data_type}-2025-01-01.parquet", index=False)
+        
+        adjusted_data, raw_data = load_ushcn_data(tmp_path, adjusted_type="fls52", load_raw=True, temp_metric="min")
+        
+        for algorithm in ["simple", "min_obs", "adjustment_impact"]:
+            results = get_algorithm(algorithm)(
+                gdf_adjusted=adjusted_data,
+                gdf_raw=raw_data,
+                baseline_period=sample_baseline_period,
+                current_period=sample_current_period,
+                config={"min_observations": 20} if algorithm == "min_obs" else None,
+            )
+            
+            assert list(results["station_id"]) == sorted(station_ids), algorithm
 
     def test_load_ushcn_data_with_raw(self, data_dir):
         """Test loading both adjusted and raw data."""
@@ -45,8 +93,8 @@ class TestDataLoading:
             temp_metric="min"
         )
         
-        assert isinstance(adjusted_data, gpd.GeoDataFrame)
-        assert isinstance(raw_data, gpd.GeoDataFrame)
+        assert isinstance(adjusted_data, pd.DataFrame)
+        assert isinstance(raw_data, pd.DataFrame)
         assert len(adjusted_data) > 0
         assert len(raw_data) > 0
 
@@ -62,7 +110,7 @@ class TestDataLoading:
                 temp_metric="min"
             )
             
-            assert isinstance(adjusted_data, gpd.GeoDataFrame)
+            assert isinstance(adjusted_data, pd.DataFrame)
             assert len(adjusted_data) > 0, f"No data loaded for type: {data_type}"
 
     def test_load_different_temp_metrics(self, data_dir):
@@ -77,7 +125,7 @@ class TestDataLoading:
                 temp_metric=metric
             )
             
-            assert isinstance(adjusted_data, gpd.GeoDataFrame)
+            assert isinstance(adjusted_data, pd.DataFrame)
             assert len(adjusted_data) > 0, f"No data loaded for metric: {metric}"
 
 
@@ -129,7 +177,12 @@ class TestUrbanContextLoading:
         urban_areas_gdf = manager.load_urban_areas()
         
         # Classify stations (take small sample for speed)
-        sample_stations = stations_gdf.head(50)
+        sample = stations_gdf.head(50)
+        sample_stations = gpd.GeoDataFrame(
+            sample,
+            geometry=gpd.points_from_xy(sample["lon"], sample["lat"]),
+            crs="EPSG:4326",
+        )
         classified_stations = manager.classify_stations_urban_rural(
             sample_stations,
             cities_gdf=cities_gdf,
@@ -0,0 +1,509 @@
+"""Tests for the heat island statistics and their SciPy/NumPy parity."""
+
+import geopandas as gpd
+import numpy as np
+import pytest
+from scipy import stats
+from scipy.spatial import cKDTree
+from shapely.geometry import Point
+
+from src.ushcn_heatisland.analysis.heat_island import (
+    _binned_statistics,
+    _centered_sums,
+    _linear_regression,
+    _mann_whitney_u,
+    _moments,
+    _nearby_pairs,
+    _pearson,
+    _quantiles,
+    _sample_std,
+    _unit_vectors,
+    analyze_distance_gradients,
+    calculate_heat_island_intensity,
+    calculate_urban_rural_statistics,
+    generate_heat_island_report,
+)
+
+
+def make_results(classes, seed=0):
+    """Build a synthetic anomaly results frame with the given classifications."""
+    rng = np.random.default_rng(seed)
+    n = len(classes)
+    lons = rng.uniform(-120, -75, n)
+    lats = rng.uniform(30, 47, n)
+    return gpd.GeoDataFrame(
+        {
+            "anomaly_celsius": rng.normal(0.5, 0.8, n),
+            "urban_classification": classes,
+            "distance_to_nearest_city_km": rng.uniform(0, 200, n),
+        },
+        geometry=[Point(lon, lat) for lon, lat in zip(lons, lats)],
+        crs="EPSG:4326",
+    )
+
+
+@pytest.fixture
+def cities_gdf():
+    """Return a handful of synthetic cities."""
+    return gpd.GeoDataFrame(
+        {"name": ["A", "B", "C"], "population": [500000, 250000, 120000]},
+        geometry=[Point(-100, 40), Point(-85, 35), Point(-110, 44)],
+        crs="EPSG:4326",
+    )
+
+
+class TestCompareOnly:
+    """Test skipping the per-classification breakdown."""
+
+    def test_compare_only_keeps_comparison(self):
+        """Test that compare_only leaves the urban vs rural comparison unchanged."""
+        classes = ["urban_core", "urban", "suburban", "rural"] * 25
+        results = make_results(classes)
+
+        full = calculate_urban_rural_statistics(results)
+        compared = calculate_urban_rural_statistics(results, compare_only=True)
+
+        assert set(full["statistics_by_classification"]) == set(classes)
+        assert compared["statistics_by_classification"] == {}
+        assert (
+            compared["urban_vs_rural_comparison"] == full["urban_vs_rural_comparison"]
+        )
+        assert compared["total_stations_analyzed"] == full["total_stations_analyzed"]
+
+    def test_report_keeps_breakdown_without_rural_stations(self, cities_gdf):
+        """Test that the report writes the breakdown by default, even with no split."""
+        results = make_results(["urban_core", "urban", "suburban"] * 20)
+
+        report = generate_heat_island_report(results, {}, cities_gdf)
+
+        assert "analysis_error" not in report
+        urban_rural = report["urban_rural_analysis"]
+        assert set(urban_rural["statistics_by_classification"]) == {
+            "urban_core",
+            "urban",
+            "suburban",
+        }
+        assert urban_rural["statistics_by_classification"]["urban"]["count"] == 20
+        assert urban_rural["urban_vs_rural_comparison"] == {}
+        assert "distance_gradient_analysis" in report
+        assert "heat_island_summary" not in report
+
+    def test_report_compare_only(self, cities_gdf):
+        """Test that compare_only skips only the report's breakdown."""
+        results = make_results(["urban_core", "suburban", "rural"] * 20)
+
+        full = generate_heat_island_report(results, {}, cities_gdf)
+        report = generate_heat_island_report(results, {}, cities_gdf, compare_only=True)
+
+        assert "analysis_error" not in report
+        urban_rural = report["urban_rural_analysis"]
+        assert urban_rural["statistics_by_classification"] == {}
+        assert (
+            urban_rural["urban_vs_rural_comparison"]
+            == full["urban_rural_analysis"]["urban_vs_rural_comparison"]
+        )
+        assert report["heat_island_summary"] == full["heat_island_summary"]
+        assert "distance_gradient_analysis" in report
+
+    def test_report_keeps_full_analysis_with_split(self, cities_gdf):
+        """Test that the report still runs every analysis when a split exists."""
+        results = make_results(["urban_core", "suburban", "rural"] * 20)
+
+        report = generate_heat_island_report(results, {}, cities_gdf)
+
+        assert "analysis_error" not in report
+        urban_rural = report["urban_rural_analysis"]
+        assert set(urban_rural["statistics_by_classification"]) == {
+            "urban_core",
+            "suburban",
+            "rural",
+        }
+        assert "urban_heat_island_intensity" in urban_rural["urban_vs_rural_comparison"]
+        assert "distance_gradient_analysis" in report
+        assert "heat_island_summary" in report
+
+    def test_report_missing_classification_reports_error(self):
+        """Test that a missing classification column is still reported."""
+        results = make_results(["rural"] * 10).drop(columns="urban_classification")
+
+        report = generate_heat_island_report(results, {})
+
+        assert "not found" in report["analysis_error"]
+
+
+class TestMoments:
+    """Test the count/mean/std kernel against NumPy."""
+
+    @pytest.mark.parametrize("offset", [0.0, 1e4, 1e8])
+    def test_matches_numpy_with_large_offset(self, offset):
+        """Test that a large common offset does not lose the variance."""
+        rng = np.random.default_rng(1)
+        values = offset + rng.normal(0.0, 0.1, 500)
+
+        n, mean, std = _moments(values, ddof=1)
+
+        assert n == 500
+        assert mean == pytest.approx(np.mean(values), rel=1e-12)
+        assert std == pytest.approx(np.std(values, ddof=1), rel=1e-6)
+
+    def test_masked_matches_numpy(self):
+        """Test that the masked reduction matches NumPy on the unmasked values."""
+        rng = np.random.default_rng(2)
+        values = 1e6 + rng.normal(0.0, 2.0, 300)
+        values[::7] = np.nan
+        where = ~np.isnan(values)
+
+        n, mean, std = _moments(values, where=where)
+
+        assert n == int(where.sum())
+        assert mean == pytest.approx(np.nanmean(values), rel=1e-12)
+        assert std == pytest.approx(np.nanstd(values), rel=1e-6)
+        assert _sample_std(std, n) == pytest.approx(np.nanstd(values, ddof=1), rel=1e-6)
+
+    def test_constant_values(self):
+        """Test that constant values have exactly zero spread."""
+        n, mean, std = _moments(np.full(50, 273.15), ddof=1)
+
+        assert (n, mean, std) == (50, pytest.approx(273.15), 0.0)
+
+    def test_too_few_values(self):
+        """Test that the std is NaN when count <= ddof."""
+        _, mean, std = _moments(np.array([4.0]), ddof=1)
+
+        assert mean == 4.0
+        assert np.isnan(std)
+
+    def test_heat_island_intensity_matches_ttest(self):
+        """Test that the moment-based t-test matches scipy with a large offset."""
+        rng = np.random.default_rng(3)
+        urban = 1e5 + rng.normal(1.0, 0.5, 40)
+        rural = 1e5 + rng.normal(0.0, 0.5, 60)
+        expected = stats.ttest_ind(urban, rural)
+
+        result = calculate_heat_island_intensity(urban, rural)
+
+        assert result["t_statistic"] == pytest.approx(expected.statistic, rel=1e-6)
+        assert result["p_value"] == pytest.approx(expected.pvalue, rel=1e-6)
+
+
+class TestMannWhitneyU:
+    """Test the one-sort Mann-Whitney U test against scipy."""
+
+    @pytest.mark.parametrize(
+        ("n1", "n2", "shift", "decimals"),
+        [
+            (25, 40, 0.0, None),
+            (200, 150, 0.3, None),
+            (60, 80, 0.2, 1),  # Rounded values produce many ties
+            (30, 30, 5.0, None),  # Fully separated samples
+        ],
+    )
+    def test_matches_scipy_asymptotic(self, n1, n2, shift, decimals):
+        """Test the large-sample path against scipy's asymptotic method."""
+        rng = np.random.default_rng(n1 + n2)
+        x = rng.normal(shift, 1.0, n1)
+        y = rng.normal(0.0, 1.0, n2)
+        if decimals is not None:
+            x, y = np.round(x, decimals), np.round(y, decimals)
+        expected = stats.mannwhitneyu(
+            x, y, alternative="two-sided", method="asymptotic"
+        )
+
+        u_stat, p_value = _mann_whitney_u(x, y)
+
+        assert u_stat == pytest.approx(expected.statistic)
+        assert p_value == pytest.approx(expected.pvalue, rel=1e-9, abs=1e-300)
+
+    def test_small_samples_defer_to_scipy(self):
+        """Test that samples under 20 values use scipy's default method."""
+        rng = np.random.default_rng(5)
+        x = rng.normal(0.5, 1.0, 12)
+        y = rng.normal(0.0, 1.0, 30)
+        expected = stats.mannwhitneyu(x, y, alternative="two-sided")
+
+        assert _mann_whitney_u(x, y) == (
+            pytest.approx(expected.statistic),
+            pytest.approx(expected.pvalue),
+        )
+
+
+class TestQuantiles:
+    """Test the partition-based quantiles against np.quantile."""
+
+    @pytest.mark.parametrize("n", [1, 2, 3, 10, 101, 1000])
+    def test_matches_numpy(self, n):
+        """Test median and quartiles against NumPy's linear interpolation."""
+        rng = np.random.default_rng(n)
+        values = rng.normal(0.0, 1.0, n)
+        quantiles = (0.5, 0.25, 0.75)
+
+        result = _quantiles(values.copy(), quantiles)
+
+        np.testing.assert_allclose(result, np.quantile(values, quantiles), rtol=1e-12)
+
+    def test_extremes_and_ties(self):
+        """Test the 0 and 1 quantiles and heavily tied values."""
+        values = np.repeat([3.0, 1.0, 2.0], [5, 7, 3])
+        quantiles = (0.0, 0.1, 0.5, 0.9, 1.0)
+
+        result = _quantiles(values, quantiles)
+
+        np.testing.assert_allclose(result, np.quantile(values, quantiles))
+
+    def test_float32_input(self):
+        """Test that float32 values match NumPy on the same input."""
+        values = np.random.default_rng(7).normal(0.0, 1.0, 99).astype(np.float32)
+        quantiles = (0.5, 0.25, 0.75)
+
+        result = _quantiles(values, quantiles)
+
+        np.testing.assert_allclose(result, np.quantile(values, quantiles), rtol=1e-6)
+
+
+class TestBinnedStatistics:
+    """Test the vectorized distance-bin statistics against per-bin NumPy."""
+
+    def test_matches_per_bin_masks(self):
+        """Test count, mean, median and sample std against masked NumPy."""
+        rng = np.random.default_rng(11)
+        distances = rng.uniform(0, 200, 500)
+        distances[:5] = [0.0, 20.0, 199.999, 200.0, 250.0]  # Edges and out of range
+        anomalies = rng.normal(0.5, 1.0, 500)
+        bin_edges = np.linspace(0, 200, 11)
+
+        counts, means, medians, stds = _binned_statistics(
+            distances, anomalies, bin_edges
+        )
+
+        for i in range(len(bin_edges) - 1):
+            in_bin = (distances >= bin_edges[i]) & (distances < bin_edges[i + 1])
+            assert counts[i] == in_bin.sum()
+            assert means[i] == pytest.approx(anomalies[in_bin].mean())
+            assert medians[i] == pytest.approx(np.median(anomalies[in_bin]))
+            assert stds[i] == pytest.approx(np.std(anomalies[in_bin], ddof=1))
+
+        # Values on the last edge and beyond fall outside every bin
+        assert counts.sum() == (distances < 200).sum()
+
+    def test_empty_and_single_value_bins(self):
+        """Test that empty bins are NaN and single-value bins have NaN std."""
+        distances = np.array([5.0, 25.0, 26.0, 27.0, 28.0])
+        anomalies = np.array([1.5, 4.0, 1.0, 3.0, 2.0])
+        bin_edges = np.array([0.0, 10.0, 20.0, 30.0])
+
+        counts, means, medians, stds = _binned_statistics(
+            distances, anomalies, bin_edges
+        )
+
+        np.testing.assert_array_equal(counts, [1, 0, 4])
+        np.testing.assert_allclose(means, [1.5, np.nan, 2.5])
+        np.testing.assert_allclose(medians, [1.5, np.nan, 2.5])
+        np.testing.assert_allclose(
+            stds, [np.nan, np.nan, np.std([4.0, 1.0, 3.0, 2.0], ddof=1)]
+        )
+
+
+@pytest.fixture
+def paired_samples():
+    """Return distance/anomaly pairs with a weak negative trend."""
+    rng = np.random.default_rng(13)
+    x = rng.uniform(0, 200, 250)
+    y = 1.0 - 0.004 * x + rng.normal(0.0, 0.6, 250)
+    return x, y
+
+
+class TestPearson:
+    """Test the closed-form Pearson correlation against scipy.stats.pearsonr."""
+
+    @pytest.mark.parametrize("n", [3, 10, 250])
+    def test_matches_scipy(self, paired_samples, n):
+        """Test the coefficient and p-value against pearsonr."""
+        x, y = (values[:n] for values in paired_samples)
+        expected = stats.pearsonr(x, y)
+
+        r, p_value = _pearson(_centered_sums(x, y))
+
+        assert r == pytest.approx(expected.statistic, rel=1e-12)
+        assert p_value == pytest.approx(expected.pvalue, rel=1e-9)
+
+    def test_two_points(self):
+        """Test that two points are perfectly correlated with p-value 1."""
+        assert _pearson(_centered_sums(np.array([1.0, 2.0]), np.array([5.0, 3.0]))) == (
+            -1.0,
+            1.0,
+        )
+
+    def test_constant_input(self):
+        """Test that constant input gives NaN, as pearsonr does."""
+        r, p_value = _pearson(_centered_sums(np.arange(5.0), np.full(5, 2.0)))
+
+        assert np.isnan(r) and np.isnan(p_value)
+
+    def test_too_short(self):
+        """Test that fewer than two pairs are rejected."""
+        with pytest.raises(ValueError, match="at least 2"):
+            _pearson(_centered_sums(np.array([1.0]), np.array([2.0])))
+
+
+class TestLinearRegression:
+    """Test the centered-sums regression against scipy.stats.linregress."""
+
+    @pytest.mark.parametrize("n", [3, 10, 250])
+    def test_matches_scipy(self, paired_samples, n):
+        """Test every returned value against linregress."""
+        x, y = (values[:n] for values in paired_samples)
+        expected = stats.linregress(x, y)
+
+        result = _linear_regression(_centered_sums(x, y))
+
+        np.testing.assert_allclose(
+            result,
+            (
+                expected.slope,
+                expected.intercept,
+                expected.rvalue,
+                expected.pvalue,
+                expected.stderr,
+            ),
+            rtol=1e-9,
+        )
+
+    def test_float32_input(self, paired_samples):
+        """Test that float32 input is accumulated in float64."""
+        x, y = (values.astype(np.float32) for values in paired_samples)
+        expected = stats.linregress(x.astype(np.float64), y.astype(np.float64))
+
+        slope, intercept, *_ = _linear_regression(_centered_sums(x, y))
+
+        assert slope == pytest.approx(expected.slope, rel=1e-9)
+        assert intercept == pytest.approx(expected.intercept, rel=1e-9)
+
+    def test_exact_fit(self):
+        """Test a perfect line, where linregress guards the t statistic."""
+        x = np.arange(10.0)
+        expected = stats.linregress(x, 2 * x + 1)
+
+        slope, intercept, r, p_value, std_err = _linear_regression(
+            _centered_sums(x, 2 * x + 1)
+        )
+
+        assert (slope, intercept, r) == pytest.approx((2.0, 1.0, 1.0))
+        assert p_value == pytest.approx(expected.pvalue, abs=1e-12)
+        assert std_err == pytest.approx(0.0, abs=1e-12)
+
+    def test_identical_x(self):
+        """Test that identical x values are rejected, as linregress does."""
+        with pytest.raises(ValueError, match="all x values are identical"):
+            _linear_regression(_centered_sums(np.full(5, 3.0), np.arange(5.0)))
+
+
+def haversine_km(lon1, lat1, lon2, lat2):
+    """Brute-force great-circle distances (km) with broadcasting."""
+    lon1, lat1, lon2, lat2 = map(np.radians, (lon1, lat1, lon2, lat2))
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * 6371.0 * np.arcsin(np.sqrt(a))
+
+
+class TestNearbyPairs:
+    """Test the KD-tree station/city pairing against brute-force haversine."""
+
+    @pytest.mark.parametrize("max_distance", [50.0, 200.0, 1000.0])
+    def test_matches_brute_force(self, max_distance):
+        """Test that the pairs and distances match an all-pairs haversine."""
+        rng = np.random.default_rng(17)
+        station_lon, station_lat = rng.uniform(-125, -67, 400), rng.uniform(25, 49, 400)
+        city_lon, city_lat = rng.uniform(-125, -67, 30), rng.uniform(25, 49, 30)
+        tree = cKDTree(_unit_vectors(station_lon, station_lat))
+
+        city_idx, station_idx, distances = _nearby_pairs(
+            tree, _unit_vectors(city_lon, city_lat), max_distance
+        )
+
+        all_distances = haversine_km(
+            city_lon[:, None], city_lat[:, None], station_lon, station_lat
+        )
+        expected_city, expected_station = np.nonzero(all_distances <= max_distance)
+        np.testing.assert_array_equal(city_idx, expected_city)
+        np.testing.assert_array_equal(station_idx, expected_station)
+        np.testing.assert_allclose(
+            distances, all_distances[expected_city, expected_station], atol=1e-6
+        )
+
+    def test_boundary_pairs_kept(self):
+        """Test that a station just inside the radius is not dropped."""
+        station_lat = np.array([0.0, 0.0])
+        station_lon = np.array([0.0, 0.0])
+        # Cities due north at just under and just over 100 km
+        degrees_per_km = 180 / (np.pi * 6371.0)
+        city_lat = np.array([100 - 1e-6, 100 + 1e-3]) * degrees_per_km
+        tree = cKDTree(_unit_vectors(station_lon, station_lat))
+
+        city_idx, station_idx, distances = _nearby_pairs(
+            tree, _unit_vectors(np.zeros(2), city_lat), 100.0
+        )
+
+        np.testing.assert_array_equal(city_idx, [0, 0])
+        np.testing.assert_array_equal(station_idx, [0, 1])
+        assert np.all(distances <= 100.0)
+
+    def test_no_pairs(self):
+        """Test that a city far from every station yields empty arrays."""
+        tree = cKDTree(_unit_vectors(np.array([-100.0]), np.array([40.0])))
+
+        city_idx, station_idx, distances = _nearby_pairs(
+            tree, _unit_vectors(np.array([-70.0]), np.array([40.0])), 100.0
+        )
+
+        assert len(city_idx) == len(station_idx) == len(distances) == 0
+        assert station_idx.dtype == np.intp
+
+
+class TestCitySizeAnalysis:
+    """Test the city-size gradient analysis against a brute-force version."""
+
+    def test_matches_brute_force(self):
+        """Test counts and correlations against all-pairs haversine and pearsonr."""
+        rng = np.random.default_rng(19)
+        results = make_results(["rural"] * 300, seed=19)
+        n_cities = 40
+        city_lon = rng.uniform(-120, -75, n_cities)
+        city_lat = rng.uniform(30, 47, n_cities)
+        populations = rng.integers(50_000, 5_000_000, n_cities).astype(float)
+        cities = gpd.GeoDataFrame(
+            {"population": populations},
+            geometry=[Point(lon, lat) for lon, lat in zip(city_lon, city_lat)],
+            crs="EPSG:4326",
+        )
+
+        analysis = analyze_distance_gradients(results, cities)["city_size_analysis"]
+
+        anomalies = results["anomaly_celsius"].to_numpy()
+        pair_distances = haversine_km(
+            city_lon[:, None],
+            city_lat[:, None],
+            results.geometry.x.to_numpy(),
+            results.geometry.y.to_numpy(),
+        )
+        large, medium = np.quantile(populations, [0.75, 0.25])
+        size_masks = {
+            "large_cities": populations >= large,
+            "medium_cities": (populations >= medium) & (populations < large),
+        }
+        for key, city_mask in size_masks.items():
+            city_idx, station_idx = np.nonzero(pair_distances[city_mask] <= 200.0)
+            expected = stats.pearsonr(
+                pair_distances[city_mask][city_idx, station_idx],
+                anomalies[station_idx],
+            )
+
+            assert analysis[key]["count_cities"] == city_mask.sum()
+            assert analysis[key]["stations_analyzed"] == len(station_idx)
+            assert analysis[key]["correlation_coefficient"] == pytest.approx(
+                expected.statistic, rel=1e-9
+            )
+            assert analysis[key]["correlation_p_value"] == pytest.approx(
+                expected.pvalue, rel=1e-6
+            )
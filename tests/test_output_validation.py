@@ -375,11 +375,11 @@ class TestDataOutputConsistency:
             station_id = result_row["station_id"]
             input_row = sample_data[sample_data["station_id"] == station_id].iloc[0]
             
-            # Extract coordinates from geometry column
+            # Compare result geometry with input coordinates
             result_lat = result_row["geometry"].y
             result_lon = result_row["geometry"].x
-            input_lat = input_row["geometry"].y
-            input_lon = input_row["geometry"].x
+            input_lat = input_row["lat"]
+            input_lon = input_row["lon"]
             
             # Coordinates should match exactly
             assert abs(result_lat - input_lat) < 1e-6
@@ -0,0 +1,230 @@
+"""Parity tests for the spatial kernels behind contour maps and coverage reports."""
+
+import numpy as np
+import pytest
+from scipy.spatial.distance import cdist
+
+from src.ushcn_heatisland.plotting import (
+    analyze_station_coverage,
+    create_confidence_mask,
+    generate_coverage_report,
+    validate_interpolation,
+)
+
+
+@pytest.fixture
+def jittered_grid():
+    """Return station coordinates on a jittered 12x12 grid and a smooth field."""
+    rng = np.random.default_rng(42)
+    lons, lats = np.meshgrid(np.linspace(-110, -90, 12), np.linspace(30, 45, 12))
+    coords = np.column_stack([lons.ravel(), lats.ravel()])
+    coords += rng.uniform(-0.3, 0.3, coords.shape)
+    values = 0.2 * coords[:, 0] + 0.5 * coords[:, 1]
+    return coords, values
+
+
+class TestValidateInterpolation:
+    """Test the leave-one-out interpolation validation."""
+
+    def test_idw_matches_griddata_on_smooth_field(self, jittered_grid):
+        """Test that IDW and griddata validation agree on a smooth field."""
+        coords, values = jittered_grid
+
+        idw = validate_interpolation(coords, values, "linear", estimator="idw")
+        grid = validate_interpolation(coords, values, "linear", estimator="griddata")
+
+        # griddata is exact for a linear field inside the hull; IDW smooths it but
+        # stays close to the station spacing scale
+        assert grid["rmse"] < 1e-6
+        assert idw["rmse"] < 1.0
+        assert idw["correlation"] > 0.99
+        assert grid["correlation"] > 0.99
+
+        # IDW predicts every station, griddata only those inside the hull
+        assert idw["n_validated"] == len(values)
+        assert grid["n_validated"] <= idw["n_validated"]
+
+    def test_idw_is_exact_for_constant_field(self, jittered_grid):
+        """Test that IDW reproduces a constant field exactly."""
+        coords, _ = jittered_grid
+        values = np.full(len(coords), 3.5)
+
+        metrics = validate_interpolation(coords, values, estimator="idw")
+
+        assert metrics["rmse"] == pytest.approx(0.0, abs=1e-12)
+        assert metrics["bias"] == pytest.approx(0.0, abs=1e-12)
+
+    def test_idw_excludes_held_out_duplicate(self):
+        """Test that a station never predicts itself, even with duplicate coordinates."""
+        rng = np.random.default_rng(0)
+        coords = rng.uniform(0, 10, (20, 2))
+        coords = np.vstack([coords, coords[:1]])
+        values = rng.normal(size=len(coords))
+
+        metrics = validate_interpolation(coords, values, estimator="idw")
+
+        # A perfect score would mean the held-out value leaked into its prediction
+        assert metrics["rmse"] > 0
+
+    def test_too_few_stations(self):
+        """Test that both estimators report insufficient data for tiny networks."""
+        coords = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+        values = np.arange(4.0)
+
+        for estimator in ("idw", "griddata"):
+            metrics = validate_interpolation(coords, values, estimator=estimator)
+            assert "error" in metrics
+
+    def test_unknown_estimator(self, jittered_grid):
+        """Test that an unknown estimator is rejected."""
+        coords, values = jittered_grid
+
+        with pytest.raises(ValueError, match="Unknown validation estimator"):
+            validate_interpolation(coords, values, estimator="kriging")
+
+
+class TestCoverageReport:
+    """Test the coverage report methodology block."""
+
+    @pytest.mark.parametrize("estimator", ["idw", "griddata"])
+    def test_records_validation_estimator(self, jittered_grid, estimator):
+        """Test that the report names the estimator behind its metrics."""
+        coords, values = jittered_grid
+        metrics = validate_interpolation(coords, values, "linear", estimator=estimator)
+        mask = np.full((5, 5), 3, dtype=np.int8)
+
+        report = generate_coverage_report(
+            coords, mask, metrics, validation_estimator=estimator
+        )
+
+        assert (
+            report["methodology"]["validation_method"] == f"{estimator}_leave_one_out"
+        )
+        assert report["validation_metrics"] is metrics
+
+
+def haversine_matrix_km(points, stations):
+    """Brute-force great-circle distance matrix (km) between [lon, lat] arrays."""
+    lon1, lat1 = np.radians(points[:, :1]), np.radians(points[:, 1:])
+    lon2, lat2 = np.radians(stations[:, 0]), np.radians(stations[:, 1])
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * 6371.0 * np.arcsin(np.sqrt(a))
+
+
+def distance_matrix_mask(
+    grid_lats,
+    grid_lons,
+    station_coords,
+    max_distance_km=100.0,
+    min_station_count=2,
+    confidence_radius_km=100.0,
+):
+    """Reference confidence mask from a full grid x station distance matrix."""
+    grid_points = np.column_stack([grid_lons.ravel(), grid_lats.ravel()])
+    distances_km = haversine_matrix_km(grid_points, station_coords)
+    nearest_distances = distances_km.min(axis=1)
+    station_counts = (distances_km <= confidence_radius_km).sum(axis=1)
+
+    valid_distance = nearest_distances <= max_distance_km
+    enough_stations = station_counts >= min_station_count
+    high_conf = valid_distance & (station_counts >= 3) & (nearest_distances <= 50)
+
+    confidence = np.zeros(len(grid_points), dtype=int)
+    confidence[valid_distance & enough_stations & ~high_conf] = 2
+    confidence[valid_distance & ~enough_stations] = 1
+    confidence[high_conf] = 3
+    return confidence.reshape(grid_lats.shape)
+
+
+@pytest.fixture
+def conus_grid():
+    """Return a 0.25 degree CONUS grid and randomly placed stations."""
+    rng = np.random.default_rng(2)
+    stations = np.column_stack([rng.uniform(-125, -66, 400), rng.uniform(24, 50, 400)])
+    grid_lons, grid_lats = np.meshgrid(
+        np.arange(-125, -66, 0.25), np.arange(24, 50, 0.25)
+    )
+    return grid_lats, grid_lons, stations
+
+
+class TestConfidenceMask:
+    """Test the KD-tree confidence mask against a distance-matrix reference."""
+
+    def test_matches_distance_matrix(self, conus_grid):
+        """Test the default thresholds on a CONUS grid."""
+        grid_lats, grid_lons, stations = conus_grid
+
+        mask = create_confidence_mask(grid_lats, grid_lons, stations)
+
+        assert mask.shape == grid_lats.shape
+        np.testing.assert_array_equal(
+            mask, distance_matrix_mask(grid_lats, grid_lons, stations)
+        )
+        # Every confidence level occurs, so each branch is compared
+        assert set(np.unique(mask)) == {0, 1, 2, 3}
+
+    def test_matches_distance_matrix_custom_thresholds(self, conus_grid):
+        """Test non-default distance, count and radius thresholds."""
+        grid_lats, grid_lons, stations = conus_grid
+        kwargs = {
+            "max_distance_km": 300.0,
+            "min_station_count": 3,
+            "confidence_radius_km": 250.0,
+        }
+
+        mask = create_confidence_mask(grid_lats, grid_lons, stations[:50], **kwargs)
+
+        np.testing.assert_array_equal(
+            mask, distance_matrix_mask(grid_lats, grid_lons, stations[:50], **kwargs)
+        )
+
+    def test_single_station(self):
+        """Test a tiny grid around a single station."""
+        grid_lons, grid_lats = np.meshgrid(
+            np.linspace(-101, -99, 5), np.linspace(39, 41, 5)
+        )
+        stations = np.array([[-100.0, 40.0]])
+
+        mask = create_confidence_mask(grid_lats, grid_lons, stations)
+
+        np.testing.assert_array_equal(
+            mask, distance_matrix_mask(grid_lats, grid_lons, stations)
+        )
+        # One station is never enough for medium or high confidence
+        assert set(np.unique(mask)) <= {0, 1}
+
+    def test_distances_follow_great_circles(self):
+        """Test that longitude spacing shrinks with latitude, unlike 111 km/degree."""
+        # 1.5 degrees of longitude is about 83 km at 60N but 167 km on the equator
+        stations = np.array([[0.0, 60.0], [0.0, 0.0]])
+        grid_lons = np.array([[1.5, 1.5]])
+        grid_lats = np.array([[60.0, 0.0]])
+
+        mask = create_confidence_mask(grid_lats, grid_lons, stations)
+
+        np.testing.assert_array_equal(mask, [[1, 0]])
+
+
+class TestStationCoverage:
+    """Test the KD-tree nearest-station distances against a distance matrix."""
+
+    def test_matches_distance_matrix(self, conus_grid):
+        """Test the nearest-neighbour summary against cdist."""
+        _, _, stations = conus_grid
+        stations = np.vstack([stations, stations[:1]])  # One duplicate station
+        distances = cdist(stations, stations)
+        np.fill_diagonal(distances, np.inf)
+        nearest_km = distances.min(axis=1) * 111
+
+        coverage = analyze_station_coverage(stations)
+
+        assert coverage["total_stations"] == len(stations)
+        assert coverage["min_nearest_distance_km"] == 0.0
+        assert coverage["mean_nearest_distance_km"] == pytest.approx(nearest_km.mean())
+        assert coverage["median_nearest_distance_km"] == pytest.approx(
+            np.median(nearest_km)
+        )
+        assert coverage["max_nearest_distance_km"] == pytest.approx(nearest_km.max())